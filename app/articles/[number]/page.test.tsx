@@ -0,0 +1,86 @@
+/**
+ * 記事ページ（静的生成）のテスト
+ */
+
+import { render, screen } from '@testing-library/react';
+import ArticlePage, { generateStaticParams, dynamicParams } from './page';
+import { loadArticleIndex, getPublishedArticle } from '@/lib/publishedArticles';
+import { Article } from '@/types';
+
+// 公開データの読み込みをモック
+jest.mock('@/lib/publishedArticles');
+
+jest.mock('next/navigation', () => ({
+  notFound: jest.fn(() => {
+    throw new Error('NEXT_NOT_FOUND');
+  })
+}));
+
+const mockArticles: Article[] = [
+  {
+    id: 'article-1',
+    title: 'マインドセット記事1',
+    content: '本文1',
+    category: 'マインドセット',
+    date: '2023-01-01',
+    originalDate: '2023-01-01',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: ['テスト'],
+    number: 1
+  },
+  {
+    id: 'article-2',
+    title: '習慣形成記事1',
+    content: '本文2',
+    category: '習慣形成',
+    date: '2023-01-02',
+    originalDate: '2023-01-02',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: ['テスト'],
+    number: 2
+  }
+];
+
+describe('ArticlePage', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+
+    (loadArticleIndex as jest.Mock).mockResolvedValue({
+      categories: ['マインドセット', '習慣形成'],
+      articles: mockArticles.map(a => ({ number: a.number, id: a.id, category: a.category }))
+    });
+    (getPublishedArticle as jest.Mock).mockImplementation((number: number) =>
+      Promise.resolve(mockArticles.find(a => a.number === number) ?? null)
+    );
+  });
+
+  it('索引の通し番号ごとにページを生成する', async () => {
+    const params = await generateStaticParams();
+
+    expect(params).toEqual([{ number: '1' }, { number: '2' }]);
+    expect(dynamicParams).toBe(false);
+  });
+
+  it('記事の本文がHTMLに含まれる', async () => {
+    render(await ArticlePage({ params: { number: '1' } }));
+
+    expect(screen.getByText('マインドセット記事1')).toBeInTheDocument();
+    expect(screen.getByText('本文1')).toBeInTheDocument();
+    expect(screen.getByText('#1')).toBeInTheDocument();
+  });
+
+  it('前後の記事・カテゴリー一覧へのリンクが表示される', async () => {
+    render(await ArticlePage({ params: { number: '1' } }));
+
+    expect(screen.getByText('#2 →').closest('a')).toHaveAttribute('href', '/articles/2');
+    expect(screen.queryByText(/^←/)).not.toBeInTheDocument();
+    expect(screen.getByText('マインドセットの記事一覧').closest('a')).toHaveAttribute(
+      'href',
+      `/categories/${encodeURIComponent('マインドセット')}`
+    );
+  });
+
+  it('存在しない通し番号は404になる', async () => {
+    await expect(ArticlePage({ params: { number: '99' } })).rejects.toThrow('NEXT_NOT_FOUND');
+  });
+});
@@ -0,0 +1,76 @@
+/**
+ * 記事ページ（ビルド時に静的生成）
+ * public/article-index.json の通し番号ごとにHTMLを生成し、記事JSONを読み込まずに本文を表示
+ */
+
+import React from 'react';
+import Link from 'next/link';
+import { notFound } from 'next/navigation';
+import type { Metadata } from 'next';
+import ArticleCard from '@/components/ArticleCard';
+import { loadArticleIndex, getPublishedArticle } from '@/lib/publishedArticles';
+
+interface ArticlePageProps {
+  params: { number: string };
+}
+
+// 索引にない通し番号は404（実行時に生成しない）
+export const dynamicParams = false;
+
+export async function generateStaticParams() {
+  const index = await loadArticleIndex();
+  return index.articles.map(entry => ({ number: String(entry.number) }));
+}
+
+export async function generateMetadata({ params }: ArticlePageProps): Promise<Metadata> {
+  const article = await getPublishedArticle(Number(params.number));
+  return article ? { title: `${article.title} | 中心軸を整える` } : {};
+}
+
+export default async function ArticlePage({ params }: ArticlePageProps) {
+  const number = Number(params.number);
+  const article = await getPublishedArticle(number);
+
+  if (!article) {
+    notFound();
+  }
+
+  const [previous, next] = await Promise.all([
+    getPublishedArticle(number - 1),
+    getPublishedArticle(number + 1)
+  ]);
+
+  return (
+    <div className="container mx-auto px-4 py-8">
+      <div className="max-w-3xl mx-auto">
+        <ArticleCard article={article} variant="full" showNumber={true} />
+
+        {/* 前後の記事 */}
+        <nav className="flex justify-between mt-6 text-sm">
+          {previous ? (
+            <Link href={`/articles/${previous.number}`} className="text-blue-600 hover:underline">
+              ← #{previous.number}
+            </Link>
+          ) : <span />}
+          {next ? (
+            <Link href={`/articles/${next.number}`} className="text-blue-600 hover:underline">
+              #{next.number} →
+            </Link>
+          ) : <span />}
+        </nav>
+
+        <div className="flex justify-center gap-6 mt-8 text-sm">
+          <Link
+            href={`/categories/${encodeURIComponent(article.category)}`}
+            className="text-blue-600 hover:underline"
+          >
+            {article.category}の記事一覧
+          </Link>
+          <Link href="/" className="text-blue-600 hover:underline">
+            ホームへ
+          </Link>
+        </div>
+      </div>
+    </div>
+  );
+}
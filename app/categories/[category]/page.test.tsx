@@ -0,0 +1,89 @@
+/**
+ * カテゴリー別記事一覧ページ（静的生成）のテスト
+ */
+
+import { render, screen } from '@testing-library/react';
+import CategoryPage, { generateStaticParams, dynamicParams } from './page';
+import { loadArticleIndex, getPublishedArticlesByCategory } from '@/lib/publishedArticles';
+import { Article } from '@/types';
+
+// 公開データの読み込みをモック（decodeCategoryParam は実装を使う）
+jest.mock('@/lib/publishedArticles', () => ({
+  ...jest.requireActual('@/lib/publishedArticles'),
+  loadArticleIndex: jest.fn(),
+  getPublishedArticlesByCategory: jest.fn()
+}));
+
+jest.mock('next/navigation', () => ({
+  notFound: jest.fn(() => {
+    throw new Error('NEXT_NOT_FOUND');
+  })
+}));
+
+const mockArticles: Article[] = [
+  {
+    id: 'article-1',
+    title: 'マインドセット記事1',
+    content: '本文1',
+    category: 'マインドセット',
+    date: '2023-01-01',
+    originalDate: '2023-01-01',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: [],
+    number: 1
+  },
+  {
+    id: 'article-3',
+    title: 'マインドセット記事2',
+    content: '本文3',
+    category: 'マインドセット',
+    date: '2023-01-03',
+    originalDate: '2023-01-03',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: [],
+    number: 3
+  }
+];
+
+describe('CategoryPage', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+
+    (loadArticleIndex as jest.Mock).mockResolvedValue({
+      categories: ['マインドセット', '習慣形成'],
+      articles: []
+    });
+    (getPublishedArticlesByCategory as jest.Mock).mockImplementation((category: string) =>
+      Promise.resolve(mockArticles.filter(a => a.category === category))
+    );
+  });
+
+  it('索引のカテゴリーごとにページを生成する', async () => {
+    const params = await generateStaticParams();
+
+    expect(params).toEqual([{ category: 'マインドセット' }, { category: '習慣形成' }]);
+    expect(dynamicParams).toBe(false);
+  });
+
+  it('エンコードされたカテゴリー名で記事一覧を表示する', async () => {
+    render(await CategoryPage({ params: { category: encodeURIComponent('マインドセット') } }));
+
+    expect(getPublishedArticlesByCategory).toHaveBeenCalledWith('マインドセット');
+    expect(screen.getByRole('heading', { level: 1 })).toHaveTextContent('マインドセット');
+    expect(screen.getByText('2件')).toBeInTheDocument();
+  });
+
+  it('記事は要約表示で各記事ページへリンクする', async () => {
+    render(await CategoryPage({ params: { category: 'マインドセット' } }));
+
+    expect(screen.queryByText('本文1')).not.toBeInTheDocument();
+    const link = screen.getByText('マインドセット記事2').closest('a');
+    expect(link).toHaveAttribute('href', '/articles/3');
+    // リンクはカードの内側（カードのクリック処理と入れ子にしない）
+    expect(link?.closest('[data-testid="article-card"]')).not.toBeNull();
+  });
+
+  it('記事のないカテゴリーは404になる', async () => {
+    await expect(CategoryPage({ params: { category: '不明' } })).rejects.toThrow('NEXT_NOT_FOUND');
+  });
+});
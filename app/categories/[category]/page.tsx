@@ -0,0 +1,71 @@
+/**
+ * カテゴリー別記事一覧ページ（ビルド時に静的生成）
+ * public/article-index.json のカテゴリーごとにHTMLを生成し、各記事ページへリンク
+ */
+
+import React from 'react';
+import Link from 'next/link';
+import { notFound } from 'next/navigation';
+import type { Metadata } from 'next';
+import ArticleCard from '@/components/ArticleCard';
+import {
+  loadArticleIndex,
+  getPublishedArticlesByCategory,
+  decodeCategoryParam,
+  toArticleSummary
+} from '@/lib/publishedArticles';
+
+interface CategoryPageProps {
+  params: { category: string };
+}
+
+// 索引にないカテゴリーは404（実行時に生成しない）
+export const dynamicParams = false;
+
+export async function generateStaticParams() {
+  const index = await loadArticleIndex();
+  return index.categories.map(category => ({ category }));
+}
+
+export function generateMetadata({ params }: CategoryPageProps): Metadata {
+  return { title: `${decodeCategoryParam(params.category)} | 中心軸を整える` };
+}
+
+export default async function CategoryPage({ params }: CategoryPageProps) {
+  const category = decodeCategoryParam(params.category);
+  const articles = await getPublishedArticlesByCategory(category);
+
+  if (articles.length === 0) {
+    notFound();
+  }
+
+  return (
+    <div className="container mx-auto px-4 py-8">
+      <div className="mb-6">
+        <h1 className="text-3xl font-bold text-gray-900 mb-2">
+          {category}
+        </h1>
+        <p className="text-gray-600">{articles.length}件</p>
+      </div>
+
+      <div className="space-y-4">
+        {/* クライアントコンポーネントには本文を除いたデータのみ渡す */}
+        {articles.map(article => (
+          <ArticleCard
+            key={article.id}
+            article={toArticleSummary(article)}
+            variant="compact"
+            showNumber={true}
+            href={`/articles/${article.number}`}
+          />
+        ))}
+      </div>
+
+      <div className="text-center py-8">
+        <Link href="/categories" className="text-blue-600 hover:underline">
+          カテゴリー一覧へ
+        </Link>
+      </div>
+    </div>
+  );
+}
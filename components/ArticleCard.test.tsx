@@ -90,4 +90,21 @@ describe('ArticleCard', () => {
       }).not.toThrow();
     });
   });
+
+  describe('記事ページへのリンク', () => {
+    it('hrefを指定するとタイトルがカード内のリンクになる', () => {
+      render(<ArticleCard article={mockArticle} variant="compact" href="/articles/1" />);
+
+      const link = screen.getByText(mockArticle.title).closest('a');
+      expect(link).toHaveAttribute('href', '/articles/1');
+      expect(screen.getByTestId('article-card')).toContainElement(link);
+    });
+
+    it('本文のない一覧表示用データでも表示できる', () => {
+      const { id, title, category, tags } = mockArticle;
+      render(<ArticleCard article={{ id, title, category, tags }} variant="compact" />);
+
+      expect(screen.getByText(title)).toBeInTheDocument();
+    });
+  });
 });
@@ -2,13 +2,16 @@
  * 記事カードコンポーネント
  */
 
+'use client';
+
 import React from 'react';
-import { Article } from '@/types';
+import Link from 'next/link';
+import { Article, ArticleSummary } from '@/types';
 import FavoriteButton from './FavoriteButton';
 
 interface ArticleCardProps {
-  /** 記事データ */
-  article: Article;
+  /** 記事データ（compact では本文なしの一覧表示用データでよい） */
+  article: ArticleSummary & Partial<Pick<Article, 'content'>>;
 
   /** 表示バリアント（full: 全文表示、compact: コンパクト表示） */
   variant: 'full' | 'compact';
@@ -24,6 +27,9 @@ interface ArticleCardProps {
 
   /** 記事番号を表示するか */
   showNumber?: boolean;
+
+  /** 記事ページへのリンク先（指定するとタイトルをリンクにする） */
+  href?: string;
 }
 
 export default function ArticleCard({
@@ -32,7 +38,8 @@ export default function ArticleCard({
   isFavorite = false,
   onFavoriteChange,
   onClick,
-  showNumber = false
+  showNumber = false,
+  href
 }: ArticleCardProps) {
   const handleCardClick = () => {
     if (onClick) {
@@ -49,7 +56,7 @@ export default function ArticleCard({
   return (
     <div
       data-testid="article-card"
-      onClick={handleCardClick}
+      onClick={onClick ? handleCardClick : undefined}
       className={`
         bg-white rounded-lg shadow-md p-6 transition-all duration-200
         ${onClick ? 'cursor-pointer hover:shadow-lg' : ''}
@@ -66,7 +73,13 @@ export default function ArticleCard({
               </span>
             )}
             <h3 className="text-xl font-bold text-gray-900">
-              {article.title}
+              {href ? (
+                <Link href={href} className="hover:underline">
+                  {article.title}
+                </Link>
+              ) : (
+                article.title
+              )}
             </h3>
           </div>
           <div className="flex items-center gap-3 text-sm text-gray-600">
@@ -0,0 +1,230 @@
+/**
+ * HomeViewコンポーネントのテスト
+ */
+
+import { render, screen, fireEvent, waitFor } from '@testing-library/react';
+import HomeView from './HomeView';
+import { useStore } from '@/store/useStore';
+import { Article } from '@/types';
+
+// Zustand storeをモック
+jest.mock('@/store/useStore');
+
+const mockArticles: Article[] = [
+  {
+    id: 'article-1',
+    title: 'テスト記事1',
+    content: '本文1',
+    category: 'マインドセット',
+    date: '2023-01-01',
+    originalDate: '2023-01-01',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: ['テスト']
+  },
+  {
+    id: 'article-2',
+    title: 'テスト記事2',
+    content: '本文2',
+    category: '習慣形成',
+    date: '2023-01-02',
+    originalDate: '2023-01-02',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: ['テスト']
+  }
+];
+
+describe('HomeView', () => {
+  const mockLoadArticles = jest.fn();
+  const mockMigrateArticleIds = jest.fn();
+  const mockGetRandomArticle = jest.fn();
+  const mockSetCurrentArticle = jest.fn();
+  const mockToggleFavorite = jest.fn();
+  const mockIsFavorite = jest.fn();
+  const mockToggleRead = jest.fn();
+  const mockIsRead = jest.fn();
+  const mockRestoreReadingState = jest.fn(() => Promise.resolve());
+  const mockSetFeedComplete = jest.fn();
+
+  beforeEach(() => {
+    // モックのリセット
+    jest.clearAllMocks();
+
+    // useStoreのモック設定
+    (useStore as unknown as jest.Mock).mockReturnValue({
+      articles: [],
+      currentArticle: null,
+      loadArticles: mockLoadArticles,
+      favorites: [],
+      migrateArticleIds: mockMigrateArticleIds,
+      getRandomArticle: mockGetRandomArticle,
+      setCurrentArticle: mockSetCurrentArticle,
+      toggleFavorite: mockToggleFavorite,
+      isFavorite: mockIsFavorite,
+      toggleRead: mockToggleRead,
+      isRead: mockIsRead,
+      restoreReadingState: mockRestoreReadingState,
+      setFeedComplete: mockSetFeedComplete
+    });
+
+    // global.fetch のモック
+    global.fetch = jest.fn(() =>
+      Promise.resolve({
+        ok: true,
+        json: () => Promise.resolve(mockArticles)
+      })
+    ) as jest.Mock;
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('ページタイトルが表示される', async () => {
+    render(<HomeView />);
+
+    await waitFor(() => {
+      expect(screen.getByText('中心軸を整える')).toBeInTheDocument();
+    });
+  });
+
+  it('初回読み込み時に記事フィードを取得し、読み込めない場合はarticles-app.jsonを取得する', async () => {
+    render(<HomeView />);
+
+    await waitFor(() => {
+      expect(global.fetch).toHaveBeenCalledWith('/articles-app.ndjson');
+      expect(global.fetch).toHaveBeenCalledWith('/articles-app.json');
+      expect(mockLoadArticles).toHaveBeenCalledWith(mockArticles);
+    });
+  });
+
+  it('ランダム記事を表示する', async () => {
+    const testArticle = mockArticles[0];
+    mockGetRandomArticle.mockReturnValue(testArticle);
+
+    (useStore as unknown as jest.Mock).mockReturnValue({
+      articles: mockArticles,
+      currentArticle: testArticle,
+      loadArticles: mockLoadArticles,
+      favorites: [],
+      migrateArticleIds: mockMigrateArticleIds,
+      getRandomArticle: mockGetRandomArticle,
+      setCurrentArticle: mockSetCurrentArticle,
+      toggleFavorite: mockToggleFavorite,
+      isFavorite: mockIsFavorite,
+      toggleRead: mockToggleRead,
+      isRead: mockIsRead,
+      restoreReadingState: mockRestoreReadingState,
+      setFeedComplete: mockSetFeedComplete
+    });
+
+    render(<HomeView />);
+
+    await waitFor(() => {
+      expect(screen.getByText('テスト記事1')).toBeInTheDocument();
+    });
+  });
+
+  it('ビルド時の記事を記事データの読み込み前に表示する', async () => {
+    const initialArticle = { ...mockArticles[1], number: 2 };
+
+    render(<HomeView initialArticle={initialArticle} />);
+
+    expect(screen.getByText('テスト記事2').closest('a')).toHaveAttribute('href', '/articles/2');
+    await waitFor(() => {
+      expect(mockSetCurrentArticle).toHaveBeenCalledWith(initialArticle);
+    });
+    expect(mockGetRandomArticle).not.toHaveBeenCalled();
+  });
+
+  it('「次の記事」ボタンが表示される', async () => {
+    const testArticle = mockArticles[0];
+    mockGetRandomArticle.mockReturnValue(testArticle);
+
+    (useStore as unknown as jest.Mock).mockReturnValue({
+      articles: mockArticles,
+      currentArticle: testArticle,
+      loadArticles: mockLoadArticles,
+      favorites: [],
+      migrateArticleIds: mockMigrateArticleIds,
+      getRandomArticle: mockGetRandomArticle,
+      setCurrentArticle: mockSetCurrentArticle,
+      toggleFavorite: mockToggleFavorite,
+      isFavorite: mockIsFavorite,
+      toggleRead: mockToggleRead,
+      isRead: mockIsRead,
+      restoreReadingState: mockRestoreReadingState,
+      setFeedComplete: mockSetFeedComplete
+    });
+
+    render(<HomeView />);
+
+    await waitFor(() => {
+      expect(screen.getByText('次の記事')).toBeInTheDocument();
+    });
+  });
+
+  it('「次の記事」ボタンクリックで新しい記事を表示', async () => {
+    const article1 = mockArticles[0];
+    const article2 = mockArticles[1];
+
+    mockGetRandomArticle
+      .mockReturnValueOnce(article1)
+      .mockReturnValueOnce(article2);
+
+    (useStore as unknown as jest.Mock).mockReturnValue({
+      articles: mockArticles,
+      currentArticle: article1,
+      loadArticles: mockLoadArticles,
+      favorites: [],
+      migrateArticleIds: mockMigrateArticleIds,
+      getRandomArticle: mockGetRandomArticle,
+      setCurrentArticle: mockSetCurrentArticle,
+      toggleFavorite: mockToggleFavorite,
+      isFavorite: mockIsFavorite,
+      toggleRead: mockToggleRead,
+      isRead: mockIsRead,
+      restoreReadingState: mockRestoreReadingState,
+      setFeedComplete: mockSetFeedComplete
+    });
+
+    render(<HomeView />);
+
+    await waitFor(() => {
+      const nextButton = screen.getByText('次の記事');
+      fireEvent.click(nextButton);
+      expect(mockSetCurrentArticle).toHaveBeenCalledWith(article2);
+    });
+  });
+
+  it('読了チェックでtoggleReadが呼ばれる', async () => {
+    const testArticle = mockArticles[0];
+    mockIsRead.mockReturnValue(false);
+
+    (useStore as unknown as jest.Mock).mockReturnValue({
+      articles: mockArticles,
+      feedComplete: true,
+      currentArticle: testArticle,
+      loadArticles: mockLoadArticles,
+      favorites: [],
+      migrateArticleIds: mockMigrateArticleIds,
+      getRandomArticle: mockGetRandomArticle,
+      setCurrentArticle: mockSetCurrentArticle,
+      toggleFavorite: mockToggleFavorite,
+      isFavorite: mockIsFavorite,
+      toggleRead: mockToggleRead,
+      isRead: mockIsRead,
+      restoreReadingState: mockRestoreReadingState,
+      setFeedComplete: mockSetFeedComplete
+    });
+
+    render(<HomeView />);
+
+    fireEvent.click(screen.getByRole('checkbox'));
+
+    expect(mockToggleRead).toHaveBeenCalledWith(testArticle.id);
+    await waitFor(() => {
+      expect(mockRestoreReadingState).toHaveBeenCalled();
+    });
+  });
+
+});
@@ -0,0 +1,131 @@
+/**
+ * ホーム画面
+ * 記事を1つ表示し、「次の記事」でランダムに切り替え
+ */
+
+'use client';
+
+import React, { useEffect, useMemo } from 'react';
+import { useStore } from '@/store/useStore';
+import { useArticles } from '@/hooks/useArticles';
+import { Article } from '@/types';
+import { addArticleNumbers } from '@/lib/articles';
+import ArticleCard from '@/components/ArticleCard';
+import ReadCheckbox from '@/components/ReadCheckbox';
+import PageTransition from '@/components/PageTransition';
+
+interface HomeViewProps {
+  /** ビルド時に用意した最初の記事（記事データの読み込みを待たずに表示する） */
+  initialArticle?: Article | null;
+}
+
+export default function HomeView({ initialArticle = null }: HomeViewProps) {
+  const {
+    articles,
+    currentArticle,
+    getRandomArticle,
+    setCurrentArticle,
+    toggleFavorite,
+    isFavorite,
+    toggleRead,
+    isRead
+  } = useStore();
+
+  // 記事データ読み込み（共通hooks使用・最初のチャンクからストアに追加される）
+  useArticles();
+
+  // 記事に番号を付与
+  const articlesWithNumbers = useMemo(() => addArticleNumbers(articles), [articles]);
+
+  // 最初の記事を表示（ビルド時の記事がなければ、最初のチャンクが届いた時点で読み込み済みの記事から抽選）
+  // （全件の読み込み完了は待たない。「次の記事」はその時点で読み込み済みの記事から抽選する）
+  useEffect(() => {
+    if (currentArticle) {
+      return;
+    }
+    const firstArticle = initialArticle ?? (articles.length > 0 ? getRandomArticle() : null);
+    if (firstArticle) {
+      setCurrentArticle(firstArticle);
+    }
+  }, [initialArticle, articles, currentArticle, getRandomArticle, setCurrentArticle]);
+
+  // 次の記事を表示
+  const handleNextArticle = () => {
+    const nextArticle = getRandomArticle();
+    setCurrentArticle(nextArticle);
+
+    // 画面トップまでスムーズスクロール
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+  };
+
+  // お気に入り状態変更
+  const handleFavoriteChange = (articleId: string) => {
+    toggleFavorite(articleId);
+  };
+
+  // 現在の記事に番号を付与したバージョンを取得
+  // （ストアに設定されるまではビルド時の記事を表示し、HTMLに本文を含める）
+  const currentArticleWithNumber = useMemo(() => {
+    const article = currentArticle ?? initialArticle;
+    if (!article) return null;
+    const withNumber = articlesWithNumbers.find(a => a.id === article.id);
+    return withNumber || article;
+  }, [currentArticle, initialArticle, articlesWithNumbers]);
+
+  return (
+    <PageTransition>
+      <div className="container mx-auto px-4 py-8">
+        {/* ヘッダー */}
+        <div className="text-center mb-8">
+          <h1 className="text-4xl font-bold text-gray-900 mb-2">
+            中心軸を整える
+          </h1>
+          <p className="text-gray-600">
+            メンタルを整える習慣化アプリ
+          </p>
+        </div>
+
+        {/* メインコンテンツ */}
+        <div className="max-w-3xl mx-auto">
+          {currentArticleWithNumber ? (
+            <>
+              {/* 記事カード */}
+              <ArticleCard
+                article={currentArticleWithNumber}
+                variant="full"
+                isFavorite={isFavorite(currentArticleWithNumber.id)}
+                onFavoriteChange={handleFavoriteChange}
+                showNumber={true}
+                href={currentArticleWithNumber.number ? `/articles/${currentArticleWithNumber.number}` : undefined}
+              />
+
+              {/* 読了チェック */}
+              <div className="mt-4 flex justify-end">
+                <ReadCheckbox
+                  checked={isRead(currentArticleWithNumber.id)}
+                  onChange={() => toggleRead(currentArticleWithNumber.id)}
+                />
+              </div>
+
+              {/* 次の記事ボタン */}
+              <div className="mt-6 text-center">
+                <button
+                  onClick={handleNextArticle}
+                  className="px-8 py-3 bg-blue-600 text-white rounded-lg font-medium hover:bg-blue-700 transition-colors duration-200"
+                >
+                  次の記事
+                </button>
+              </div>
+            </>
+          ) : (
+            // ローディング中
+            <div className="text-center py-16">
+              <div className="text-4xl mb-4">📚</div>
+              <p className="text-gray-600">記事を読み込み中...</p>
+            </div>
+          )}
+        </div>
+      </div>
+    </PageTransition>
+  );
+}
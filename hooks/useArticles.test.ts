@@ -0,0 +1,106 @@
+/**
+ * 記事データ読み込みフックのテスト
+ */
+
+import { renderHook, act, waitFor } from '@testing-library/react';
+import { useArticles } from './useArticles';
+import { useStore } from '@/store/useStore';
+import { loadArticleFeed } from '@/lib/articleFeed';
+import { Article } from '@/types';
+
+// フィードの受信をモック（チャンクの到着をテストから制御する）
+jest.mock('@/lib/articleFeed', () => ({
+  ARTICLES_JSON_PATH: '/articles-app.json',
+  loadArticleFeed: jest.fn()
+}));
+
+const makeArticle = (n: number): Article => ({
+  id: `article-${n}`,
+  title: `テスト記事${n}`,
+  content: `本文${n}`,
+  category: 'マインドセット',
+  date: `2023-01-0${n}`,
+  originalDate: `2023-01-0${n}`,
+  createdAt: '2025-10-19T12:00:00Z',
+  tags: [],
+  number: n
+});
+
+describe('useArticles', () => {
+  const mockRestoreReadingState = jest.fn(() => Promise.resolve());
+  let finishFeed: () => void;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    useStore.getState().reset();
+    useStore.setState({ restoreReadingState: mockRestoreReadingState });
+
+    // 最初のチャンクを渡した後、finishFeed が呼ばれるまで受信中のままにする
+    (loadArticleFeed as jest.Mock).mockImplementation((onChunk: (articles: Article[]) => void) => {
+      onChunk([makeArticle(1), makeArticle(2)]);
+      return new Promise<number>(resolve => {
+        finishFeed = () => {
+          onChunk([makeArticle(3)]);
+          resolve(3);
+        };
+      });
+    });
+  });
+
+  it('全件の読み込み後に読了状態を復元する', async () => {
+    const { result } = renderHook(() => useArticles());
+
+    await waitFor(() => {
+      expect(useStore.getState().articles).toHaveLength(2);
+    });
+    expect(result.current.loaded).toBe(false);
+    expect(mockRestoreReadingState).not.toHaveBeenCalled();
+
+    await act(async () => {
+      finishFeed();
+    });
+
+    await waitFor(() => {
+      expect(mockRestoreReadingState).toHaveBeenCalledTimes(1);
+    });
+    expect(result.current.loaded).toBe(true);
+    expect(useStore.getState().articles).toHaveLength(3);
+  });
+
+  it('最初のチャンクの後に別のページでマウントしても、全件が揃うまで復元しない', async () => {
+    const first = renderHook(() => useArticles());
+    await waitFor(() => {
+      expect(useStore.getState().articles).toHaveLength(2);
+    });
+
+    // ページ移動（読み込みは前のページのフックで続く）
+    first.unmount();
+    const { result } = renderHook(() => useArticles());
+
+    expect(result.current.loaded).toBe(false);
+    expect(mockRestoreReadingState).not.toHaveBeenCalled();
+    expect(loadArticleFeed).toHaveBeenCalledTimes(1);
+
+    await act(async () => {
+      finishFeed();
+    });
+
+    await waitFor(() => {
+      expect(mockRestoreReadingState).toHaveBeenCalledTimes(1);
+    });
+    expect(result.current.loaded).toBe(true);
+  });
+
+  it('読み込みに失敗した場合は復元しない', async () => {
+    (loadArticleFeed as jest.Mock).mockRejectedValue(new Error('network'));
+    global.fetch = jest.fn(() => Promise.resolve({ ok: false })) as jest.Mock;
+
+    const { result } = renderHook(() => useArticles());
+
+    await waitFor(() => {
+      expect(global.fetch).toHaveBeenCalledWith('/articles-app.json');
+    });
+    expect(result.current.loaded).toBe(false);
+    expect(mockRestoreReadingState).not.toHaveBeenCalled();
+  });
+});
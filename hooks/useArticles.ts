@@ -3,28 +3,110 @@
  * 共通の記事データ読み込みロジック
  */
 
-import { useEffect } from 'react';
+import { useEffect, useRef } from 'react';
 import { useStore } from '@/store/useStore';
+import { loadArticleFeed, ARTICLES_JSON_PATH } from '@/lib/articleFeed';
 
+/** 旧記事ID → 新記事ID の対応表（scripts/migrate_article_ids.py が出力） */
+const ID_MIGRATION_PATH = '/id-migration.json';
+
+/**
+ * 記事データを読み込み
+ * NDJSONフィードから一定件数ごとにストアへ追加するため、全件の受信前に表示が始まる
+ *
+ * @returns loaded - 全件の読み込みが完了したか（読了状態の復元など、全件が必要な処理にのみ使う）
+ */
 export function useArticles() {
-  const { articles, loadArticles } = useStore();
+  const {
+    articles,
+    loadArticles,
+    appendArticles,
+    feedComplete,
+    setFeedComplete,
+    favorites,
+    migrateArticleIds,
+    restoreReadingState
+  } = useStore();
+
+  // 記事データの取得・読了状態の復元は1回のみ
+  const articlesRequested = useRef(false);
+  const restoreRequested = useRef(false);
 
   // 初回読み込み時に記事データを取得
+  // 全件の読み込み完了はストアに記録する（読み込み中に別のページへ移動しても、移動先で完了が分かる。失敗時は記録しない）
   useEffect(() => {
+    if (articlesRequested.current || articles.length > 0) {
+      return;
+    }
+
+    articlesRequested.current = true;
+
+    const fetchArticlesJson = async () => {
+      const response = await fetch(ARTICLES_JSON_PATH);
+      if (response.ok) {
+        const data = await response.json();
+        loadArticles(data);
+        setFeedComplete(true);
+      }
+    };
+
     const fetchArticles = async () => {
+      let first = true;
       try {
-        const response = await fetch('/articles-app.json');
-        if (response.ok) {
-          const data = await response.json();
-          loadArticles(data);
+        try {
+          await loadArticleFeed(chunk => {
+            if (first) {
+              loadArticles(chunk);
+              first = false;
+            } else {
+              appendArticles(chunk);
+            }
+          });
+          setFeedComplete(true);
+        } catch {
+          // フィードがない・途中で失敗した場合は全件のJSONで置き換える
+          await fetchArticlesJson();
         }
       } catch (error) {
         console.error('Failed to load articles:', error);
       }
     };
 
-    if (articles.length === 0) {
-      fetchArticles();
+    fetchArticles();
+  }, [articles.length, loadArticles, appendArticles, setFeedComplete]);
+
+  // 全記事の読み込み後、IndexedDB から読了・お気に入りを復元
+  // （段階読み込みの途中で復元すると未着の記事の状態が失われるため、記事の有無ではなく完了フラグで判定する）
+  // （記事IDが変わった後も localStorage に保存済みのお気に入りを引き継ぐため、先に記事IDを移行する）
+  useEffect(() => {
+    if (restoreRequested.current || !feedComplete || articles.length === 0) {
+      return;
     }
-  }, [articles.length, loadArticles]);
+
+    restoreRequested.current = true;
+
+    const fetchIdMigration = async () => {
+      try {
+        const response = await fetch(ID_MIGRATION_PATH);
+        if (response.ok) {
+          const idMap: Record<string, string> = await response.json();
+          migrateArticleIds(idMap);
+        }
+      } catch (error) {
+        console.error('Failed to load id migration map:', error);
+      }
+    };
+
+    const restore = async () => {
+      const articleIds = new Set(articles.map(article => article.id));
+      if (!favorites.every(favorite => articleIds.has(favorite.articleId))) {
+        await fetchIdMigration();
+      }
+      await restoreReadingState();
+    };
+
+    restore();
+  }, [feedComplete, articles, favorites, migrateArticleIds, restoreReadingState]);
+
+  return { loaded: feedComplete };
 }
@@ -18,6 +18,9 @@ const customJestConfig = {
     'lib/**/*.{js,jsx,ts,tsx}',
     'store/**/*.{js,jsx,ts,tsx}',
     '!**/*.d.ts',
+    // Worker（webpack の import.meta.url で生成）はjsdomで実行できないため除外
+    '!lib/createArticleFeedWorker.ts',
+    '!lib/*.worker.ts',
     '!**/node_modules/**',
     '!**/.next/**',
   ],
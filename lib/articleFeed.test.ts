@@ -0,0 +1,68 @@
+/**
+ * @jest-environment node
+ */
+
+/**
+ * 記事フィード段階読み込みのテスト
+ * （Worker のない環境 = メインスレッドでの読み込みを検証）
+ */
+
+import { Article } from '@/types';
+import { fetchArticleFeed, loadArticleFeed, ARTICLE_FEED_PATH } from './articleFeed';
+
+const testArticles: Article[] = Array.from({ length: 3 }, (_, i) => ({
+  id: `article-${i + 1}`,
+  title: `記事${i + 1}`,
+  content: `本文${i + 1}`,
+  category: 'マインドセット',
+  date: `2023-01-0${i + 1}`,
+  originalDate: `2023-01-0${i + 1}`,
+  createdAt: '2025-10-19T12:00:00Z',
+  tags: [],
+  number: i + 1
+}));
+
+const feed = testArticles.map(article => JSON.stringify(article)).join('\n') + '\n';
+
+describe('fetchArticleFeed', () => {
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('フィードを指定件数ごとに渡す', async () => {
+    jest.spyOn(global, 'fetch').mockResolvedValue(new Response(feed));
+    const onChunk = jest.fn();
+
+    const count = await fetchArticleFeed('/feed.ndjson', onChunk, 2);
+
+    expect(global.fetch).toHaveBeenCalledWith('/feed.ndjson');
+    expect(count).toBe(3);
+    expect(onChunk).toHaveBeenNthCalledWith(1, testArticles.slice(0, 2));
+    expect(onChunk).toHaveBeenNthCalledWith(2, testArticles.slice(2));
+  });
+
+  it('フィードがない場合はエラーになる', async () => {
+    jest.spyOn(global, 'fetch').mockResolvedValue(new Response('', { status: 404 }));
+    const onChunk = jest.fn();
+
+    await expect(fetchArticleFeed('/feed.ndjson', onChunk, 2)).rejects.toThrow('404');
+    expect(onChunk).not.toHaveBeenCalled();
+  });
+});
+
+describe('loadArticleFeed', () => {
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('Workerがない環境ではメインスレッドで読み込む', async () => {
+    jest.spyOn(global, 'fetch').mockResolvedValue(new Response(feed));
+    const received: Article[] = [];
+
+    const count = await loadArticleFeed(articles => received.push(...articles));
+
+    expect(global.fetch).toHaveBeenCalledWith(ARTICLE_FEED_PATH);
+    expect(count).toBe(3);
+    expect(received).toEqual(testArticles);
+  });
+});
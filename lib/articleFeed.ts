@@ -0,0 +1,105 @@
+/**
+ * 記事フィード（NDJSON）の段階読み込み
+ * scripts/publish_pipeline.py が出力した public/articles-app.ndjson を Web Worker で受信・パースし、
+ * 一定件数ごとにメインスレッドへ渡す（Worker が使えない環境ではメインスレッドで同じ処理を行う）
+ */
+
+import { Article } from '@/types';
+import { readNdjsonStream } from './ndjson';
+
+/** 段階読み込み用のフィード（表示中の記事のみ・通し番号順） */
+export const ARTICLE_FEED_PATH = '/articles-app.ndjson';
+
+/** フィードがない場合に読み込む記事データ */
+export const ARTICLES_JSON_PATH = '/articles-app.json';
+
+/** 1回にストアへ渡す件数（カテゴリーページの初期表示件数） */
+export const FEED_CHUNK_SIZE = 50;
+
+/** メインスレッド → Worker */
+export interface ArticleFeedRequest {
+  url: string;
+  chunkSize: number;
+}
+
+/** Worker → メインスレッド */
+export type ArticleFeedMessage =
+  | { type: 'chunk'; articles: Article[] }
+  | { type: 'done'; count: number }
+  | { type: 'error'; message: string };
+
+/**
+ * フィードを取得し、chunkSize 件ごとにコールバックへ渡す
+ *
+ * @param url - フィードのURL
+ * @param onChunk - chunkSize 件ごとに呼ばれる
+ * @param chunkSize - 1回に渡す件数
+ * @returns 読み込んだ件数
+ */
+export async function fetchArticleFeed(
+  url: string,
+  onChunk: (articles: Article[]) => void,
+  chunkSize: number
+): Promise<number> {
+  const response = await fetch(url);
+  if (!response.ok || !response.body) {
+    throw new Error(`Failed to fetch article feed: ${response.status}`);
+  }
+  return readNdjsonStream<Article>(response.body, onChunk, chunkSize);
+}
+
+/**
+ * Worker でフィードを読み込み
+ */
+async function loadInWorker(
+  onChunk: (articles: Article[]) => void,
+  chunkSize: number
+): Promise<number> {
+  // Worker の生成は webpack 専用の構文のため、使う時だけ読み込む
+  const { createArticleFeedWorker } = await import('./createArticleFeedWorker');
+  const worker = createArticleFeedWorker();
+
+  return new Promise((resolve, reject) => {
+    worker.onmessage = (event: MessageEvent<ArticleFeedMessage>) => {
+      const message = event.data;
+      if (message.type === 'chunk') {
+        onChunk(message.articles);
+        return;
+      }
+      worker.terminate();
+      if (message.type === 'done') {
+        resolve(message.count);
+      } else {
+        reject(new Error(message.message));
+      }
+    };
+    worker.onerror = (event) => {
+      worker.terminate();
+      reject(new Error(event.message));
+    };
+
+    const request: ArticleFeedRequest = {
+      url: new URL(ARTICLE_FEED_PATH, window.location.href).href,
+      chunkSize
+    };
+    worker.postMessage(request);
+  });
+}
+
+/**
+ * 記事フィードを段階的に読み込み
+ * 途中で失敗した場合は、それまでに渡した記事を残したままエラーになる
+ *
+ * @param onChunk - chunkSize 件ごとに呼ばれる（最初の呼び出しで初期表示できる）
+ * @param chunkSize - 1回に渡す件数
+ * @returns 読み込んだ件数
+ */
+export function loadArticleFeed(
+  onChunk: (articles: Article[]) => void,
+  chunkSize: number = FEED_CHUNK_SIZE
+): Promise<number> {
+  if (typeof Worker !== 'undefined') {
+    return loadInWorker(onChunk, chunkSize);
+  }
+  return fetchArticleFeed(ARTICLE_FEED_PATH, onChunk, chunkSize);
+}
@@ -0,0 +1,20 @@
+/**
+ * 記事フィード読み込み Worker
+ * NDJSONの受信・パースをメインスレッドの外で行い、一定件数ごとに記事を送る
+ */
+
+import { fetchArticleFeed, ArticleFeedMessage, ArticleFeedRequest } from './articleFeed';
+
+const post = (message: ArticleFeedMessage) => {
+  (self as unknown as Worker).postMessage(message);
+};
+
+self.addEventListener('message', async (event: MessageEvent<ArticleFeedRequest>) => {
+  const { url, chunkSize } = event.data;
+  try {
+    const count = await fetchArticleFeed(url, articles => post({ type: 'chunk', articles }), chunkSize);
+    post({ type: 'done', count });
+  } catch (error) {
+    post({ type: 'error', message: error instanceof Error ? error.message : String(error) });
+  }
+});
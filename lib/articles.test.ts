@@ -7,7 +7,8 @@ import {
   getRandomArticle,
   getArticlesByCategory,
   getArticleById,
-  getAllCategories
+  getAllCategories,
+  remapFavoriteIds
 } from './articles';
 
 // テスト用の記事データ
@@ -158,4 +159,31 @@ describe('articles.ts', () => {
       expect(categories).toEqual(uniqueCategories);
     });
   });
+
+  describe('remapFavoriteIds', () => {
+    const favorites = [
+      { articleId: 'old-1', favoritedAt: '2025-10-01T00:00:00Z' },
+      { articleId: 'old-2', favoritedAt: '2025-10-02T00:00:00Z' },
+      { articleId: 'article-3', favoritedAt: '2025-10-03T00:00:00Z' }
+    ];
+
+    it('対応表に従って記事IDを置き換える', () => {
+      const remapped = remapFavoriteIds(favorites, { 'old-1': 'new-1', 'old-2': 'new-2' });
+
+      expect(remapped.map(f => f.articleId)).toEqual(['new-1', 'new-2', 'article-3']);
+      expect(remapped[0].favoritedAt).toBe('2025-10-01T00:00:00Z');
+    });
+
+    it('置き換えで重複したIDは1つにまとめる', () => {
+      const remapped = remapFavoriteIds(favorites, { 'old-1': 'article-3' });
+
+      expect(remapped.map(f => f.articleId)).toEqual(['article-3', 'old-2']);
+    });
+
+    it('元の配列を変更しない', () => {
+      remapFavoriteIds(favorites, { 'old-1': 'new-1' });
+
+      expect(favorites[0].articleId).toBe('old-1');
+    });
+  });
 });
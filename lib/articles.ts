@@ -2,7 +2,7 @@
  * 記事管理ロジック
  */
 
-import { Article } from '@/types';
+import { Article, Favorite } from '@/types';
 
 /**
  * ランダムに記事を1つ取得
@@ -118,3 +118,28 @@ export function sortArticlesInCategory(
     return (a.number || 0) - (b.number || 0);
   });
 }
+
+/**
+ * お気に入りの記事IDを新しいIDに置き換え（記事ID移行用）
+ * 対応表にないIDはそのまま残し、置き換えで重複した場合は先に登録した方を残す
+ *
+ * @param favorites - お気に入りリスト
+ * @param idMap - 旧ID → 新ID の対応表
+ * @returns 置き換え後のお気に入りリスト（元の配列は変更しない）
+ */
+export function remapFavoriteIds(
+  favorites: Favorite[],
+  idMap: Record<string, string>
+): Favorite[] {
+  const seen = new Set<string>();
+  const remapped: Favorite[] = [];
+
+  for (const favorite of favorites) {
+    const articleId = idMap[favorite.articleId] ?? favorite.articleId;
+    if (seen.has(articleId)) continue;
+    seen.add(articleId);
+    remapped.push({ ...favorite, articleId });
+  }
+
+  return remapped;
+}
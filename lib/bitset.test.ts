@@ -0,0 +1,92 @@
+/**
+ * 通し番号ビットセットのテスト
+ */
+
+import {
+  BITSET_CHUNK_BITS,
+  BITSET_CHUNK_BYTES,
+  locateBit,
+  setChunkBit,
+  encodeBitset,
+  decodeBitset,
+  splitBitset,
+  bytesToBase64,
+  base64ToBytes
+} from './bitset';
+
+describe('locateBit', () => {
+  it('通し番号 n をビット n - 1 に対応させる', () => {
+    expect(locateBit(1)).toEqual({ chunk: 0, byte: 0, mask: 1 });
+    expect(locateBit(8)).toEqual({ chunk: 0, byte: 0, mask: 128 });
+    expect(locateBit(9)).toEqual({ chunk: 0, byte: 1, mask: 1 });
+  });
+
+  it('チャンクの境界を越えるとチャンク番号が進む', () => {
+    expect(locateBit(BITSET_CHUNK_BITS)).toEqual({ chunk: 0, byte: BITSET_CHUNK_BYTES - 1, mask: 128 });
+    expect(locateBit(BITSET_CHUNK_BITS + 1)).toEqual({ chunk: 1, byte: 0, mask: 1 });
+  });
+
+  it('1未満・整数以外はエラーになる', () => {
+    expect(() => locateBit(0)).toThrow(RangeError);
+    expect(() => locateBit(1.5)).toThrow(RangeError);
+  });
+});
+
+describe('setChunkBit', () => {
+  it('未保存のチャンクから作成する', () => {
+    const chunk = setChunkBit(undefined, 3, true);
+
+    expect(chunk).toHaveLength(BITSET_CHUNK_BYTES);
+    expect(decodeBitset(chunk)).toEqual([3]);
+  });
+
+  it('ビットを解除でき、元のチャンクは変更しない', () => {
+    const original = setChunkBit(setChunkBit(undefined, 3, true), 5, true);
+    const updated = setChunkBit(original, 3, false);
+
+    expect(decodeBitset(updated)).toEqual([5]);
+    expect(decodeBitset(original)).toEqual([3, 5]);
+  });
+
+  it('2つ目以降のチャンクではチャンク内の位置を使う', () => {
+    const chunk = setChunkBit(undefined, BITSET_CHUNK_BITS + 2, true);
+
+    expect(decodeBitset(chunk, BITSET_CHUNK_BITS)).toEqual([BITSET_CHUNK_BITS + 2]);
+  });
+});
+
+describe('encodeBitset / decodeBitset', () => {
+  it('通し番号の一覧を復元できる', () => {
+    const numbers = [1, 2, 8, 9, 100, 1024, 1025, 3000];
+
+    expect(decodeBitset(encodeBitset(numbers))).toEqual(numbers);
+  });
+
+  it('重複・順不同の入力は昇順の一覧になる', () => {
+    expect(decodeBitset(encodeBitset([9, 1, 9]))).toEqual([1, 9]);
+  });
+
+  it('最大の通し番号までのバイト数になる', () => {
+    expect(encodeBitset([])).toHaveLength(0);
+    expect(encodeBitset([8])).toHaveLength(1);
+    expect(encodeBitset([1000])).toHaveLength(125);
+  });
+});
+
+describe('splitBitset', () => {
+  it('チャンクに分割し、すべて0のチャンクは含めない', () => {
+    const chunks = splitBitset(encodeBitset([1, BITSET_CHUNK_BITS * 2 + 1]));
+
+    expect(Array.from(chunks.keys())).toEqual([0, 2]);
+    expect(decodeBitset(chunks.get(0)!)).toEqual([1]);
+    expect(decodeBitset(chunks.get(2)!, BITSET_CHUNK_BITS * 2)).toEqual([BITSET_CHUNK_BITS * 2 + 1]);
+  });
+});
+
+describe('bytesToBase64 / base64ToBytes', () => {
+  it('バイト列を復元できる', () => {
+    const bytes = encodeBitset([1, 7, 255, 1000]);
+
+    expect(Array.from(base64ToBytes(bytesToBase64(bytes)))).toEqual(Array.from(bytes));
+  });
+});
@@ -0,0 +1,127 @@
+/**
+ * 通し番号のビットセット
+ * 通し番号 n をビット n - 1 で表す（1バイトに8記事・1000記事でも125バイト）
+ * IndexedDB には BITSET_CHUNK_BITS 記事ごとのチャンクに分けて保存し、1件の更新で1チャンクだけ書き込む
+ */
+
+/** 1チャンクの記事数 */
+export const BITSET_CHUNK_BITS = 1024;
+
+/** 1チャンクのバイト数 */
+export const BITSET_CHUNK_BYTES = BITSET_CHUNK_BITS / 8;
+
+/**
+ * 通し番号のチャンク内の位置
+ *
+ * @param number - 通し番号（1以上）
+ * @returns チャンク番号・チャンク内のバイト位置・ビットマスク
+ */
+export function locateBit(number: number): { chunk: number; byte: number; mask: number } {
+  if (!Number.isInteger(number) || number < 1) {
+    throw new RangeError(`Invalid article number: ${number}`);
+  }
+  const bit = number - 1;
+  const offset = bit % BITSET_CHUNK_BITS;
+  return {
+    chunk: Math.floor(bit / BITSET_CHUNK_BITS),
+    byte: offset >> 3,
+    mask: 1 << (offset & 7)
+  };
+}
+
+/**
+ * チャンクのビットを設定（元のチャンクは変更しない）
+ *
+ * @param chunk - チャンク（未保存の場合はundefined）
+ * @param number - 通し番号
+ * @param value - 設定する値
+ * @returns 更新後のチャンク
+ */
+export function setChunkBit(chunk: Uint8Array | undefined, number: number, value: boolean): Uint8Array {
+  const { byte, mask } = locateBit(number);
+  const updated = new Uint8Array(BITSET_CHUNK_BYTES);
+  if (chunk) {
+    updated.set(chunk.subarray(0, BITSET_CHUNK_BYTES));
+  }
+  updated[byte] = value ? updated[byte] | mask : updated[byte] & ~mask;
+  return updated;
+}
+
+/**
+ * 通し番号の一覧をビットセットに変換
+ *
+ * @param numbers - 通し番号（1以上・重複可）
+ * @returns ビットセット（最大の通し番号までの長さ）
+ */
+export function encodeBitset(numbers: Iterable<number>): Uint8Array {
+  const list = Array.from(numbers);
+  const max = list.reduce((a, b) => Math.max(a, b), 0);
+  const bytes = new Uint8Array(Math.ceil(max / 8));
+  for (const number of list) {
+    const bit = locateBit(number);
+    bytes[bit.chunk * BITSET_CHUNK_BYTES + bit.byte] |= bit.mask;
+  }
+  return bytes;
+}
+
+/**
+ * ビットセットを通し番号の一覧に変換
+ *
+ * @param bytes - ビットセット
+ * @param offset - 先頭ビットの位置（チャンクの場合はチャンク番号 × BITSET_CHUNK_BITS）
+ * @returns 通し番号（昇順）
+ */
+export function decodeBitset(bytes: Uint8Array, offset: number = 0): number[] {
+  const numbers: number[] = [];
+  for (let i = 0; i < bytes.length; i++) {
+    const value = bytes[i];
+    if (value === 0) continue;
+    for (let bit = 0; bit < 8; bit++) {
+      if (value & (1 << bit)) {
+        numbers.push(offset + i * 8 + bit + 1);
+      }
+    }
+  }
+  return numbers;
+}
+
+/**
+ * ビットセットをチャンクに分割（すべて0のチャンクは含めない）
+ *
+ * @param bytes - ビットセット
+ * @returns チャンク番号 → チャンク
+ */
+export function splitBitset(bytes: Uint8Array): Map<number, Uint8Array> {
+  const chunks = new Map<number, Uint8Array>();
+  for (let start = 0; start < bytes.length; start += BITSET_CHUNK_BYTES) {
+    const chunk = new Uint8Array(BITSET_CHUNK_BYTES);
+    chunk.set(bytes.subarray(start, start + BITSET_CHUNK_BYTES));
+    if (chunk.some(value => value !== 0)) {
+      chunks.set(start / BITSET_CHUNK_BYTES, chunk);
+    }
+  }
+  return chunks;
+}
+
+/**
+ * Base64文字列に変換（エクスポート用）
+ */
+export function bytesToBase64(bytes: Uint8Array): string {
+  let binary = '';
+  bytes.forEach(value => {
+    binary += String.fromCharCode(value);
+  });
+  return btoa(binary);
+}
+
+/**
+ * Base64文字列から復元（インポート用）
+ */
+export function base64ToBytes(base64: string): Uint8Array {
+  const binary = atob(base64);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return bytes;
+}
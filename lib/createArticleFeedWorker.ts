@@ -0,0 +1,8 @@
+/**
+ * 記事フィード読み込み用 Worker の生成
+ * new URL(..., import.meta.url) は webpack が Worker を別ファイルにバンドルするための構文（Jestでは読み込まない）
+ */
+
+export function createArticleFeedWorker(): Worker {
+  return new Worker(new URL('./articleFeed.worker.ts', import.meta.url));
+}
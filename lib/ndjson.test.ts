@@ -0,0 +1,86 @@
+/**
+ * @jest-environment node
+ */
+
+/**
+ * NDJSON逐次パースのテスト
+ * （ReadableStream・TextEncoder を使うため node 環境で実行）
+ */
+
+import { NdjsonLineParser, readNdjsonStream } from './ndjson';
+
+/** 文字列の断片を順に流すストリームを作成 */
+function streamOf(chunks: Uint8Array[]): ReadableStream<Uint8Array> {
+  return new ReadableStream({
+    start(controller) {
+      chunks.forEach(chunk => controller.enqueue(chunk));
+      controller.close();
+    }
+  });
+}
+
+describe('NdjsonLineParser', () => {
+  it('完成した行だけをパースする', () => {
+    const parser = new NdjsonLineParser<{ id: string }>();
+
+    expect(parser.push('{"id":"a"}\n{"id"')).toEqual([{ id: 'a' }]);
+    expect(parser.push(':"b"}\n')).toEqual([{ id: 'b' }]);
+    expect(parser.count).toBe(2);
+  });
+
+  it('改行のない断片は次の断片まで保持する', () => {
+    const parser = new NdjsonLineParser<{ id: string }>();
+
+    expect(parser.push('{"id":')).toEqual([]);
+    expect(parser.push('"a"}')).toEqual([]);
+    expect(parser.flush()).toEqual([{ id: 'a' }]);
+  });
+
+  it('空行・CRLFを無視する', () => {
+    const parser = new NdjsonLineParser<{ id: string }>();
+
+    expect(parser.push('{"id":"a"}\r\n\n{"id":"b"}\r\n')).toEqual([{ id: 'a' }, { id: 'b' }]);
+    expect(parser.flush()).toEqual([]);
+  });
+
+  it('不正な行はエラーになる', () => {
+    const parser = new NdjsonLineParser();
+
+    expect(() => parser.push('{"id":\n')).toThrow();
+  });
+});
+
+describe('readNdjsonStream', () => {
+  const lines = Array.from({ length: 5 }, (_, i) => JSON.stringify({ id: `article-${i + 1}`, title: `記事${i + 1}` }));
+
+  it('指定件数ごとにコールバックへ渡す', async () => {
+    const onChunk = jest.fn();
+    const stream = streamOf([new TextEncoder().encode(lines.join('\n') + '\n')]);
+
+    const count = await readNdjsonStream(stream, onChunk, 2);
+
+    expect(count).toBe(5);
+    expect(onChunk.mock.calls.map(([items]) => items.length)).toEqual([2, 2, 1]);
+    expect(onChunk.mock.calls[2][0]).toEqual([{ id: 'article-5', title: '記事5' }]);
+  });
+
+  it('マルチバイト文字が断片の境界で分かれても復元する', async () => {
+    const bytes = new TextEncoder().encode(lines.join('\n'));
+    // 1バイトずつに分割して流す
+    const stream = streamOf(Array.from(bytes, byte => new Uint8Array([byte])));
+    const received: unknown[] = [];
+
+    await readNdjsonStream(stream, items => received.push(...items), 50);
+
+    expect(received).toEqual(lines.map(line => JSON.parse(line)));
+  });
+
+  it('空のストリームではコールバックを呼ばない', async () => {
+    const onChunk = jest.fn();
+
+    const count = await readNdjsonStream(streamOf([]), onChunk, 2);
+
+    expect(count).toBe(0);
+    expect(onChunk).not.toHaveBeenCalled();
+  });
+});
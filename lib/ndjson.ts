@@ -0,0 +1,94 @@
+/**
+ * NDJSON（1行1件のJSON）の逐次パース
+ * 受信途中のデータから完成した行だけを取り出し、全体の受信を待たずに処理する
+ */
+
+/**
+ * 文字列の断片を受け取り、完成した行をパースして返す
+ *
+ * const parser = new NdjsonLineParser<Article>();
+ * parser.push('{"id":"a"}\n{"id"');  // → [{ id: 'a' }]
+ * parser.push(':"b"}\n');            // → [{ id: 'b' }]
+ */
+export class NdjsonLineParser<T> {
+  /** 改行が来ていない末尾の行 */
+  private buffer = '';
+
+  /** パースした件数 */
+  count = 0;
+
+  /**
+   * 断片を追加し、この断片で完成した行をパースして返す
+   *
+   * @param chunk - 受信した文字列
+   * @returns 完成した行の値（空行は無視）
+   */
+  push(chunk: string): T[] {
+    this.buffer += chunk;
+    const lastNewline = this.buffer.lastIndexOf('\n');
+    if (lastNewline === -1) {
+      return [];
+    }
+
+    const lines = this.buffer.slice(0, lastNewline).split('\n');
+    this.buffer = this.buffer.slice(lastNewline + 1);
+    return this.parseLines(lines);
+  }
+
+  /**
+   * 末尾の改行がない最終行をパースして返す（受信完了時に呼ぶ）
+   */
+  flush(): T[] {
+    const rest = this.buffer;
+    this.buffer = '';
+    return this.parseLines([rest]);
+  }
+
+  private parseLines(lines: string[]): T[] {
+    const items: T[] = [];
+    for (const line of lines) {
+      const trimmed = line.trim();
+      if (!trimmed) continue;
+      items.push(JSON.parse(trimmed) as T);
+    }
+    this.count += items.length;
+    return items;
+  }
+}
+
+/**
+ * NDJSONのストリームを読み込み、chunkSize 件ごとにコールバックへ渡す
+ *
+ * @param stream - fetch の response.body など
+ * @param onChunk - chunkSize 件（最後は残り全件）ごとに呼ばれる
+ * @param chunkSize - 1回に渡す件数
+ * @returns 読み込んだ件数
+ */
+export async function readNdjsonStream<T>(
+  stream: ReadableStream<Uint8Array>,
+  onChunk: (items: T[]) => void,
+  chunkSize: number
+): Promise<number> {
+  const reader = stream.getReader();
+  const decoder = new TextDecoder('utf-8');
+  const parser = new NdjsonLineParser<T>();
+  let pending: T[] = [];
+
+  const emit = (items: T[], final: boolean) => {
+    pending.push(...items);
+    while (pending.length >= chunkSize || (final && pending.length > 0)) {
+      onChunk(pending.slice(0, chunkSize));
+      pending = pending.slice(chunkSize);
+    }
+  };
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    // stream: true でマルチバイト文字が断片の境界で分かれても正しく復元する
+    emit(parser.push(decoder.decode(value, { stream: true })), false);
+  }
+  emit([...parser.push(decoder.decode()), ...parser.flush()], true);
+
+  return parser.count;
+}
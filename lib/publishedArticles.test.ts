@@ -0,0 +1,208 @@
+/**
+ * 公開データ読み込みのテスト
+ */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { Article } from '@/types';
+import {
+  toPublishedArticles,
+  toArticleSummary,
+  decodeCategoryParam,
+  loadArticleIndex,
+  loadPublishedArticles,
+  getPublishedArticle,
+  getLatestPublishedArticle,
+  getPublishedArticlesByCategory,
+  clearPublishedArticlesCache,
+  ARTICLE_INDEX_FILE,
+  PUBLISHED_ARTICLES_FILE
+} from './publishedArticles';
+
+// テスト用の記事データ（publish_pipeline.py の出力形式）
+const testArticles: Article[] = [
+  {
+    id: 'article-1',
+    title: 'マインドセットの記事1',
+    content: '本文1',
+    category: 'マインドセット',
+    date: '2023-01-01',
+    originalDate: '2023-01-01',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: ['マインドセット'],
+    number: 1
+  },
+  {
+    id: 'article-2',
+    title: '非表示の記事',
+    content: '本文2',
+    category: '習慣形成',
+    date: '2023-01-02',
+    originalDate: '2023-01-02',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: [],
+    hidden: true
+  },
+  {
+    id: 'article-3',
+    title: '習慣形成の記事1',
+    content: '本文3',
+    category: '習慣形成',
+    date: '2023-01-03',
+    originalDate: '2023-01-03',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: ['習慣'],
+    number: 2
+  },
+  {
+    id: 'article-4',
+    title: 'マインドセットの記事2',
+    content: '本文4',
+    category: 'マインドセット',
+    date: '2023-01-04',
+    originalDate: '2023-01-04',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: [],
+    number: 3
+  }
+];
+
+const testIndex = {
+  categories: ['マインドセット', '習慣形成'],
+  articles: [
+    { number: 1, id: 'article-1', category: 'マインドセット' },
+    { number: 2, id: 'article-3', category: '習慣形成' },
+    { number: 3, id: 'article-4', category: 'マインドセット' }
+  ]
+};
+
+describe('toPublishedArticles', () => {
+  it('非表示の記事を除外して通し番号順に並べる', () => {
+    const result = toPublishedArticles([...testArticles].reverse());
+
+    expect(result.map(a => a.id)).toEqual(['article-1', 'article-3', 'article-4']);
+  });
+
+  it('通し番号がない場合は日付昇順で振る', () => {
+    const withoutNumbers = testArticles.map(({ number, ...rest }) => rest);
+    const result = toPublishedArticles(withoutNumbers);
+
+    expect(result.map(a => a.number)).toEqual([1, 2, 3]);
+    expect(result[1].id).toBe('article-3');
+  });
+
+  it('元の配列を変更しない', () => {
+    const input = [...testArticles].reverse();
+    toPublishedArticles(input);
+
+    expect(input[0].id).toBe('article-4');
+  });
+});
+
+describe('toArticleSummary', () => {
+  it('本文・日付を除いた一覧表示用のデータにする', () => {
+    expect(toArticleSummary(testArticles[0])).toEqual({
+      id: 'article-1',
+      number: 1,
+      title: testArticles[0].title,
+      category: testArticles[0].category,
+      tags: ['マインドセット']
+    });
+  });
+});
+
+describe('decodeCategoryParam', () => {
+  it('エンコード済みのカテゴリー名を復元する', () => {
+    expect(decodeCategoryParam(encodeURIComponent('習慣形成'))).toBe('習慣形成');
+  });
+
+  it('未エンコードのカテゴリー名はそのまま返す', () => {
+    expect(decodeCategoryParam('習慣形成')).toBe('習慣形成');
+  });
+
+  it('不正なエンコードはそのまま返す', () => {
+    expect(decodeCategoryParam('%E3%81')).toBe('%E3%81');
+  });
+});
+
+describe('公開データの読み込み', () => {
+  let dir: string;
+
+  beforeEach(() => {
+    clearPublishedArticlesCache();
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'published-'));
+    fs.writeFileSync(path.join(dir, PUBLISHED_ARTICLES_FILE), JSON.stringify(testArticles));
+    fs.writeFileSync(path.join(dir, ARTICLE_INDEX_FILE), JSON.stringify(testIndex));
+  });
+
+  afterEach(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  it('索引を読み込む', async () => {
+    const index = await loadArticleIndex(dir);
+
+    expect(index).toEqual(testIndex);
+  });
+
+  it('索引がない場合は空の索引を返す', async () => {
+    fs.rmSync(path.join(dir, ARTICLE_INDEX_FILE));
+
+    const index = await loadArticleIndex(dir);
+
+    expect(index).toEqual({ categories: [], articles: [] });
+  });
+
+  it('表示中の記事のみ読み込む', async () => {
+    const articles = await loadPublishedArticles(dir);
+
+    expect(articles).toHaveLength(3);
+    expect(articles.every(a => !a.hidden)).toBe(true);
+  });
+
+  it('記事データがない場合は空配列を返す', async () => {
+    fs.rmSync(path.join(dir, PUBLISHED_ARTICLES_FILE));
+
+    const articles = await loadPublishedArticles(dir);
+
+    expect(articles).toEqual([]);
+  });
+
+  it('通し番号で記事を取得する', async () => {
+    const article = await getPublishedArticle(2, dir);
+
+    expect(article?.id).toBe('article-3');
+  });
+
+  it('存在しない通し番号はnullを返す', async () => {
+    expect(await getPublishedArticle(0, dir)).toBeNull();
+    expect(await getPublishedArticle(4, dir)).toBeNull();
+  });
+
+  it('最新の記事を取得する', async () => {
+    expect((await getLatestPublishedArticle(dir))?.id).toBe('article-4');
+  });
+
+  it('記事データがない場合は最新の記事がnullになる', async () => {
+    fs.rmSync(path.join(dir, PUBLISHED_ARTICLES_FILE));
+
+    expect(await getLatestPublishedArticle(dir)).toBeNull();
+  });
+
+  it('カテゴリーの記事を通し番号順に取得する', async () => {
+    const articles = await getPublishedArticlesByCategory('マインドセット', dir);
+
+    expect(articles.map(a => a.number)).toEqual([1, 3]);
+  });
+
+  it('同じディレクトリは1回だけ読み込む', async () => {
+    const readFile = jest.spyOn(fs.promises, 'readFile');
+
+    await getPublishedArticle(1, dir);
+    await getPublishedArticle(2, dir);
+
+    expect(readFile).toHaveBeenCalledTimes(1);
+    readFile.mockRestore();
+  });
+});
@@ -0,0 +1,159 @@
+/**
+ * 公開データの読み込み（サーバー専用・ビルド時の静的ページ生成用）
+ * scripts/publish_pipeline.py が出力した public/articles-app.json と public/article-index.json を読み込む
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import { Article, ArticleSummary } from '@/types';
+import { addArticleNumbers } from '@/lib/articles';
+
+/** 索引の1件（表示中の記事のみ） */
+export interface ArticleIndexEntry {
+  /** 通し番号 */
+  number: number;
+
+  /** 記事ID */
+  id: string;
+
+  /** カテゴリー */
+  category: string;
+}
+
+/** 静的ページ生成用の索引 */
+export interface ArticleIndex {
+  /** カテゴリー一覧 */
+  categories: string[];
+
+  /** 表示中の記事（通し番号順） */
+  articles: ArticleIndexEntry[];
+}
+
+export const PUBLIC_DIR = path.join(process.cwd(), 'public');
+export const ARTICLE_INDEX_FILE = 'article-index.json';
+export const PUBLISHED_ARTICLES_FILE = 'articles-app.json';
+
+// ビルド中は全ページで同じデータを使うため、ディレクトリごとに1回だけ読み込む
+const articlesCache = new Map<string, Promise<Article[]>>();
+
+/**
+ * JSONファイルを読み込み（存在しない場合はnull）
+ */
+async function readJson<T>(filePath: string): Promise<T | null> {
+  try {
+    const text = await fs.readFile(filePath, 'utf-8');
+    return JSON.parse(text) as T;
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+      return null;
+    }
+    throw error;
+  }
+}
+
+/**
+ * 公開データを表示用に整える
+ * 非表示記事を除外し、通し番号順に並べる（通し番号がなければ日付昇順で振る）
+ *
+ * @param articles - 公開データの記事配列
+ * @returns 通し番号付きの表示中の記事（元の配列は変更しない）
+ */
+export function toPublishedArticles(articles: Article[]): Article[] {
+  const visible = articles.filter(article => !article.hidden);
+
+  if (visible.some(article => !article.number)) {
+    return addArticleNumbers(visible);
+  }
+
+  return [...visible].sort((a, b) => (a.number || 0) - (b.number || 0));
+}
+
+/**
+ * 一覧表示用に本文を除いた記事データに変換
+ *
+ * @param article - 記事
+ */
+export function toArticleSummary(article: Article): ArticleSummary {
+  const { id, number, title, category, tags } = article;
+  return { id, number, title, category, tags };
+}
+
+/**
+ * URLのカテゴリー部分を復元（エンコード済み・未エンコードの両方に対応）
+ *
+ * @param value - ルートパラメーターの値
+ * @returns カテゴリー名
+ */
+export function decodeCategoryParam(value: string): string {
+  try {
+    return decodeURIComponent(value);
+  } catch {
+    return value;
+  }
+}
+
+/**
+ * 静的ページ生成用の索引を読み込み（パイプライン未実行の場合は空）
+ *
+ * @param dir - 公開データのディレクトリ
+ */
+export async function loadArticleIndex(dir: string = PUBLIC_DIR): Promise<ArticleIndex> {
+  const index = await readJson<ArticleIndex>(path.join(dir, ARTICLE_INDEX_FILE));
+  return index ?? { categories: [], articles: [] };
+}
+
+/**
+ * 表示中の記事を通し番号順に読み込み
+ *
+ * @param dir - 公開データのディレクトリ
+ */
+export function loadPublishedArticles(dir: string = PUBLIC_DIR): Promise<Article[]> {
+  let cached = articlesCache.get(dir);
+  if (!cached) {
+    cached = readJson<Article[]>(path.join(dir, PUBLISHED_ARTICLES_FILE))
+      .then(articles => toPublishedArticles(articles ?? []));
+    articlesCache.set(dir, cached);
+  }
+  return cached;
+}
+
+/**
+ * 通し番号で記事を取得
+ *
+ * @param number - 通し番号
+ * @param dir - 公開データのディレクトリ
+ * @returns 記事、見つからない場合はnull
+ */
+export async function getPublishedArticle(number: number, dir: string = PUBLIC_DIR): Promise<Article | null> {
+  const articles = await loadPublishedArticles(dir);
+  return articles.find(article => article.number === number) ?? null;
+}
+
+/**
+ * 最新の記事（通し番号が最大の記事）を取得
+ *
+ * @param dir - 公開データのディレクトリ
+ * @returns 記事、公開データがない場合はnull
+ */
+export async function getLatestPublishedArticle(dir: string = PUBLIC_DIR): Promise<Article | null> {
+  const articles = await loadPublishedArticles(dir);
+  return articles[articles.length - 1] ?? null;
+}
+
+/**
+ * カテゴリーの記事を通し番号順に取得
+ *
+ * @param category - カテゴリー名
+ * @param dir - 公開データのディレクトリ
+ */
+export async function getPublishedArticlesByCategory(category: string, dir: string = PUBLIC_DIR): Promise<Article[]> {
+  const articles = await loadPublishedArticles(dir);
+  return articles.filter(article => article.category === category);
+}
+
+/**
+ * 読み込み済みデータを破棄（テスト用）
+ */
+export function clearPublishedArticlesCache(): void {
+  articlesCache.clear();
+}
@@ -0,0 +1,127 @@
+/**
+ * 読了・お気に入り状態の保存のテスト
+ * （IndexedDB の代わりにメモリ上の保存先を使用）
+ */
+
+import { Article } from '@/types';
+import { BITSET_CHUNK_BITS } from './bitset';
+import {
+  ChunkStore,
+  createMemoryChunkStore,
+  getNumberIndex,
+  writeReadingBit,
+  loadReadingNumbers,
+  replaceReadingNumbers,
+  serializeReadingState,
+  parseReadingState,
+  EXPORT_FORMAT
+} from './readingState';
+
+const testArticles: Article[] = [
+  {
+    id: 'article-2',
+    title: '記事2',
+    content: '本文2',
+    category: '習慣形成',
+    date: '2023-01-02',
+    originalDate: '2023-01-02',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: []
+  },
+  {
+    id: 'article-1',
+    title: '記事1',
+    content: '本文1',
+    category: 'マインドセット',
+    date: '2023-01-01',
+    originalDate: '2023-01-01',
+    createdAt: '2025-10-19T12:00:00Z',
+    tags: []
+  }
+];
+
+describe('getNumberIndex', () => {
+  it('通し番号のない記事は日付昇順で番号を振る', () => {
+    const index = getNumberIndex(testArticles);
+
+    expect(index.get('article-1')).toBe(1);
+    expect(index.get('article-2')).toBe(2);
+  });
+
+  it('通し番号のある記事はその番号を使う', () => {
+    const numbered = testArticles.map((article, i) => ({ ...article, number: i + 10 }));
+
+    expect(getNumberIndex(numbered).get('article-2')).toBe(10);
+  });
+
+  it('同じ記事配列では再計算しない', () => {
+    expect(getNumberIndex(testArticles)).toBe(getNumberIndex(testArticles));
+  });
+});
+
+describe('IndexedDB への保存', () => {
+  let store: ChunkStore;
+
+  beforeEach(() => {
+    store = createMemoryChunkStore();
+  });
+
+  it('一度も保存していない場合はnullを返す', async () => {
+    expect(await loadReadingNumbers(store)).toBeNull();
+  });
+
+  it('1件ずつ保存した状態を読み込める', async () => {
+    await writeReadingBit(store, 'read', 3, true);
+    await writeReadingBit(store, 'read', BITSET_CHUNK_BITS + 1, true);
+    await writeReadingBit(store, 'favorite', 3, true);
+    await writeReadingBit(store, 'favorite', 3, false);
+
+    expect(await loadReadingNumbers(store)).toEqual({
+      read: [3, BITSET_CHUNK_BITS + 1],
+      favorite: []
+    });
+  });
+
+  it('1件の保存では該当するチャンクのみ書き込む', async () => {
+    const update = jest.spyOn(store, 'update');
+
+    await writeReadingBit(store, 'read', BITSET_CHUNK_BITS + 5, true);
+
+    expect(update).toHaveBeenCalledTimes(1);
+    expect(update.mock.calls[0][0]).toBe('read:1');
+  });
+
+  it('まとめて置き換えると以前の状態は残らない', async () => {
+    await writeReadingBit(store, 'read', 1, true);
+    await writeReadingBit(store, 'favorite', 2000, true);
+
+    await replaceReadingNumbers(store, { read: [5], favorite: [] });
+
+    expect(await loadReadingNumbers(store)).toEqual({ read: [5], favorite: [] });
+  });
+});
+
+describe('エクスポート・インポート', () => {
+  it('エクスポートした状態を復元できる', () => {
+    const numbers = { read: [1, 2, 500, 1500], favorite: [2, 1500] };
+
+    const text = serializeReadingState(numbers);
+
+    expect(JSON.parse(text).format).toBe(EXPORT_FORMAT);
+    expect(parseReadingState(text)).toEqual(numbers);
+  });
+
+  it('JSONでない場合はエラーになる', () => {
+    expect(() => parseReadingState('not json')).toThrow('Invalid reading state export');
+  });
+
+  it('形式が異なる場合はエラーになる', () => {
+    expect(() => parseReadingState(JSON.stringify({ format: 'other', version: 1 }))).toThrow('unsupported format');
+  });
+
+  it('状態が欠けている場合はエラーになる', () => {
+    const text = JSON.stringify({ format: EXPORT_FORMAT, version: 1, read: '' });
+
+    expect(() => parseReadingState(text)).toThrow('missing favorite');
+  });
+});
@@ -0,0 +1,310 @@
+/**
+ * 読了・お気に入り状態の保存（IndexedDB）
+ * 記事IDではなく通し番号のビットセットで保存し、1件の切り替えで1チャンク（128バイト）だけ書き込む
+ */
+
+import { Article } from '@/types';
+import { addArticleNumbers } from '@/lib/articles';
+import {
+  BITSET_CHUNK_BITS,
+  BITSET_CHUNK_BYTES,
+  locateBit,
+  setChunkBit,
+  encodeBitset,
+  decodeBitset,
+  splitBitset,
+  bytesToBase64,
+  base64ToBytes
+} from '@/lib/bitset';
+
+/** 保存する状態の種類 */
+export type ReadingKind = 'read' | 'favorite';
+
+export const READING_KINDS: ReadingKind[] = ['read', 'favorite'];
+
+/** 種類ごとの通し番号（昇順） */
+export type ReadingNumbers = Record<ReadingKind, number[]>;
+
+/** チャンクの保存先（IndexedDB・テスト用のメモリ） */
+export interface ChunkStore {
+  /** 全チャンクを取得（キー → チャンク） */
+  getAll(): Promise<Map<string, Uint8Array>>;
+
+  /** 1チャンクを読み込み・更新・保存（1トランザクションで行うため、連続した切り替えでも失われない） */
+  update(key: string, updater: (chunk: Uint8Array | undefined) => Uint8Array): Promise<void>;
+
+  /** 複数チャンクをまとめて保存 */
+  putMany(entries: Map<string, Uint8Array>): Promise<void>;
+}
+
+export const READING_STATE_DB = 'chuusinjiku';
+const STORE_NAME = 'reading-state';
+const DB_VERSION = 1;
+
+/** エクスポート形式の識別子 */
+export const EXPORT_FORMAT = 'chuusinjiku-reading-state';
+export const EXPORT_VERSION = 1;
+
+/**
+ * エクスポート形式（JSON）
+ * read / favorite は通し番号のビットセット（通し番号 n = ビット n - 1）をBase64にしたもの
+ */
+export interface ReadingStateExport {
+  format: typeof EXPORT_FORMAT;
+  version: number;
+  read: string;
+  favorite: string;
+}
+
+function chunkKey(kind: ReadingKind, chunk: number): string {
+  return `${kind}:${chunk}`;
+}
+
+function parseChunkKey(key: string): { kind: ReadingKind; chunk: number } | null {
+  const [kind, chunk] = key.split(':');
+  if (!READING_KINDS.includes(kind as ReadingKind) || !/^\d+$/.test(chunk ?? '')) {
+    return null;
+  }
+  return { kind: kind as ReadingKind, chunk: Number(chunk) };
+}
+
+function requestToPromise<T>(request: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function transactionDone(transaction: IDBTransaction): Promise<void> {
+  return new Promise((resolve, reject) => {
+    transaction.oncomplete = () => resolve();
+    transaction.onerror = () => reject(transaction.error);
+    transaction.onabort = () => reject(transaction.error);
+  });
+}
+
+/**
+ * IndexedDB の保存先を作成（接続は最初の読み書き時）
+ *
+ * @param name - データベース名
+ */
+export function createIndexedDbChunkStore(name: string = READING_STATE_DB): ChunkStore {
+  let database: Promise<IDBDatabase> | null = null;
+
+  const open = () => {
+    if (!database) {
+      const request = indexedDB.open(name, DB_VERSION);
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore(STORE_NAME);
+      };
+      database = requestToPromise(request);
+    }
+    return database;
+  };
+
+  return {
+    async getAll() {
+      const db = await open();
+      const store = db.transaction(STORE_NAME, 'readonly').objectStore(STORE_NAME);
+      // 同じトランザクション内の getAllKeys と getAll は同じキー順
+      const [keys, values] = await Promise.all([
+        requestToPromise(store.getAllKeys()),
+        requestToPromise(store.getAll())
+      ]);
+      return new Map(keys.map((key, i): [string, Uint8Array] => [String(key), values[i] as Uint8Array]));
+    },
+
+    async update(key, updater) {
+      const db = await open();
+      const transaction = db.transaction(STORE_NAME, 'readwrite');
+      const store = transaction.objectStore(STORE_NAME);
+      const request = store.get(key);
+      request.onsuccess = () => {
+        store.put(updater(request.result), key);
+      };
+      await transactionDone(transaction);
+    },
+
+    async putMany(entries) {
+      const db = await open();
+      const transaction = db.transaction(STORE_NAME, 'readwrite');
+      const store = transaction.objectStore(STORE_NAME);
+      entries.forEach((chunk, key) => {
+        store.put(chunk, key);
+      });
+      await transactionDone(transaction);
+    }
+  };
+}
+
+/**
+ * メモリ上の保存先を作成（テスト・IndexedDB が使えない環境用）
+ */
+export function createMemoryChunkStore(): ChunkStore {
+  const data = new Map<string, Uint8Array>();
+
+  return {
+    async getAll() {
+      return new Map(Array.from(data, ([key, chunk]): [string, Uint8Array] => [key, chunk.slice()]));
+    },
+
+    async update(key, updater) {
+      data.set(key, updater(data.get(key)?.slice()));
+    },
+
+    async putMany(entries) {
+      entries.forEach((chunk, key) => data.set(key, chunk.slice()));
+    }
+  };
+}
+
+let defaultStore: ChunkStore | null | undefined;
+
+/**
+ * アプリで使う保存先（IndexedDB が使えない環境ではnull）
+ */
+export function getReadingStateStore(): ChunkStore | null {
+  if (defaultStore === undefined) {
+    defaultStore = typeof indexedDB !== 'undefined' ? createIndexedDbChunkStore() : null;
+  }
+  return defaultStore;
+}
+
+/**
+ * アプリで使う保存先を差し替え（テスト用）
+ */
+export function setReadingStateStore(store: ChunkStore | null): void {
+  defaultStore = store;
+}
+
+// 記事配列ごとの 記事ID → 通し番号（記事が変わるまで再計算しない）
+const numberIndexCache = new WeakMap<Article[], Map<string, number>>();
+
+/**
+ * 記事ID → 通し番号の対応表
+ * 通し番号のない記事配列は addArticleNumbers と同じ規則（非表示を除いて日付昇順）で振る
+ *
+ * @param articles - 記事配列
+ */
+export function getNumberIndex(articles: Article[]): Map<string, number> {
+  let index = numberIndexCache.get(articles);
+  if (!index) {
+    const numbered = articles.every(article => article.number)
+      ? articles
+      : addArticleNumbers(articles);
+    index = new Map(numbered.map((article): [string, number] => [article.id, article.number as number]));
+    numberIndexCache.set(articles, index);
+  }
+  return index;
+}
+
+/**
+ * 1件の状態を保存（該当する1チャンクのみ書き込み）
+ *
+ * @param store - 保存先
+ * @param kind - 状態の種類
+ * @param number - 通し番号
+ * @param value - 読了済み・お気に入り登録済みか
+ */
+export function writeReadingBit(
+  store: ChunkStore,
+  kind: ReadingKind,
+  number: number,
+  value: boolean
+): Promise<void> {
+  const { chunk } = locateBit(number);
+  return store.update(chunkKey(kind, chunk), current => setChunkBit(current, number, value));
+}
+
+/**
+ * 保存済みの状態を読み込み
+ *
+ * @param store - 保存先
+ * @returns 種類ごとの通し番号、一度も保存していない場合はnull
+ */
+export async function loadReadingNumbers(store: ChunkStore): Promise<ReadingNumbers | null> {
+  const chunks = await store.getAll();
+  if (chunks.size === 0) {
+    return null;
+  }
+
+  const numbers: ReadingNumbers = { read: [], favorite: [] };
+  chunks.forEach((chunk, key) => {
+    const parsed = parseChunkKey(key);
+    if (parsed) {
+      numbers[parsed.kind].push(...decodeBitset(chunk, parsed.chunk * BITSET_CHUNK_BITS));
+    }
+  });
+  READING_KINDS.forEach(kind => numbers[kind].sort((a, b) => a - b));
+  return numbers;
+}
+
+/**
+ * 状態をまとめて置き換え（インポート・localStorage からの移行用）
+ *
+ * @param store - 保存先
+ * @param numbers - 種類ごとの通し番号
+ */
+export async function replaceReadingNumbers(store: ChunkStore, numbers: ReadingNumbers): Promise<void> {
+  const entries = new Map<string, Uint8Array>();
+
+  // 既存のチャンクは0で上書き（保存済みの記録は残す）
+  (await store.getAll()).forEach((_, key) => entries.set(key, new Uint8Array(BITSET_CHUNK_BYTES)));
+
+  READING_KINDS.forEach(kind => {
+    splitBitset(encodeBitset(numbers[kind])).forEach((chunk, index) => {
+      entries.set(chunkKey(kind, index), chunk);
+    });
+  });
+
+  await store.putMany(entries);
+}
+
+/**
+ * エクスポート形式の文字列に変換
+ *
+ * @param numbers - 種類ごとの通し番号
+ */
+export function serializeReadingState(numbers: ReadingNumbers): string {
+  const data: ReadingStateExport = {
+    format: EXPORT_FORMAT,
+    version: EXPORT_VERSION,
+    read: bytesToBase64(encodeBitset(numbers.read)),
+    favorite: bytesToBase64(encodeBitset(numbers.favorite))
+  };
+  return JSON.stringify(data);
+}
+
+/**
+ * エクスポート形式の文字列を読み込み
+ *
+ * @param text - serializeReadingState の出力
+ * @returns 種類ごとの通し番号
+ * @throws 形式が正しくない場合
+ */
+export function parseReadingState(text: string): ReadingNumbers {
+  let data: Partial<ReadingStateExport>;
+  try {
+    data = JSON.parse(text);
+  } catch {
+    throw new Error('Invalid reading state export: not JSON');
+  }
+
+  if (!data || data.format !== EXPORT_FORMAT || data.version !== EXPORT_VERSION) {
+    throw new Error('Invalid reading state export: unsupported format');
+  }
+
+  const numbers: ReadingNumbers = { read: [], favorite: [] };
+  for (const kind of READING_KINDS) {
+    const value = data[kind];
+    if (typeof value !== 'string') {
+      throw new Error(`Invalid reading state export: missing ${kind}`);
+    }
+    try {
+      numbers[kind] = decodeBitset(base64ToBytes(value));
+    } catch {
+      throw new Error(`Invalid reading state export: broken ${kind}`);
+    }
+  }
+  return numbers;
+}
@@ -4,6 +4,7 @@ hidden フラグ付与スクリプト（順次処理版）
 259件の事務連絡系記事に hidden: true を設定
 
 重要: 各ステップ後に表示記事の通し番号を振り直す
+（各ステップはジェネレーターで、直前のステップ後の通し番号を走査しながら数える。publish_pipeline.py からも利用）
 """
 
 import json
@@ -35,6 +36,92 @@ def assign_numbers(articles):
     visible = get_visible_articles(articles)
     return {article['id']: i + 1 for i, article in enumerate(visible)}
 
+# --- ストリーミング処理用のステージ（日付昇順の記事を1件ずつ受け取り、1件ずつ返すジェネレーター） ---
+# 通し番号は「それまでに流れてきた表示中の記事数」で決まるため、全件を読み込まずに判定できる
+
+def reset_hidden(articles):
+    """全記事のhiddenフラグを初期化"""
+    for article in articles:
+        article['hidden'] = False
+        yield article
+
+def hide_by_category(articles, categories, stats, label):
+    """カテゴリーで非表示にする"""
+    stats.setdefault(label, 0)
+    for article in articles:
+        if not article.get('hidden') and article.get('category') in categories:
+            article['hidden'] = True
+            stats[label] += 1
+        yield article
+
+def hide_by_title_keywords(articles, keywords, stats, label):
+    """タイトルにキーワードを含む表示中の記事を非表示にする"""
+    stats.setdefault(label, 0)
+    for article in articles:
+        if not article.get('hidden'):
+            title = article.get('title', '')
+            if any(keyword in title for keyword in keywords):
+                article['hidden'] = True
+                stats[label] += 1
+        yield article
+
+def hide_by_numbers(articles, numbers, stats, label):
+    """このステップ直前の通し番号で指定された記事を非表示にする"""
+    stats.setdefault(label, 0)
+    excluded = set(numbers)
+    number = 0
+    for article in articles:
+        if not article.get('hidden'):
+            number += 1
+            if number in excluded:
+                article['hidden'] = True
+                stats[label] += 1
+        yield article
+
+def hide_by_ids(articles, hidden_ids, stats, label='記事ID指定'):
+    """記事IDで指定された記事を非表示にする（IDは再実行しても変わらないため、他の処理と順序を問わない）"""
+    stats.setdefault(label, 0)
+    for article in articles:
+        if not article.get('hidden') and article.get('id') in hidden_ids:
+            article['hidden'] = True
+            stats[label] += 1
+        yield article
+
+def number_visible(articles):
+    """表示中の記事に通し番号（number）を付与（非表示の記事からは削除）"""
+    number = 0
+    for article in articles:
+        if article.get('hidden'):
+            article.pop('number', None)
+        else:
+            number += 1
+            article['number'] = number
+        yield article
+
+# ステップ1〜8（ラベル, ステージ, 条件）
+RULE_STEPS = [
+    ('Step1_カテゴリー', hide_by_category, EXCLUDED_CATEGORIES),
+    ('Step2_キーワード第1弾', hide_by_title_keywords, TITLE_KEYWORDS_STEP2),
+    ('Step3_通し番号', hide_by_numbers, EXCLUDED_NUMBERS_STEP3),
+    ('Step4_通し番号', hide_by_numbers, EXCLUDED_NUMBERS_STEP4),
+    ('Step5_通し番号', hide_by_numbers, EXCLUDED_NUMBERS_STEP5),
+    ('Step6_キーワード第2弾', hide_by_title_keywords, TITLE_KEYWORDS_STEP6),
+    ('Step7-8_通し番号', hide_by_numbers, EXCLUDED_NUMBERS_STEP8),
+]
+
+def hide_by_rules(articles, stats):
+    """ステップ1〜8の除外ルールを順に適用（各ステップの通し番号は直前のステップ後の番号）"""
+    articles = reset_hidden(articles)
+    for label, stage, condition in RULE_STEPS:
+        stats.setdefault(label, 0)  # 表示順をステップ順にする
+        articles = stage(articles, condition, stats, label)
+    return articles
+
+def load_hidden_ids(path: str):
+    """add_hidden_flags.py の出力から非表示の記事IDを読み込む"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return {article['id'] for article in json.load(f) if article.get('hidden')}
+
 def add_hidden_flags(input_path: str, output_path: str):
     """hiddenフラグを順次処理で付与"""
 
@@ -44,119 +131,9 @@ def add_hidden_flags(input_path: str, output_path: str):
 
     print(f"総記事数: {len(articles)}件\n")
 
-    # 日付順にソート
-    sorted_articles = sorted(articles, key=lambda a: a.get('date', ''))
-
-    # 全記事のhiddenフラグを初期化
-    for article in sorted_articles:
-        article['hidden'] = False
-
+    # 日付順にソートし、ステップ1〜8を1回の走査で適用
     hidden_by_step = {}
-
-    # ステップ1: カテゴリー除外
-    print("ステップ1: カテゴリー除外")
-    step1_count = 0
-    for article in sorted_articles:
-        if article.get('category') in EXCLUDED_CATEGORIES:
-            article['hidden'] = True
-            step1_count += 1
-    print(f"  除外: {step1_count}件")
-    print(f"  残り: {len(get_visible_articles(sorted_articles))}件\n")
-    hidden_by_step['Step1_カテゴリー'] = step1_count
-
-    # ステップ2: タイトルキーワード第1弾
-    print("ステップ2: タイトルキーワード第1弾")
-    numbers = assign_numbers(sorted_articles)
-    step2_count = 0
-    for article in sorted_articles:
-        if article.get('hidden'):
-            continue
-        title = article.get('title', '')
-        for keyword in TITLE_KEYWORDS_STEP2:
-            if keyword in title:
-                article['hidden'] = True
-                step2_count += 1
-                break
-    print(f"  除外: {step2_count}件")
-    print(f"  残り: {len(get_visible_articles(sorted_articles))}件\n")
-    hidden_by_step['Step2_キーワード第1弾'] = step2_count
-
-    # ステップ3: 通し番号除外 (230, 788, 797)
-    print("ステップ3: 通し番号除外 (230, 788, 797)")
-    numbers = assign_numbers(sorted_articles)
-    step3_count = 0
-    for article in sorted_articles:
-        if article.get('hidden'):
-            continue
-        article_num = numbers.get(article['id'])
-        if article_num in EXCLUDED_NUMBERS_STEP3:
-            article['hidden'] = True
-            step3_count += 1
-    print(f"  除外: {step3_count}件")
-    print(f"  残り: {len(get_visible_articles(sorted_articles))}件\n")
-    hidden_by_step['Step3_通し番号'] = step3_count
-
-    # ステップ4: 通し番号除外 (571, 915, 942, 967, 994)
-    print("ステップ4: 通し番号除外 (571, 915, 942, 967, 994)")
-    numbers = assign_numbers(sorted_articles)
-    step4_count = 0
-    for article in sorted_articles:
-        if article.get('hidden'):
-            continue
-        article_num = numbers.get(article['id'])
-        if article_num in EXCLUDED_NUMBERS_STEP4:
-            article['hidden'] = True
-            step4_count += 1
-    print(f"  除外: {step4_count}件")
-    print(f"  残り: {len(get_visible_articles(sorted_articles))}件\n")
-    hidden_by_step['Step4_通し番号'] = step4_count
-
-    # ステップ5: 通し番号除外 (698-1003)
-    print("ステップ5: 通し番号除外 (698-1003)")
-    numbers = assign_numbers(sorted_articles)
-    step5_count = 0
-    for article in sorted_articles:
-        if article.get('hidden'):
-            continue
-        article_num = numbers.get(article['id'])
-        if article_num in EXCLUDED_NUMBERS_STEP5:
-            article['hidden'] = True
-            step5_count += 1
-    print(f"  除外: {step5_count}件")
-    print(f"  残り: {len(get_visible_articles(sorted_articles))}件\n")
-    hidden_by_step['Step5_通し番号'] = step5_count
-
-    # ステップ6: タイトルキーワード第2弾
-    print("ステップ6: タイトルキーワード第2弾")
-    numbers = assign_numbers(sorted_articles)
-    step6_count = 0
-    for article in sorted_articles:
-        if article.get('hidden'):
-            continue
-        title = article.get('title', '')
-        for keyword in TITLE_KEYWORDS_STEP6:
-            if keyword in title:
-                article['hidden'] = True
-                step6_count += 1
-                break
-    print(f"  除外: {step6_count}件")
-    print(f"  残り: {len(get_visible_articles(sorted_articles))}件\n")
-    hidden_by_step['Step6_キーワード第2弾'] = step6_count
-
-    # ステップ7-8: 通し番号除外 (461, 842, 843, 862)
-    print("ステップ7-8: 通し番号除外 (461, 842, 843, 862)")
-    numbers = assign_numbers(sorted_articles)
-    step78_count = 0
-    for article in sorted_articles:
-        if article.get('hidden'):
-            continue
-        article_num = numbers.get(article['id'])
-        if article_num in EXCLUDED_NUMBERS_STEP8:
-            article['hidden'] = True
-            step78_count += 1
-    print(f"  除外: {step78_count}件")
-    print(f"  残り: {len(get_visible_articles(sorted_articles))}件\n")
-    hidden_by_step['Step7-8_通し番号'] = step78_count
+    sorted_articles = list(hide_by_rules(sorted(articles, key=lambda a: a.get('date', '')), hidden_by_step))
 
     # 結果を保存
     with open(output_path, 'w', encoding='utf-8') as f:
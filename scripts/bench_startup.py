@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+スクリプト起動時間のベンチマーク
+--help や「処理済みで何もしない」実行（cron での定期実行）が何ミリ秒で終わるかを計測
+
+使い方:
+    python3 scripts/bench_startup.py
+    python3 scripts/bench_startup.py --repeat 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPEAT = 10
+
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解釈"""
+    parser = argparse.ArgumentParser(description="スクリプト起動時間のベンチマーク")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="各ケースの実行回数")
+    return parser.parse_args()
+
+
+def script(name: str) -> str:
+    """scripts/ 内のスクリプトの絶対パス"""
+    return os.path.join(SCRIPTS_DIR, name)
+
+
+def prepare_noop_files(directory: str) -> Tuple[str, str, str, str]:
+    """全件処理済みの入力・出力ファイルを作成（何もせずに終了するケース用）"""
+    sys.path.insert(0, SCRIPTS_DIR)
+    from create_private_data import make_article_id
+
+    email = {"id": "bench", "subject": "件名", "date": "Mon, 03 Jan 2022 10:00:00 +0900", "body": "本文"}
+    article = {"id": make_article_id(email), "title": "件名", "content": "本文", "category": "感謝",
+               "date": "2022-01-03", "originalDate": email["date"], "createdAt": "2022-01-03T10:00:00",
+               "tags": ["感謝", "メンタル"]}
+
+    paths = [os.path.join(directory, name) for name in ("emails.json", "private.json", "input.json", "public.json")]
+    for path, data in zip(paths, ([email], [article], [article], [article])):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+    return tuple(paths)
+
+
+def measure(command: List[str], repeat: int) -> List[float]:
+    """コマンドを繰り返し実行し、1回ごとの所要時間（ミリ秒）を返す"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=SCRIPTS_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    """メイン処理"""
+    args = parse_args()
+    python = sys.executable
+
+    with tempfile.TemporaryDirectory() as directory:
+        emails, private, public_input, public_output = prepare_noop_files(directory)
+        checkpoint = os.path.join(directory, "checkpoint.json")
+        cases = [
+            ("Python 起動のみ（基準）", [python, "-c", "pass"]),
+            ("create_public_data.py --help", [python, script("create_public_data.py"), "--help"]),
+            ("create_public_data.py 処理済み", [python, script("create_public_data.py"), "--input", public_input,
+                                               "--output", public_output, "--checkpoint", checkpoint]),
+            ("create_private_data.py --help", [python, script("create_private_data.py"), "--help"]),
+            ("create_private_data.py 処理済み", [python, script("create_private_data.py"), "--input", emails,
+                                                "--output", private]),
+            ("fetch_gmail_messages 読み込み", [python, "-c", "import fetch_gmail_messages"]),
+        ]
+
+        print(f"起動時間（{args.repeat}回の中央値 / 最小、ミリ秒）")
+        for label, command in cases:
+            timings = measure(command, args.repeat)
+            print(f"  {statistics.median(timings):7.1f} / {min(timings):7.1f}  {label}")
+
+
+if __name__ == "__main__":
+    main()
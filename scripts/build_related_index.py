@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+関連記事インデックス作成スクリプト
+表示中の記事を文字n-gram TF-IDF でベクトル化し、コサイン類似度の上位k件を事前計算する
+
+- publish_pipeline.py の出力を読み込み、アプリと同じ通し番号（number）をそのまま使う
+  （クリーニング時のタイトル非表示も反映済みのため、番号を振り直さない）
+- 類似度はブロック単位の行列積で計算するため、記事数 N の N × N 行列は作らない
+  （メモリ使用量は BLOCK_SIZE × N の類似度ブロックと疎行列分で、記事数に比例して増える）
+- 出力: {"k": 5, "neighbors": [[通し番号...], ...]}（neighbors[n - 1] が通し番号 n の関連記事）
+
+使い方:
+    python3 scripts/build_related_index.py
+    python3 scripts/build_related_index.py --input /tmp/articles-app.json --k 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+import text_features
+
+# --- 設定 ---
+INPUT_PATH = "public/articles-app.json"  # publish_pipeline.py の出力（読み込みのみ）
+OUTPUT_PATH = "public/related.json"
+TOP_K = 5
+BLOCK_SIZE = 512  # 1回の行列積で処理する記事数（メモリ使用量 ≈ BLOCK_SIZE × 記事数 × 8バイト）
+MAX_TEXT_CHARS = 3000  # ベクトル化に使う本文の最大文字数
+
+
+# --- 関数定義 ---
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解釈"""
+    parser = argparse.ArgumentParser(description="関連記事インデックス作成")
+    parser.add_argument("--input", default=INPUT_PATH, help="通し番号付き記事JSON（publish_pipeline.py の出力）")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="関連記事インデックスの出力先")
+    parser.add_argument("--k", type=int, default=TOP_K, help="1記事あたりの関連記事数")
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE, help="ブロック行列積の行数")
+    return parser.parse_args()
+
+
+def article_text(article: dict) -> str:
+    """ベクトル化用のテキスト（タイトル + 本文先頭）"""
+    return f"{article.get('title', '')}\n{article.get('content', '')[:MAX_TEXT_CHARS]}"
+
+
+def top_k_neighbors(matrix, k: int, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """
+    L2正規化済み行列の各行について、コサイン類似度上位k件の行番号を返す（自分自身は除く）
+
+    Returns:
+        (行数 × k) の配列（類似度の高い順）
+    """
+    count = matrix.shape[0]
+    k = min(k, count - 1)
+    neighbors = np.zeros((count, max(k, 0)), dtype=np.int64)
+    if k <= 0:
+        return neighbors
+
+    transposed = matrix.T.tocsc()
+    for start in range(0, count, block_size):
+        stop = min(start + block_size, count)
+        similarity = (matrix[start:stop] @ transposed).toarray()
+        similarity[np.arange(stop - start), np.arange(start, stop)] = -np.inf  # 自分自身を除外
+
+        candidates = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(similarity, candidates, axis=1)
+        order = np.argsort(-scores, axis=1, kind="stable")
+        neighbors[start:stop] = np.take_along_axis(candidates, order, axis=1)
+    return neighbors
+
+
+def build_related_index(articles: List[dict], k: int, block_size: int = BLOCK_SIZE) -> dict:
+    """表示中の記事（通し番号あり・hidden なし）の関連記事インデックスを作成"""
+    visible = sorted(
+        (a for a in articles if a.get("number") and not a.get("hidden")),
+        key=lambda a: a["number"],
+    )
+    ordered_numbers = np.array([a["number"] for a in visible], dtype=np.int64)
+
+    matrix, _, _ = text_features.fit_transform([article_text(a) for a in visible])
+    neighbor_rows = top_k_neighbors(matrix, k, block_size)
+
+    neighbors: List[List[int]] = [[] for _ in range(int(ordered_numbers.max(initial=0)))]
+    for row, number in enumerate(ordered_numbers):
+        neighbors[number - 1] = ordered_numbers[neighbor_rows[row]].tolist()
+    return {"k": neighbor_rows.shape[1], "neighbors": neighbors}
+
+
+def main():
+    """メイン処理"""
+    args = parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"エラー: {args.input} が見つかりません（先に publish_pipeline.py を実行してください）")
+        sys.exit(1)
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+
+    started = time.perf_counter()
+    index = build_related_index(articles, args.k, args.block_size)
+    elapsed = time.perf_counter() - started
+
+    # 配信用なので改行・空白なしで書き出す
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+
+    print(f"✅ 関連記事インデックス作成: {len(index['neighbors'])}件 × {index['k']}件（{elapsed:.2f}秒）")
+    print(f"💾 保存完了: {args.output}（{os.path.getsize(args.output) / 1024:.0f}KB）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+ローカルカテゴリー分類器（文字n-gram TF-IDF + 多クラスロジスティック回帰）
+Gemini が付与済みのカテゴリーで学習し、新しいメールのカテゴリーをオフラインで推定する
+
+使い方:
+    # 学習（ホールドアウト精度も表示）
+    python3 scripts/category_classifier.py train
+
+    # 推定（確信度がしきい値未満の記事は Gemini に回す対象として表示）
+    python3 scripts/category_classifier.py predict --input data/raw_emails.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+from scipy import optimize
+
+import text_features
+
+# --- 設定 ---
+TRAIN_PATH = "data/articles-private.json"
+MODEL_PATH = "data/category_model.npz"
+
+# 学習・推定対象のカテゴリー（それ以外のカテゴリーの記事は学習に使わない）
+CATEGORIES = ["自己受容", "目標設定", "習慣形成", "マインドセット", "人間関係", "感謝", "行動力"]
+
+MAX_TEXT_CHARS = 2000  # create_private_data.py と同じく本文先頭のみ使用
+NGRAM_RANGE = (1, 2)
+MIN_DF = 2
+MAX_FEATURES = 50000
+L2_PENALTY = 1e-4  # 正則化の強さ
+MAX_ITERATIONS = 300
+TEST_RATIO = 0.2
+RANDOM_SEED = 42
+MIN_CONFIDENCE = 0.6  # これ未満の確信度は Gemini に回す
+
+
+# --- 関数定義 ---
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解釈"""
+    parser = argparse.ArgumentParser(description="ローカルカテゴリー分類器")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    train = subparsers.add_parser("train", help="ラベル付き記事から学習し、ホールドアウト精度を表示")
+    train.add_argument("--input", default=TRAIN_PATH, help="学習データ（カテゴリー付き記事JSON）")
+    train.add_argument("--model", default=MODEL_PATH, help="モデルの保存先")
+    train.add_argument("--test-ratio", type=float, default=TEST_RATIO, help="評価用に除外する割合")
+    train.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE, help="確信度しきい値")
+
+    predict = subparsers.add_parser("predict", help="記事・メールのカテゴリーを推定")
+    predict.add_argument("--input", required=True, help="記事JSON（content）またはメールJSON（body）")
+    predict.add_argument("--model", default=MODEL_PATH, help="モデルのパス")
+    predict.add_argument("--output", default=None, help="推定結果JSONの出力先（省略時は表示のみ）")
+    predict.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE, help="確信度しきい値")
+    return parser.parse_args()
+
+
+def load_json(path: str) -> List[dict]:
+    """JSON配列ファイルを読み込む"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"{path} は配列形式ではありません")
+        return data
+
+
+def article_text(record: dict) -> str:
+    """記事（content）・メール（body）のどちらからも分類用テキストを取り出す"""
+    text = record.get("content") or record.get("body") or ""
+    return text[:MAX_TEXT_CHARS]
+
+
+def softmax(scores: np.ndarray) -> np.ndarray:
+    """行ごとのソフトマックス"""
+    shifted = scores - scores.max(axis=1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def fit_logistic_regression(features, labels: np.ndarray, class_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """多クラスロジスティック回帰（L2正則化）を L-BFGS で学習し、(重み, バイアス) を返す"""
+    sample_count, feature_count = features.shape
+    targets = np.zeros((sample_count, class_count))
+    targets[np.arange(sample_count), labels] = 1.0
+
+    def loss_and_gradient(params: np.ndarray) -> Tuple[float, np.ndarray]:
+        weights = params[:-class_count].reshape(feature_count, class_count)
+        bias = params[-class_count:]
+        probabilities = softmax(features @ weights + bias)
+        loss = -np.sum(targets * np.log(probabilities + 1e-12)) / sample_count
+        loss += 0.5 * L2_PENALTY * np.sum(weights * weights)
+        error = (probabilities - targets) / sample_count
+        grad_weights = features.T @ error + L2_PENALTY * weights
+        grad_bias = error.sum(axis=0)
+        return loss, np.concatenate([grad_weights.ravel(), grad_bias])
+
+    initial = np.zeros(feature_count * class_count + class_count)
+    result = optimize.minimize(
+        loss_and_gradient, initial, jac=True, method="L-BFGS-B",
+        options={"maxiter": MAX_ITERATIONS},
+    )
+    weights = result.x[:-class_count].reshape(feature_count, class_count)
+    bias = result.x[-class_count:]
+    return weights, bias
+
+
+def train_model(texts: List[str], labels: List[str]) -> Dict:
+    """テキストとカテゴリー名から分類モデルを作成"""
+    features, vocabulary, idf = text_features.fit_transform(texts, NGRAM_RANGE, MIN_DF, MAX_FEATURES)
+    label_indices = np.array([CATEGORIES.index(label) for label in labels])
+    weights, bias = fit_logistic_regression(features, label_indices, len(CATEGORIES))
+    return {
+        "vocabulary": vocabulary,
+        "idf": idf,
+        "weights": weights,
+        "bias": bias,
+        "categories": list(CATEGORIES),
+    }
+
+
+def save_model(path: str, model: Dict) -> None:
+    """モデルを .npz 形式で保存"""
+    terms = sorted(model["vocabulary"], key=model["vocabulary"].get)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(
+        path,
+        terms=np.array(terms),
+        idf=model["idf"],
+        weights=model["weights"],
+        bias=model["bias"],
+        categories=np.array(model["categories"]),
+    )
+
+
+def load_model(path: str) -> Dict:
+    """save_model で保存したモデルを読み込む"""
+    with np.load(path) as data:
+        terms = data["terms"].tolist()
+        return {
+            "vocabulary": {term: index for index, term in enumerate(terms)},
+            "idf": data["idf"],
+            "weights": data["weights"],
+            "bias": data["bias"],
+            "categories": data["categories"].tolist(),
+        }
+
+
+def predict_probabilities(model: Dict, texts: List[str]) -> np.ndarray:
+    """各カテゴリーの確率（文書数 × カテゴリー数）を返す"""
+    features = text_features.transform(texts, model["vocabulary"], model["idf"], NGRAM_RANGE)
+    return softmax(features @ model["weights"] + model["bias"])
+
+
+def predict_categories(model: Dict, records: List[dict]) -> List[Tuple[str, float]]:
+    """記事・メールごとに (カテゴリー, 確信度) を返す"""
+    if not records:
+        return []
+    probabilities = predict_probabilities(model, [article_text(r) for r in records])
+    best = probabilities.argmax(axis=1)
+    return [(model["categories"][index], float(probabilities[row, index]))
+            for row, index in enumerate(best)]
+
+
+def split_train_test(count: int, test_ratio: float) -> Tuple[np.ndarray, np.ndarray]:
+    """シード固定でシャッフルし、学習用・評価用のインデックスに分割"""
+    order = np.random.default_rng(RANDOM_SEED).permutation(count)
+    test_count = int(count * test_ratio)
+    return order[test_count:], order[:test_count]
+
+
+def print_report(model: Dict, test_records: List[dict], min_confidence: float) -> None:
+    """ホールドアウトデータでの精度レポートを表示"""
+    predictions = predict_categories(model, test_records)
+    actual = [r["category"] for r in test_records]
+    correct = [p == a for (p, _), a in zip(predictions, actual)]
+    confident = [c >= min_confidence for _, c in predictions]
+
+    total = len(test_records)
+    confident_count = sum(confident)
+    confident_correct = sum(1 for ok, conf in zip(correct, confident) if ok and conf)
+
+    print(f"\n📊 ホールドアウト評価（{total}件）:")
+    print(f"  全体精度: {sum(correct) / total * 100:.1f}%")
+    print(f"  確信度{min_confidence:.2f}以上: {confident_count}/{total}件"
+          f"（{confident_count / total * 100:.1f}%をローカル判定）")
+    if confident_count:
+        print(f"  うち精度: {confident_correct / confident_count * 100:.1f}%")
+    print(f"  Geminiに回す件数: {total - confident_count}件")
+
+    print("\n  カテゴリー別再現率:")
+    for category in model["categories"]:
+        rows = [ok for ok, a in zip(correct, actual) if a == category]
+        if rows:
+            print(f"    {category}: {sum(rows)}/{len(rows)}件 ({sum(rows) / len(rows) * 100:.1f}%)")
+
+
+def run_train(args: argparse.Namespace) -> None:
+    """学習・評価・保存"""
+    if not os.path.exists(args.input):
+        print(f"エラー: {args.input} が見つかりません")
+        sys.exit(1)
+
+    records = [r for r in load_json(args.input) if r.get("category") in CATEGORIES and article_text(r)]
+    print(f"学習対象: {len(records)}件（{len(CATEGORIES)}カテゴリー）")
+
+    train_indices, test_indices = split_train_test(len(records), args.test_ratio)
+    train_records = [records[i] for i in train_indices]
+    test_records = [records[i] for i in test_indices]
+
+    started = time.perf_counter()
+    model = train_model([article_text(r) for r in train_records], [r["category"] for r in train_records])
+    print(f"学習完了: {len(train_records)}件, 特徴量{len(model['vocabulary']):,}次元"
+          f"（{time.perf_counter() - started:.1f}秒）")
+
+    if test_records:
+        print_report(model, test_records, args.min_confidence)
+
+    # 評価後、全件で学習し直して保存
+    model = train_model([article_text(r) for r in records], [r["category"] for r in records])
+    save_model(args.model, model)
+    print(f"\n💾 全{len(records)}件で再学習したモデルを保存しました: {args.model}")
+
+
+def run_predict(args: argparse.Namespace) -> None:
+    """推定結果を表示・保存"""
+    if not os.path.exists(args.model):
+        print(f"エラー: {args.model} が見つかりません。先に train を実行してください")
+        sys.exit(1)
+
+    model = load_model(args.model)
+    records = load_json(args.input)
+
+    started = time.perf_counter()
+    predictions = predict_categories(model, records)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    results = []
+    for record, (category, confidence) in zip(records, predictions):
+        confident = confidence >= args.min_confidence
+        results.append({
+            "id": record.get("id"),
+            "category": category,
+            "confidence": round(confidence, 4),
+            "needsGemini": not confident,
+        })
+        mark = "✓" if confident else "?"
+        label = record.get("title") or record.get("subject") or record.get("id")
+        print(f"  {mark} {label} → {category} ({confidence:.2f})")
+
+    low_confidence = sum(1 for r in results if r["needsGemini"])
+    print(f"\n推定完了: {len(results)}件（{elapsed_ms:.0f}ms）、Geminiに回す件数: {low_confidence}件")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 保存完了: {args.output}")
+
+
+def main():
+    """メイン処理"""
+    args = parse_args()
+    if args.command == "train":
+        run_train(args)
+    else:
+        run_predict(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ import json
 import re
 from pathlib import Path
 
+SUMMARY_MIN_CHARS = 500  # 挨拶文除去後にこの文字数未満の本文は要約せずそのまま使用
+
 
 def should_hide_article(title: str) -> bool:
     """タイトルに基づいて非表示にすべきか判定"""
@@ -105,6 +107,44 @@ def clean_greeting_lines(content: str) -> str:
     return '\n'.join(cleaned_lines).strip()
 
 
+def needs_summary(content: str) -> bool:
+    """
+    要約が必要な長さの本文か判定（挨拶文除去後の文字数で判定）
+    create_public_data.py・create_private_data.py --combined で共通の基準
+    """
+    return len(clean_greeting_lines(content)) >= SUMMARY_MIN_CHARS
+
+
+def clean_stage(articles, stats, verbose=True):
+    """
+    記事を1件ずつクリーニングして返すジェネレーター（publish_pipeline.py からも利用）
+    stats の "hidden" / "cleaned" に件数を加算
+    """
+    stats.setdefault("hidden", 0)
+    stats.setdefault("cleaned", 0)
+    for article in articles:
+        title = article.get('title', '')
+        content = article.get('content', '')
+
+        # タイトルフィルタリング
+        if should_hide_article(title):
+            article['hidden'] = True
+            stats["hidden"] += 1
+            if verbose:
+                print(f"  🚫 非表示: {title}")
+
+        # 本文クリーニング
+        cleaned_content = clean_greeting_lines(content)
+
+        if cleaned_content != content:
+            article['content'] = cleaned_content
+            stats["cleaned"] += 1
+            if verbose:
+                print(f"  ✂️  クリーニング: {title[:30]}...")
+
+        yield article
+
+
 def main():
     # ファイルパス
     input_file = Path("public/articles-app.json")
@@ -116,31 +156,13 @@ def main():
         articles = json.load(f)
 
     total_articles = len(articles)
-    hidden_count = 0
-    cleaned_count = 0
+    stats = {}
 
     print(f"✅ 記事数: {total_articles}件")
     print("\n🔧 処理開始...")
 
     # 各記事を処理
-    for article in articles:
-        title = article.get('title', '')
-        content = article.get('content', '')
-
-        # タイトルフィルタリング
-        if should_hide_article(title):
-            article['hidden'] = True
-            hidden_count += 1
-            print(f"  🚫 非表示: {title}")
-
-        # 本文クリーニング
-        original_content = content
-        cleaned_content = clean_greeting_lines(content)
-
-        if cleaned_content != original_content:
-            article['content'] = cleaned_content
-            cleaned_count += 1
-            print(f"  ✂️  クリーニング: {title[:30]}...")
+    articles = list(clean_stage(articles, stats))
 
     # 結果を保存
     print(f"\n💾 保存中: {output_file}")
@@ -153,8 +175,8 @@ def main():
     print("📊 処理結果")
     print("="*50)
     print(f"総記事数: {total_articles}件")
-    print(f"非表示設定: {hidden_count}件")
-    print(f"本文クリーニング: {cleaned_count}件")
+    print(f"非表示設定: {stats['hidden']}件")
+    print(f"本文クリーニング: {stats['cleaned']}件")
     print(f"出力ファイル: {output_file}")
     print("="*50)
 
@@ -2,22 +2,23 @@
 """
 プライベート版データ作成スクリプト（バッチ処理対応版）
 Gemini APIでタイトル・カテゴリーを生成し、元本文を保持
+
+--combined を付けると、タイトル・カテゴリー・要約を1回のリクエストで生成し、
+プライベート版とパブリック版（create_public_data.py 相当）を同時に書き出す
 """
 
 import argparse
+import hashlib
 import json
 import os
 import sys
 import time
 import uuid
 from datetime import datetime
-from typing import List, Optional, Dict
-
-import requests
-from dotenv import load_dotenv
+from typing import Callable, List, Dict, Set, Tuple
 
-# .envファイルを読み込み
-load_dotenv()
+from clean_articles import needs_summary
+from gemini_client import GeminiClient, PartialWriter, recover_partial
 
 # --- 設定 ---
 DEFAULT_GEMINI_API_KEY = ""  # 環境変数 GEMINI_API_KEY を使用してください
@@ -28,9 +29,18 @@ INPUT_PATH = "data/raw_emails.json"
 OUTPUT_PATH = "data/articles-private.json"
 
 BATCH_SIZE = 50  # 1回のリクエストで処理するメール数
-API_RETRY_COUNT = 3
 MAX_BODY_CHARS = 2000  # 1メールあたりの最大文字数（トークン数考慮）
-REQUEST_TIMEOUT = 300  # バッチ処理のためタイムアウトを延長
+
+# 記事IDの名前空間（UUID v5）。変更すると全記事のIDが変わるため固定
+ARTICLE_ID_NAMESPACE = uuid.UUID("7872418a-ad44-4561-80d2-915e03bd362e")
+
+# --- 統合モード（--combined）: 1リクエストでプライベート版・パブリック版を同時生成 ---
+COMBINED_MODEL = "gemini-2.5-pro"  # 要約品質のためパブリック版と同じモデルを使用
+COMBINED_API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{COMBINED_MODEL}:generateContent"
+PUBLIC_OUTPUT_PATH = "data/articles-public.json"
+COMBINED_BATCH_SIZE = 20  # create_public_data.py と同じTPM制限を考慮
+COMBINED_MAX_BODY_CHARS = 100000  # 要約のため全文送信
+COMBINED_SLEEP_SECONDS = 15  # 無料版RPM=5対応
 
 # --- プロンプトテンプレート ---
 BATCH_PROMPT_TEMPLATE = """以下のメール本文リスト（JSON形式）を分析し、各メールに対してタイトルとカテゴリーを提案してください。
@@ -65,6 +75,42 @@ BATCH_PROMPT_TEMPLATE = """以下のメール本文リスト（JSON形式）を
 {emails_json}
 """
 
+COMBINED_PROMPT_TEMPLATE = """以下のメール本文リスト（JSON形式）を分析し、各メールに対してタイトル・カテゴリー・要約を作成してください。
+
+【タスク】
+- 各メールの本文を読んで、内容を理解する。
+- タイトル: 30文字以内で内容を表すタイトルを生成する。
+- カテゴリー: 次のリストから最も適切なものを1つ選択する（自己受容, 目標設定, 習慣形成, マインドセット, 人間関係, 感謝, 行動力）。
+- 本文: `summarize` の値に従って処理する。
+  ・`summarize` が true の場合: 筆者本人の視点（一人称）を保ちながら、必ず700文字以下に要約する
+  ・`summarize` が false の場合: 要約不要。`content` は空文字 "" にする（元の本文をそのまま使います）
+  ・ブログのように適度に改行を入れて読みやすくする
+
+【入力形式】
+- メール本文のリストがJSON形式で与えられます。各オブジェクトは `id`, `summarize`, `body` を持ちます。
+
+【出力形式】
+- **必ず、入力に対応するJSON配列のみを出力してください。**
+- 各オブジェクトには `id`, `title`, `category`, `content` を含めてください。
+- 説明や前置き、```json ... ```のようなマークダウンは一切含めないでください。
+
+【例】
+入力:
+[
+  {{ "id": 0, "summarize": true, "body": "..." }},
+  {{ "id": 1, "summarize": false, "body": "..." }}
+]
+
+期待する出力:
+[
+  {{ "id": 0, "title": "感謝の気持ちを伝える重要性", "category": "感謝", "content": "要約された本文..." }},
+  {{ "id": 1, "title": "新しい目標設定の方法", "category": "目標設定", "content": "" }}
+]
+
+【メール本文リスト】
+{emails_json}
+"""
+
 # --- 関数定義 ---
 
 def parse_args() -> argparse.Namespace:
@@ -74,10 +120,16 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--output", default=OUTPUT_PATH, help="出力JSONのパス")
     parser.add_argument("--limit", type=int, default=None, help="テスト用に処理件数を制限")
     parser.add_argument("--no-resume", action="store_true", help="既存の出力を無視して最初から実行")
+    parser.add_argument("--combined", action="store_true",
+                        help="タイトル・カテゴリー・要約を1回のリクエストで生成し、プライベート版とパブリック版を同時に出力")
+    parser.add_argument("--public-output", default=PUBLIC_OUTPUT_PATH, help="統合モードでのパブリック版出力パス")
     return parser.parse_args()
 
 def get_api_key() -> str:
-    """環境変数優先でAPIキーを取得"""
+    """環境変数（.envファイルを含む）優先でAPIキーを取得"""
+    from dotenv import load_dotenv  # 起動を速くするため、APIを呼ぶ時のみ読み込む
+
+    load_dotenv()
     key = os.environ.get("GEMINI_API_KEY", DEFAULT_GEMINI_API_KEY).strip()
     if not key:
         print("エラー: Gemini APIキーが設定されていません。環境変数 GEMINI_API_KEY を設定してください。")
@@ -101,54 +153,46 @@ def prepare_body(body: str) -> str:
     """Geminiに渡す本文を最大長に切り詰め"""
     return body[:MAX_BODY_CHARS] if len(body) > MAX_BODY_CHARS else body
 
-def call_gemini_batch(api_key: str, batch_emails: List[Dict]) -> Optional[List[Dict]]:
-    """Gemini APIをバッチで呼び出し、結果をパースして返す"""
-
-    # バッチ処理用のプロンプトを作成
-    emails_json = json.dumps([
-        {"id": i, "body": prepare_body(email.get("body", ""))}
-        for i, email in enumerate(batch_emails)
-    ], ensure_ascii=False)
-
-    prompt = BATCH_PROMPT_TEMPLATE.format(emails_json=emails_json)
-
-    headers = {"Content-Type": "application/json"}
-    payload = {
-        "contents": [{"parts": [{"text": prompt}]}],
-        "generationConfig": {
-            "response_mime_type": "application/json",
-        }
-    }
-
-    for attempt in range(API_RETRY_COUNT):
-        try:
-            response = requests.post(
-                f"{GEMINI_API_URL}?key={api_key}",
-                headers=headers,
-                json=payload,
-                timeout=REQUEST_TIMEOUT
-            )
-            if response.status_code == 200:
-                result = response.json()
-                text_content = result['candidates'][0]['content']['parts'][0]['text']
-                return json.loads(text_content)
-            else:
-                print(f"  APIエラー: Status {response.status_code}, Response: {response.text}")
-
-        except requests.RequestException as e:
-            print(f"  リクエストエラー: {e}")
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
-            print(f"  レスポンス解析エラー: {e}")
-            if 'result' in locals() and 'candidates' in result:
-                 print(f"  受け取ったテキスト: {result['candidates'][0]['content']['parts'][0]['text']}")
-
-
-        if attempt < API_RETRY_COUNT - 1:
-            wait = 2 ** attempt
-            print(f"  {wait}秒待機してリトライします...")
-            time.sleep(wait)
-
-    return None
+def call_gemini_batch(client: GeminiClient, batch_emails: List[Dict], on_result: Callable[[Dict], None]) -> List[int]:
+    """
+    Gemini APIをバッチで呼び出し、タイトル・カテゴリーを受信した順に on_result へ渡す
+
+    Returns:
+        結果を受け取れなかったメールのバッチ内の位置
+    """
+
+    def build_prompt(indices: List[int]) -> str:
+        # バッチ処理用のプロンプトを作成
+        emails_json = json.dumps([
+            {"id": i, "body": prepare_body(batch_emails[i].get("body", ""))}
+            for i in indices
+        ], ensure_ascii=False)
+        return BATCH_PROMPT_TEMPLATE.format(emails_json=emails_json)
+
+    missing, _ = client.generate_items(GEMINI_API_URL, build_prompt, range(len(batch_emails)), on_result)
+    return missing
+
+def call_gemini_combined_batch(client: GeminiClient, batch_emails: List[Dict], on_result: Callable[[Dict], None]) -> List[int]:
+    """
+    Gemini APIをバッチで呼び出し、タイトル・カテゴリー・要約を受信した順に on_result へ渡す
+
+    Returns:
+        結果を受け取れなかったメールのバッチ内の位置
+    """
+
+    def build_prompt(indices: List[int]) -> str:
+        emails_json = json.dumps([
+            {
+                "id": i,
+                "summarize": needs_summary(batch_emails[i].get("body", "")),
+                "body": batch_emails[i].get("body", "")[:COMBINED_MAX_BODY_CHARS],
+            }
+            for i in indices
+        ], ensure_ascii=False)
+        return COMBINED_PROMPT_TEMPLATE.format(emails_json=emails_json)
+
+    missing, _ = client.generate_items(COMBINED_API_URL, build_prompt, range(len(batch_emails)), on_result)
+    return missing
 
 def parse_email_date(date_str: str) -> str:
     """メール日付をYYYY-MM-DD形式に変換"""
@@ -159,12 +203,29 @@ def parse_email_date(date_str: str) -> str:
     except Exception:
         return datetime.now().strftime("%Y-%m-%d")
 
+def make_article_id(email: dict) -> str:
+    """
+    再実行しても変わらない記事IDを生成（UUID v5）
+
+    - GmailメッセージIDがあればそれを元にする
+    - ない場合、Message-ID ヘッダー（import_mbox.py の messageId）があれば別の名前空間で元にする
+    - どちらもない場合（過去データ等）は元の日付と本文のハッシュを元にする
+    """
+    message_id = email.get("id")
+    if message_id:
+        return str(uuid.uuid5(ARTICLE_ID_NAMESPACE, f"gmail:{message_id}"))
+    header_id = email.get("messageId")
+    if header_id:
+        return str(uuid.uuid5(ARTICLE_ID_NAMESPACE, f"msgid:{header_id}"))
+    digest = hashlib.sha256(f"{email.get('date', '')}\n{email.get('body', '')}".encode("utf-8")).hexdigest()
+    return str(uuid.uuid5(ARTICLE_ID_NAMESPACE, f"sha256:{digest}"))
+
 def build_article(email: dict, title: str, category: str) -> dict:
     """記事データの辞書構築"""
     date = parse_email_date(email.get("date", ""))
     safe_title = title[:50] if title else "タイトルなし"
     return {
-        "id": str(uuid.uuid4()),
+        "id": make_article_id(email),
         "title": safe_title,
         "content": email.get("body", ""),
         "category": category or "未分類",
@@ -174,6 +235,61 @@ def build_article(email: dict, title: str, category: str) -> dict:
         "tags": [category, "メンタル"] if category else ["メンタル"],
     }
 
+def build_public_article(private_article: dict, summary: str) -> dict:
+    """プライベート版記事から同じIDのパブリック版記事を構築"""
+    body = private_article["content"]
+    content = summary if needs_summary(body) and summary else body
+    return {
+        "id": private_article["id"],
+        "title": private_article["title"],
+        "content": content,
+        "category": private_article["category"],
+        "date": private_article["date"],
+        "originalDate": private_article["originalDate"],
+        "createdAt": private_article["createdAt"],
+        "tags": private_article["tags"],
+    }
+
+def index_articles(articles: List[dict]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """記事ID → 位置、本文 → 位置の対応表（同じキーは先頭の記事）"""
+    by_id: Dict[str, int] = {}
+    by_content: Dict[str, int] = {}
+    for i, article in enumerate(articles):
+        by_id.setdefault(article.get("id"), i)
+        by_content.setdefault(article.get("content"), i)
+    return by_id, by_content
+
+def add_article(
+    articles: List[dict],
+    article: dict,
+    index: Tuple[Dict[str, int], Dict[str, int]],
+    replace_ids: Set[str] = frozenset(),
+) -> None:
+    """
+    記事を追加し、index_articles() の対応表も更新する
+    replace_ids を指定した場合は、そのIDの記事、または本文が同じ記事（ID 導入前の出力）を置き換える
+    """
+    by_id, by_content = index
+    position = None
+    if replace_ids:
+        candidates = [by_id[i] for i in replace_ids if i in by_id]
+        if article["content"] in by_content:
+            candidates.append(by_content[article["content"]])
+        position = min(candidates, default=None)
+
+    if position is None:
+        position = len(articles)
+        articles.append(article)
+    else:
+        replaced = articles[position]
+        if by_id.get(replaced.get("id")) == position:
+            del by_id[replaced.get("id")]
+        if by_content.get(replaced.get("content")) == position:
+            del by_content[replaced.get("content")]
+        articles[position] = article
+    by_id.setdefault(article["id"], position)
+    by_content.setdefault(article["content"], position)
+
 def main():
     """メイン処理"""
     args = parse_args()
@@ -191,6 +307,15 @@ def main():
         print("処理対象のメールがありません")
         return
 
+    # 前回バッチの途中で中断していた場合、受信済みの記事を出力に取り込む（--no-resume では破棄）
+    for path in [args.output] + ([args.public_output] if args.combined else []):
+        if args.no_resume:
+            PartialWriter(path).clear()
+            continue
+        recovered = recover_partial(path)
+        if recovered:
+            print(f"前回の途中経過から{recovered}件を {path} に取り込みました")
+
     existing_articles: List[dict] = []
     if not args.no_resume and os.path.exists(args.output):
         try:
@@ -198,8 +323,31 @@ def main():
         except Exception as e:
             print(f"  既存ファイルの読み込みに失敗: {e}。新規で作り直します")
 
-    processed_bodies = {article.get('content') for article in existing_articles}
-    remaining_emails = [email for email in emails if email.get('body') not in processed_bodies]
+    # 統合モードではパブリック版も同じ進捗で書き出す
+    public_articles: List[dict] = []
+    if args.combined and not args.no_resume and os.path.exists(args.public_output):
+        try:
+            public_articles = load_json(args.public_output)
+        except Exception as e:
+            print(f"  既存パブリック版の読み込みに失敗: {e}。新規で作り直します")
+
+    # 統合モードではプライベート版・パブリック版の両方にある記事のみ処理済みとする
+    # パブリック版は要約で本文が異なるため、ID 移行前の記事はプライベート版の本文から旧IDを引いて照合する
+    processed_ids = {article.get('id') for article in existing_articles}
+    legacy_ids = {article.get('content'): article.get('id') for article in existing_articles}
+    public_ids = {article.get('id') for article in public_articles}
+
+    def previous_ids(email: dict) -> Set[str]:
+        """出力済みの記事で使われている可能性のあるID（現在のID・本文が同じプライベート版の旧ID）"""
+        return {make_article_id(email), legacy_ids.get(email.get('body'))} - {None}
+
+    def is_processed(email: dict) -> bool:
+        ids = previous_ids(email)
+        if not ids & processed_ids:
+            return False
+        return not args.combined or bool(ids & public_ids)
+
+    remaining_emails = [email for email in emails if not is_processed(email)]
 
     processed_count = total_count - len(remaining_emails)
 
@@ -207,46 +355,69 @@ def main():
         print(f"既に {processed_count}/{total_count} 件処理済みです。追加処理はありません")
         return
 
-    api_key = get_api_key()
+    client = GeminiClient(get_api_key())
     articles = existing_articles
-
-    print(f"処理開始: 残り{len(remaining_emails)}件のメールを{BATCH_SIZE}件ずつのバッチで処理します")
-
-    for i in range(0, len(remaining_emails), BATCH_SIZE):
-        batch_emails = remaining_emails[i:i + BATCH_SIZE]
+    # 置き換え対象を線形探索しないよう、対応表はバッチ処理の前に1回だけ作る
+    article_index = index_articles(articles)
+    public_index = index_articles(public_articles)
+    partial = PartialWriter(args.output)
+    public_partial = PartialWriter(args.public_output)
+
+    batch_size = COMBINED_BATCH_SIZE if args.combined else BATCH_SIZE
+    mode_label = "統合モード（タイトル・カテゴリー・要約）" if args.combined else "タイトル・カテゴリー生成"
+    print(f"処理開始[{mode_label}]: 残り{len(remaining_emails)}件のメールを{batch_size}件ずつのバッチで処理します")
+
+    for i in range(0, len(remaining_emails), batch_size):
+        batch_emails = remaining_emails[i:i + batch_size]
         start_index = processed_count + i
 
         print(f"\n[{start_index + 1}-{start_index + len(batch_emails)}/{total_count}] バッチ処理中...")
 
-        results = call_gemini_batch(api_key, batch_emails)
-
-        if not results:
-            print("  このバッチの処理に失敗しました。スキップします。")
-            continue
-
-        for res in results:
+        def add_result(res: Dict) -> None:
+            """1件分の結果から記事を作成し、途中経過ファイルに追記"""
             try:
-                original_email_index = res['id']
-                original_email = batch_emails[original_email_index]
+                original_email = batch_emails[res['id']]
 
                 title = res.get("title", original_email.get("subject", "タイトル未設定"))
                 category = res.get("category", "マインドセット")
 
                 article = build_article(original_email, title, category)
-                articles.append(article)
+                # 片方の出力にだけ残っていた記事は置き換える（重複させない）
+                replace_ids = previous_ids(original_email) & (processed_ids | public_ids)
+                add_article(articles, article, article_index, replace_ids)
+                partial.write(article)
+
+                if args.combined:
+                    public_article = build_public_article(article, res.get("content", ""))
+                    add_article(public_articles, public_article, public_index, replace_ids)
+                    public_partial.write(public_article)
+                    print(f"  ✓ {article['title']} ({category}, {len(public_article['content'])}文字)")
+                else:
+                    print(f"  ✓ {article['title']} ({category})")
+
+            except (IndexError, KeyError, TypeError) as e:
+                print(f"  結果の処理中にエラー: {e} - スキップします")
 
-                print(f"  ✓ {article['title']} ({category})")
+        if args.combined:
+            missing = call_gemini_combined_batch(client, batch_emails, add_result)
+        else:
+            missing = call_gemini_batch(client, batch_emails, add_result)
 
-            except (IndexError, KeyError) as e:
-                print(f"  結果の処理中にエラー: {e} - スキップします")
-                continue
+        if missing:
+            print(f"  {len(missing)}件の処理に失敗しました。スキップします。")
 
         save_articles(args.output, articles)
+        if args.combined:
+            save_articles(args.public_output, public_articles)
+        partial.clear()
+        public_partial.clear()
         print(f"  進捗保存: {len(articles)}件を書き出しました")
 
-        time.sleep(1)
+        time.sleep(COMBINED_SLEEP_SECONDS if args.combined else 1)
 
     print(f"\n完了: {len(articles)}件の記事を {args.output} に保存しました")
+    if args.combined:
+        print(f"      {len(public_articles)}件のパブリック版を {args.public_output} に保存しました")
 
     categories: dict = {}
     for article in articles:
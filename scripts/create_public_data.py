@@ -2,6 +2,15 @@
 """
 パブリック版データ作成スクリプト（バッチ処理版）
 Gemini API（gemini-2.5-pro）で700文字程度に要約
+
+500文字未満の記事（挨拶文除去後）は要約せずローカルでそのまま使用し、
+タイトル・カテゴリーのみ軽量バッチ（gemini-2.5-flash）で生成する
+
+--engine local ではローカル抽出型要約（local_summarizer.py）のみで作成し、
+Gemini のバッチが失敗した場合も自動でローカル要約に切り替える
+
+--repair では出力済みの記事から規則違反（700文字超・本文なし・カテゴリー不正・タイトル30文字超）のみを
+より厳しいプロンプトで再生成し、記事IDで置き換える
 """
 
 import argparse
@@ -9,27 +18,82 @@ import json
 import os
 import sys
 import time
-from typing import List, Optional, Dict
-
-import requests
-from dotenv import load_dotenv
+from datetime import datetime
+from typing import Callable, List, Optional, Dict, Tuple
 
-# .envファイルを読み込み
-load_dotenv()
+from clean_articles import needs_summary
+from gemini_client import GeminiClient, PartialWriter, recover_partial
 
 # --- 設定 ---
 DEFAULT_GEMINI_API_KEY = ""  # 環境変数 GEMINI_API_KEY を使用してください
 GEMINI_MODEL = "gemini-2.5-pro"
 GEMINI_API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent"
+LIGHT_MODEL = "gemini-2.5-flash"  # 短い記事のタイトル・カテゴリー生成用
+LIGHT_API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{LIGHT_MODEL}:generateContent"
 
 INPUT_PATH = "data/input.json"
 OUTPUT_PATH = "public/short.json"
 
 BATCH_SIZE = 20  # 1回のリクエストで処理する記事数（TPM制限考慮: 20件×1000トークン+500=20,500トークン/リクエスト）
-API_RETRY_COUNT = 3
 MAX_BODY_CHARS = 100000  # 1記事あたりの最大文字数（制限なし・全文送信）
-REQUEST_TIMEOUT = 300  # バッチ処理のためタイムアウトを延長
 SLEEP_SECONDS = 15  # API制限対応: 無料版RPM=5 → 60秒÷5=12秒+処理時間考慮=15秒（安全マージン）
+CHECKPOINT_PATH = "data/public_checkpoint.json"  # 予算停止時の再開用チェックポイント
+
+LIGHT_BATCH_SIZE = 50  # 軽量バッチ（タイトル・カテゴリーのみ）の件数
+LIGHT_MAX_BODY_CHARS = 2000  # 軽量バッチで渡す本文の最大文字数
+LIGHT_SLEEP_SECONDS = 6  # gemini-2.5-flash 無料版RPM=10対応
+
+# --- トークン見積もり ---
+CHARS_PER_TOKEN = 1.0  # 日本語は概ね1文字≈1トークン（安全側の見積もり）
+SUMMARY_MAX_CHARS = 700  # 要約後の最大文字数
+OUTPUT_OVERHEAD_TOKENS = 60  # 1記事あたりのタイトル・カテゴリー・JSON構造分
+
+# --- 出力の規則（--repair で検査） ---
+TITLE_MAX_CHARS = 30
+VALID_CATEGORIES = ["自己受容", "目標設定", "習慣形成", "マインドセット", "人間関係", "感謝", "行動力"]
+REPAIR_TARGET_CHARS = 650  # 再要約では上限より短い文字数を指示（超過の再発防止）
+
+# バッチ種別ごとの設定（料金は200kトークン以下のプロンプト、USD / 100万トークン、出力は思考トークン含む）
+BATCH_KINDS = {
+    "summary": {
+        "label": "要約",
+        "api_url": GEMINI_API_URL,
+        "batch_size": BATCH_SIZE,
+        "sleep": SLEEP_SECONDS,
+        "input_price": 1.25,
+        "output_price": 10.0,
+        "thinking_tokens": 4000,  # 1バッチあたりの思考トークン見積もり
+    },
+    "meta": {
+        "label": "タイトル・カテゴリー",
+        "api_url": LIGHT_API_URL,
+        "batch_size": LIGHT_BATCH_SIZE,
+        "sleep": LIGHT_SLEEP_SECONDS,
+        "input_price": 0.30,
+        "output_price": 2.50,
+        "thinking_tokens": 1000,
+    },
+    "repair": {
+        "label": "修正",
+        "api_url": GEMINI_API_URL,
+        "batch_size": BATCH_SIZE,
+        "sleep": SLEEP_SECONDS,
+        "input_price": 1.25,
+        "output_price": 10.0,
+        "thinking_tokens": 4000,
+    },
+}
+
+# 短い記事のタイトル・カテゴリー取得方法（--short-meta）
+SHORT_META_CHOICES = ["light", "keep", "local"]
+CLASSIFIER_MODEL_PATH = "data/category_model.npz"  # category_classifier.py train で作成
+CLASSIFIER_MIN_CONFIDENCE = 0.6  # これ未満は軽量バッチ（Gemini）に回す
+
+# 要約エンジン（--engine）
+ENGINE_CHOICES = ["gemini", "local"]
+
+# 処理順（--order）
+ORDER_CHOICES = ["input", "newest", "oldest", "shortest", "longest"]
 
 # --- プロンプトテンプレート ---
 BATCH_PROMPT_TEMPLATE = """以下の記事リスト（JSON形式）を分析し、各記事を要約してください。
@@ -68,6 +132,75 @@ BATCH_PROMPT_TEMPLATE = """以下の記事リスト（JSON形式）を分析し
 {articles_json}
 """
 
+LIGHT_PROMPT_TEMPLATE = """以下の記事リスト（JSON形式）を分析し、各記事に対してタイトルとカテゴリーを提案してください。
+
+【タスク】
+- 各記事の本文を読んで、内容を理解する。
+- タイトル: 30文字以内で内容を表すタイトルを生成する。
+- カテゴリー: 次のリストから最も適切なものを1つ選択する（自己受容, 目標設定, 習慣形成, マインドセット, 人間関係, 感謝, 行動力）。
+- 本文は出力しないでください。
+
+【入力形式】
+- 記事リストがJSON形式で与えられます。各オブジェクトは `id` と `content` を持ちます。
+
+【出力形式】
+- **必ず、入力に対応するJSON配列のみを出力してください。**
+- 各オブジェクトには `id`, `title`, `category` を含めてください。
+- 説明や前置き、```json ... ```のようなマークダウンは一切含めないでください。
+
+【例】
+入力:
+[
+  {{ "id": 0, "content": "..." }},
+  {{ "id": 1, "content": "..." }}
+]
+
+期待する出力:
+[
+  {{ "id": 0, "title": "感謝の気持ちを伝える重要性", "category": "感謝" }},
+  {{ "id": 1, "title": "新しい目標設定の方法", "category": "目標設定" }}
+]
+
+【記事リスト】
+{articles_json}
+"""
+
+REPAIR_PROMPT_TEMPLATE = """以下の記事リスト（JSON形式）は、以前の出力が規則に違反していた記事です。規則を厳守して作り直してください。
+
+【規則（厳守）】
+- タイトル: 必ず{title_max}文字以内。内容を表すタイトルにする。
+- カテゴリー: 必ず次のリストのいずれか1つを、表記を変えずにそのまま使う（自己受容, 目標設定, 習慣形成, マインドセット, 人間関係, 感謝, 行動力）。
+- 本文: `summarize` の値に従って処理する。
+  ・`summarize` が true の場合: 筆者本人の視点（一人称）を保ちながら、必ず{target_chars}文字以内に要約する（{max_chars}文字を超えたら不合格）
+  ・`summarize` が false の場合: 本文は作り直さない。`content` は空文字 "" にする
+  ・ブログのように適度に改行を入れて読みやすくする
+- `problems` には以前の出力の違反内容が書かれています。同じ違反を繰り返さないでください。
+
+【入力形式】
+- 記事リストがJSON形式で与えられます。各オブジェクトは `id`, `problems`, `summarize`, `content` を持ちます。
+
+【出力形式】
+- **必ず、入力に対応するJSON配列のみを出力してください。**
+- 各オブジェクトには `id`, `title`, `category`, `content` を含めてください。
+- 説明や前置き、```json ... ```のようなマークダウンは一切含めないでください。
+
+【例】
+入力:
+[
+  {{ "id": 0, "problems": ["本文が700文字を超えています（812文字）"], "summarize": true, "content": "..." }},
+  {{ "id": 1, "problems": ["タイトルが30文字を超えています（34文字）"], "summarize": false, "content": "..." }}
+]
+
+期待する出力:
+[
+  {{ "id": 0, "title": "感謝の気持ちを伝える重要性", "category": "感謝", "content": "要約された本文..." }},
+  {{ "id": 1, "title": "新しい目標設定の方法", "category": "目標設定", "content": "" }}
+]
+
+【記事リスト】
+{articles_json}
+"""
+
 # --- 関数定義 ---
 
 def parse_args() -> argparse.Namespace:
@@ -77,10 +210,35 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--output", default=OUTPUT_PATH, help="出力データ（パブリック版JSON）")
     parser.add_argument("--limit", type=int, default=None, help="処理件数制限（テスト用）")
     parser.add_argument("--test", action="store_true", help="1バッチ（20件）のみテスト実行")
+    parser.add_argument("--order", choices=ORDER_CHOICES, default="input",
+                        help="処理順（input: 入力順, newest: 新しい順, oldest: 古い順, shortest: 短い順, longest: 長い順）")
+    parser.add_argument("--max-input-tokens", type=int, default=None,
+                        help="この実行で使う入力トークンの上限（到達前のバッチで停止）")
+    parser.add_argument("--max-cost", type=float, default=None,
+                        help="この実行で使う推定料金の上限（USD）")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH, help="予算停止時のチェックポイント出力先")
+    parser.add_argument("--dry-run", action="store_true", help="見積もりのみ表示してAPIは呼ばない")
+    parser.add_argument("--short-meta", choices=SHORT_META_CHOICES, default="light",
+                        help="短い記事のタイトル・カテゴリー（light: 軽量バッチで生成, keep: 入力の値をそのまま使用, "
+                             "local: ローカル分類器で判定し確信度の低い記事のみ軽量バッチへ）")
+    parser.add_argument("--classifier-model", default=CLASSIFIER_MODEL_PATH, help="--short-meta local で使う分類モデル")
+    parser.add_argument("--min-confidence", type=float, default=CLASSIFIER_MIN_CONFIDENCE,
+                        help="--short-meta local でローカル判定を採用する確信度")
+    parser.add_argument("--engine", choices=ENGINE_CHOICES, default="gemini",
+                        help="要約エンジン（gemini: Gemini API, local: ローカル抽出型要約のみ・API不要）")
+    parser.add_argument("--no-fallback", action="store_true",
+                        help="Geminiのバッチ失敗時にローカル要約で代替せずスキップする")
+    parser.add_argument("--prefilter-chars", type=int, default=None,
+                        help="この文字数を超える本文はローカル抽出要約で縮めてからGeminiに送る（入力トークン削減）")
+    parser.add_argument("--repair", action="store_true",
+                        help="出力済みの記事のうち規則違反（700文字超・本文なし・カテゴリー不正・タイトル30文字超）のみを再生成")
     return parser.parse_args()
 
 def get_api_key() -> str:
-    """環境変数優先でAPIキーを取得"""
+    """環境変数（.envファイルを含む）優先でAPIキーを取得"""
+    from dotenv import load_dotenv  # 起動を速くするため、APIを呼ぶ時のみ読み込む
+
+    load_dotenv()
     key = os.environ.get("GEMINI_API_KEY", DEFAULT_GEMINI_API_KEY).strip()
     if not key:
         print("エラー: Gemini APIキーが設定されていません。環境変数 GEMINI_API_KEY を設定してください。")
@@ -104,55 +262,371 @@ def prepare_content(content: str) -> str:
     """Geminiに渡す本文を最大長に切り詰め"""
     return content[:MAX_BODY_CHARS] if len(content) > MAX_BODY_CHARS else content
 
-def call_gemini_batch(api_key: str, batch_articles: List[Dict]) -> Optional[List[Dict]]:
-    """Gemini APIをバッチで呼び出し、結果をパースして返す"""
+def build_batch_prompt(batch_articles: List[Dict], kind: str = "summary", indices: Optional[List[int]] = None) -> str:
+    """
+    バッチ処理用のプロンプトを作成（summary: 要約, meta: タイトル・カテゴリーのみ）
+
+    indices を指定するとバッチ内のその位置の記事だけを含める（idはバッチ内の位置のまま）
+    """
+    if indices is None:
+        indices = list(range(len(batch_articles)))
+
+    if kind == "repair":
+        articles_json = json.dumps([
+            {
+                "id": i,
+                "problems": batch_articles[i]["problems"],
+                "summarize": batch_articles[i]["summarize"],
+                "content": prepare_content(batch_articles[i].get("content", "")),
+            }
+            for i in indices
+        ], ensure_ascii=False)
+        return REPAIR_PROMPT_TEMPLATE.format(
+            articles_json=articles_json,
+            title_max=TITLE_MAX_CHARS,
+            target_chars=REPAIR_TARGET_CHARS,
+            max_chars=SUMMARY_MAX_CHARS,
+        )
+
+    if kind == "meta":
+        articles_json = json.dumps([
+            {"id": i, "content": batch_articles[i].get("content", "")[:LIGHT_MAX_BODY_CHARS]}
+            for i in indices
+        ], ensure_ascii=False)
+        return LIGHT_PROMPT_TEMPLATE.format(articles_json=articles_json)
 
-    # バッチ処理用のプロンプトを作成
     articles_json = json.dumps([
-        {"id": i, "content": prepare_content(article.get("content", ""))}
-        for i, article in enumerate(batch_articles)
+        {"id": i, "content": prepare_content(batch_articles[i].get("content", ""))}
+        for i in indices
     ], ensure_ascii=False)
+    return BATCH_PROMPT_TEMPLATE.format(articles_json=articles_json)
+
+def is_passthrough(article: Dict) -> bool:
+    """挨拶文除去後の本文が短く、要約不要（そのまま使用）か判定"""
+    return not needs_summary(article.get("content", ""))
+
+def classify_locally(articles: List[dict], args: argparse.Namespace) -> Tuple[List[dict], List[dict]]:
+    """
+    ローカル分類器でカテゴリーを判定
 
-    prompt = BATCH_PROMPT_TEMPLATE.format(articles_json=articles_json)
+    Returns:
+        (確信度がしきい値以上でカテゴリーを置き換えた記事, Geminiに回す記事)
+    """
+    import category_classifier  # NumPy/SciPy は local 指定時のみ読み込む
 
-    headers = {"Content-Type": "application/json"}
-    payload = {
-        "contents": [{"parts": [{"text": prompt}]}],
-        "generationConfig": {
-            "response_mime_type": "application/json",
+    if not os.path.exists(args.classifier_model):
+        print(f"エラー: {args.classifier_model} が見つかりません。"
+              "先に python3 scripts/category_classifier.py train を実行してください")
+        sys.exit(1)
+
+    model = category_classifier.load_model(args.classifier_model)
+    confident: List[dict] = []
+    uncertain: List[dict] = []
+    for article, (category, confidence) in zip(articles, category_classifier.predict_categories(model, articles)):
+        if confidence >= args.min_confidence:
+            confident.append({**article, "category": category})
+        else:
+            uncertain.append(article)
+    return confident, uncertain
+
+def prefilter_articles(articles: List[dict], max_chars: int) -> List[dict]:
+    """長い本文をローカル抽出要約で縮めたコピーを返す（Geminiに送る入力トークンを削減）"""
+    import local_summarizer  # NumPy/SciPy は必要な時のみ読み込む
+
+    targets = [a for a in articles if len(a.get("content", "")) > max_chars]
+    if not targets:
+        return articles
+    reduced = dict(zip(
+        (a["id"] for a in targets),
+        local_summarizer.summarize_many([a["content"] for a in targets], max_chars),
+    ))
+    print(f"事前圧縮: {len(targets)}件の本文を{max_chars}文字以内に縮めました")
+    return [{**a, "content": reduced[a["id"]]} if a["id"] in reduced else a for a in articles]
+
+def summarize_batch_locally(batch: Dict, indices: Optional[List[int]] = None) -> List[Dict]:
+    """
+    Geminiを使わずにバッチの結果を作成（タイトル・カテゴリーは入力の値を使用）
+
+    indices を指定するとバッチ内のその位置の記事だけを処理する
+    """
+    import local_summarizer  # NumPy/SciPy は必要な時のみ読み込む
+
+    if indices is None:
+        indices = list(range(len(batch["articles"])))
+    articles = [batch["articles"][i] for i in indices]
+    if batch["kind"] == "summary":
+        contents = local_summarizer.summarize_many([a.get("content", "") for a in articles])
+    else:
+        contents = [a.get("content", "") for a in articles]
+    return [
+        {
+            "id": i,
+            "title": article.get("title", "タイトル未設定"),
+            "category": article.get("category", "マインドセット"),
+            "content": content,
         }
+        for i, article, content in zip(indices, articles, contents)
+    ]
+
+def plan_batches(articles: List[dict], args: argparse.Namespace) -> Tuple[List[Dict], List[dict]]:
+    """
+    記事を要約バッチと軽量バッチに振り分ける
+    バッチは先頭記事の入力順（--order の並び）で交互に並べ、予算で止まっても指定順に処理済みになる
+
+    Returns:
+        (バッチのリスト [{"kind", "articles"}], APIを使わずに処理する記事のリスト)
+    """
+    position = {a.get("id"): i for i, a in enumerate(articles)}
+    long_articles = [a for a in articles if not is_passthrough(a)]
+    short_articles = [a for a in articles if is_passthrough(a)]
+
+    local_articles: List[dict] = []
+    batches: List[Dict] = []
+    if args.short_meta == "keep":
+        local_articles = short_articles
+    else:
+        if args.short_meta == "local":
+            local_articles, short_articles = classify_locally(short_articles, args)
+        size = BATCH_KINDS["meta"]["batch_size"]
+        batches += [{"kind": "meta", "articles": short_articles[i:i + size]}
+                    for i in range(0, len(short_articles), size)]
+
+    if args.prefilter_chars and args.engine == "gemini":
+        long_articles = prefilter_articles(long_articles, args.prefilter_chars)
+
+    size = BATCH_KINDS["summary"]["batch_size"]
+    batches += [{"kind": "summary", "articles": long_articles[i:i + size]}
+                for i in range(0, len(long_articles), size)]
+    batches.sort(key=lambda batch: position.get(batch["articles"][0].get("id"), len(articles)))
+    return batches, local_articles
+
+def estimate_tokens(text: str) -> int:
+    """文字数からトークン数をローカルで概算"""
+    return int(len(text) / CHARS_PER_TOKEN) + 1
+
+def estimate_output_tokens(article: Dict, kind: str) -> int:
+    """1記事分の出力トークン数を概算（要約は最大700文字、軽量バッチはタイトル・カテゴリーのみ）"""
+    if kind == "meta" or (kind == "repair" and not article["summarize"]):
+        return OUTPUT_OVERHEAD_TOKENS
+    content_len = len(article.get("content", ""))
+    summary_chars = min(content_len, SUMMARY_MAX_CHARS)
+    return int(summary_chars / CHARS_PER_TOKEN) + OUTPUT_OVERHEAD_TOKENS
+
+def estimate_batch_usage(batch: Dict) -> Dict[str, float]:
+    """1バッチ分の入力・出力トークン数と料金を概算"""
+    kind = batch["kind"]
+    input_tokens = estimate_tokens(build_batch_prompt(batch["articles"], kind))
+    output_tokens = (sum(estimate_output_tokens(a, kind) for a in batch["articles"])
+                     + BATCH_KINDS[kind]["thinking_tokens"])
+    return {
+        "input": input_tokens,
+        "output": output_tokens,
+        "cost": estimate_cost(input_tokens, output_tokens, kind),
     }
 
-    for attempt in range(API_RETRY_COUNT):
-        try:
-            response = requests.post(
-                f"{GEMINI_API_URL}?key={api_key}",
-                headers=headers,
-                json=payload,
-                timeout=REQUEST_TIMEOUT
-            )
-            if response.status_code == 200:
-                result = response.json()
-                text_content = result['candidates'][0]['content']['parts'][0]['text']
-                return json.loads(text_content)
-            else:
-                print(f"  APIエラー: Status {response.status_code}, Response: {response.text}")
-
-        except requests.RequestException as e:
-            print(f"  リクエストエラー: {e}")
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
-            print(f"  レスポンス解析エラー: {e}")
-            if 'result' in locals() and 'candidates' in result:
-                 print(f"  受け取ったテキスト: {result['candidates'][0]['content']['parts'][0]['text']}")
-
-
-        if attempt < API_RETRY_COUNT - 1:
-            wait = 2 ** attempt
-            print(f"  {wait}秒待機してリトライします...")
-            time.sleep(wait)
-
+def estimate_cost(input_tokens: int, output_tokens: int, kind: str = "summary") -> float:
+    """トークン数から料金（USD）を計算"""
+    config = BATCH_KINDS[kind]
+    return (input_tokens * config["input_price"] + output_tokens * config["output_price"]) / 1_000_000
+
+def order_articles(articles: List[dict], order: str) -> List[dict]:
+    """指定された処理順に並べ替え（元の配列は変更しない）"""
+    if order == "newest":
+        return sorted(articles, key=lambda a: a.get("date", ""), reverse=True)
+    if order == "oldest":
+        return sorted(articles, key=lambda a: a.get("date", ""))
+    if order == "shortest":
+        return sorted(articles, key=lambda a: len(a.get("content", "")))
+    if order == "longest":
+        return sorted(articles, key=lambda a: len(a.get("content", "")), reverse=True)
+    return list(articles)
+
+def exceeds_budget(usage: Dict[str, float], batch_estimate: Dict[str, float], args: argparse.Namespace) -> Optional[str]:
+    """次のバッチを実行すると予算を超えるか判定し、超える場合は理由を返す"""
+    if args.max_input_tokens is not None:
+        if usage["input"] + batch_estimate["input"] > args.max_input_tokens:
+            return f"入力トークン上限 {args.max_input_tokens:,}"
+    if args.max_cost is not None:
+        if usage["cost"] + batch_estimate["cost"] > args.max_cost:
+            return f"料金上限 ${args.max_cost:.2f}"
     return None
 
+def print_projection(batches: List[Dict], local_count: int) -> None:
+    """実行前に全体の見積もりを表示"""
+    estimates = [estimate_batch_usage(batch) for batch in batches]
+    input_tokens = sum(e["input"] for e in estimates)
+    output_tokens = sum(e["output"] for e in estimates)
+    cost = sum(e["cost"] for e in estimates)
+    wait_seconds = sum(BATCH_KINDS[batch["kind"]]["sleep"] for batch in batches)
+    print("📐 実行前見積もり（ローカル概算）:")
+    for kind, config in BATCH_KINDS.items():
+        kind_batches = [b for b in batches if b["kind"] == kind]
+        if kind_batches:
+            count = sum(len(b["articles"]) for b in kind_batches)
+            print(f"  {config['label']}バッチ: {len(kind_batches)}回（{count}件）")
+    if local_count:
+        print(f"  API不要（短い記事・ローカルでタイトル/カテゴリーを決定）: {local_count}件")
+    print(f"  入力トークン: {input_tokens:,}")
+    print(f"  出力トークン: {output_tokens:,}（思考トークン含む）")
+    print(f"  推定料金: ${cost:.2f}")
+    print(f"  推定所要時間: 約{wait_seconds // 60 + 1}分以上（待機時間のみ）\n")
+
+def save_checkpoint(path: str, status: str, usage: Dict[str, float], pending_ids: List[str]) -> None:
+    """予算停止時の状態を書き出し（出力ファイル自体がレジューム位置になる）"""
+    checkpoint = {
+        "status": status,
+        "savedAt": datetime.now().isoformat(),
+        "usage": {
+            "inputTokens": usage["input"],
+            "outputTokens": usage["output"],
+            "costUsd": round(usage["cost"], 4),
+        },
+        "pendingIds": pending_ids,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+
+def build_public_article(original_article: dict, title: str, category: str, content: str) -> dict:
+    """パブリック版記事を作成"""
+    return {
+        "id": original_article["id"],
+        "title": title[:50],
+        "content": content,
+        "category": category,
+        "date": original_article["date"],
+        "originalDate": original_article.get("originalDate", original_article["date"]),
+        "createdAt": original_article["createdAt"],
+        "tags": [category, "メンタル"]
+    }
+
+def call_gemini_batch(client: GeminiClient, batch: Dict, on_result: Callable[[Dict], None]) -> Tuple[List[int], Dict[str, float]]:
+    """
+    Gemini APIをバッチで呼び出し、記事の結果を受信した順に on_result へ渡す
+
+    Returns:
+        (結果を受け取れなかった記事のバッチ内の位置, 実際のトークン使用量)
+    """
+    kind = batch["kind"]
+    missing, usage = client.generate_items(
+        BATCH_KINDS[kind]["api_url"],
+        lambda indices: build_batch_prompt(batch["articles"], kind, indices),
+        range(len(batch["articles"])),
+        on_result,
+    )
+    return missing, {**usage, "cost": estimate_cost(usage["input"], usage["output"], kind)}
+
+def find_violations(article: dict) -> List[str]:
+    """出力済みの記事の規則違反を列挙（違反がなければ空リスト）"""
+    problems: List[str] = []
+    content = article.get("content", "")
+    if not content.strip():
+        problems.append("本文が空です")
+    elif len(content) > SUMMARY_MAX_CHARS:
+        problems.append(f"本文が{SUMMARY_MAX_CHARS}文字を超えています（{len(content)}文字）")
+    if article.get("category") not in VALID_CATEGORIES:
+        problems.append(f"カテゴリー「{article.get('category', '')}」はリストにありません")
+    title = article.get("title", "")
+    if not title.strip():
+        problems.append("タイトルが空です")
+    elif len(title) > TITLE_MAX_CHARS:
+        problems.append(f"タイトルが{TITLE_MAX_CHARS}文字を超えています（{len(title)}文字）")
+    return problems
+
+def plan_repair_batches(public_articles: List[dict], input_articles: List[dict]) -> List[Dict]:
+    """規則違反の記事だけを修正バッチにまとめる（本文の問題がある記事は入力の全文から再要約）"""
+    originals = {article.get("id"): article for article in input_articles}
+    targets: List[dict] = []
+    for article in public_articles:
+        problems = find_violations(article)
+        if not problems:
+            continue
+        original = originals.get(article["id"], article)
+        content = article.get("content", "")
+        summarize = not content.strip() or len(content) > SUMMARY_MAX_CHARS
+        targets.append({
+            **article,
+            "content": original.get("content", "") if summarize else content,
+            "problems": problems,
+            "summarize": summarize,
+        })
+
+    size = BATCH_KINDS["repair"]["batch_size"]
+    return [{"kind": "repair", "articles": targets[i:i + size]} for i in range(0, len(targets), size)]
+
+def run_repair(args: argparse.Namespace) -> None:
+    """規則違反の記事のみ再生成し、出力ファイル内の同じIDの記事を置き換える"""
+    if not os.path.exists(args.output):
+        print(f"エラー: {args.output} が見つかりません")
+        sys.exit(1)
+
+    public_articles = load_json(args.output)
+    batches = plan_repair_batches(public_articles, load_json(args.input))
+    target_count = sum(len(batch["articles"]) for batch in batches)
+    print(f"規則違反: {target_count}/{len(public_articles)}件\n")
+    if not batches:
+        print("✅ 修正が必要な記事はありません")
+        return
+
+    for batch in batches:
+        for article in batch["articles"]:
+            print(f"  ✗ {article.get('title', '')[:30]}: {' / '.join(article['problems'])}")
+    print()
+    print_projection(batches, 0)
+    if args.dry_run:
+        return
+    if args.engine != "gemini":
+        print("エラー: --repair は Gemini でのみ実行できます")
+        sys.exit(1)
+
+    client = GeminiClient(get_api_key())
+    positions = {article["id"]: i for i, article in enumerate(public_articles)}
+    usage = {"input": 0, "output": 0, "cost": 0.0}
+    repaired = 0
+
+    for batch in batches:
+        stop_reason = exceeds_budget(usage, estimate_batch_usage(batch), args)
+        if stop_reason:
+            print(f"\n⏸ {stop_reason} に達するため停止します（再実行すると残りを修正します）")
+            break
+
+        print(f"\n{BATCH_KINDS['repair']['label']}バッチ処理中...（{len(batch['articles'])}件）")
+
+        def apply_result(res: Dict) -> None:
+            """結果で記事を置き換え（本文を作り直さない記事は現在の本文を維持）"""
+            nonlocal repaired
+            try:
+                target = batch["articles"][res["id"]]
+                current = public_articles[positions[target["id"]]]
+                content = res.get("content", "") if target["summarize"] else current["content"]
+                article = build_public_article(current, res.get("title", ""), res.get("category", ""), content)
+                public_articles[positions[target["id"]]] = article
+                repaired += 1
+                remaining = find_violations(article)
+                if remaining:
+                    print(f"  ⚠ {article['title']}: {' / '.join(remaining)}")
+                else:
+                    print(f"  ✓ {article['title']} ({len(content)}文字)")
+            except (IndexError, KeyError, TypeError) as e:
+                print(f"  結果の処理中にエラー: {e} - スキップします")
+
+        missing, batch_usage = call_gemini_batch(client, batch, apply_result)
+        for key in usage:
+            usage[key] += batch_usage[key]
+        if missing:
+            print(f"  {len(missing)}件の修正に失敗しました（再実行で再試行します）")
+
+        save_json(args.output, public_articles)
+        print(f"  進捗保存: {args.output}")
+        time.sleep(BATCH_KINDS["repair"]["sleep"])
+
+    remaining_count = sum(1 for article in public_articles if find_violations(article))
+    print(f"\n💰 この実行の使用量: 入力{usage['input']:,} / 出力{usage['output']:,}トークン"
+          f"（${usage['cost']:.2f}）")
+    print(f"🔧 修正: {repaired}件 / 残りの規則違反: {remaining_count}件")
+
 def main():
     """メイン処理"""
     args = parse_args()
@@ -161,12 +635,19 @@ def main():
         print(f"エラー: {args.input} が見つかりません")
         sys.exit(1)
 
+    if args.repair:
+        run_repair(args)
+        return
+
     # 入力データを読み込み
     input_articles = load_json(args.input)
 
     # 非表示フラグのある記事を除外
     private_articles = [a for a in input_articles if not a.get('hidden')]
 
+    # 処理順を適用（件数制限より先に並べ替え、「新しい順に100件」などを可能にする）
+    private_articles = order_articles(private_articles, args.order)
+
     # テストモードまたは件数制限
     if args.test:
         private_articles = private_articles[:BATCH_SIZE]
@@ -175,6 +656,11 @@ def main():
         private_articles = private_articles[:args.limit]
         print(f"処理件数を{args.limit}件に制限します\n")
 
+    # 前回バッチの途中で中断していた場合、受信済みの記事を出力に取り込む
+    recovered = recover_partial(args.output)
+    if recovered:
+        print(f"前回の途中経過から{recovered}件を取り込みました\n")
+
     # 既存の出力があれば読み込む（レジューム機能）
     existing_articles: List[dict] = []
     if os.path.exists(args.output):
@@ -184,6 +670,8 @@ def main():
         except Exception as e:
             print(f"  既存ファイルの読み込みに失敗: {e}。新規で作り直します")
 
+    partial = PartialWriter(args.output)
+
     processed_ids = {article.get('id') for article in existing_articles}
     remaining_articles = [a for a in private_articles if a.get('id') not in processed_ids]
 
@@ -193,46 +681,77 @@ def main():
         print(f"既に {processed_count}/{len(private_articles)} 件処理済みです。追加処理はありません")
         return
 
-    api_key = get_api_key()
-    public_articles = existing_articles
+    if args.engine == "local" and args.short_meta == "light":
+        args.short_meta = "keep"  # ローカルエンジンではAPIを一切使わない
+    batches, local_articles = plan_batches(remaining_articles, args)
+    if args.engine == "local":
+        print(f"ローカル要約エンジン: {len(remaining_articles)}件をAPIを使わずに処理します\n")
+    else:
+        print_projection(batches, len(local_articles))
 
-    total_count = len(private_articles)
-    print(f"処理開始: 残り{len(remaining_articles)}件の記事を{BATCH_SIZE}件ずつのバッチで処理します\n")
+    if args.dry_run:
+        return
 
-    for i in range(0, len(remaining_articles), BATCH_SIZE):
-        batch_articles = remaining_articles[i:i + BATCH_SIZE]
-        start_index = processed_count + i
+    public_articles = existing_articles
+    usage = {"input": 0, "output": 0, "cost": 0.0}
+    stop_reason: Optional[str] = None
+
+    # 短い記事は入力のタイトル・カテゴリーでそのまま作成（API不要）
+    if local_articles:
+        for article in local_articles:
+            public_articles.append(build_public_article(
+                article,
+                article.get("title", "タイトル未設定"),
+                article.get("category", "マインドセット"),
+                article.get("content", ""),
+            ))
+        save_json(args.output, public_articles)
+        print(f"短い記事{len(local_articles)}件をAPIを使わずに作成しました\n")
 
-        print(f"\n[{start_index + 1}-{start_index + len(batch_articles)}/{total_count}] バッチ処理中...")
+    if not batches:
+        print(f"✅ 完了: {len(public_articles)}件の記事を {args.output} に保存しました")
+        return
 
-        results = call_gemini_batch(api_key, batch_articles)
+    client = GeminiClient(get_api_key()) if args.engine == "gemini" else None
 
-        if not results:
-            print("  このバッチの処理に失敗しました。スキップします。")
-            continue
-
-        for res in results:
+    total_count = len(private_articles)
+    done_count = processed_count + len(local_articles)
+    print(f"処理開始: 残り{len(remaining_articles) - len(local_articles)}件の記事を{len(batches)}バッチで処理します\n")
+
+    for batch_index, batch in enumerate(batches):
+        batch_articles = batch["articles"]
+        config = BATCH_KINDS[batch["kind"]]
+
+        # 予算チェック（次のバッチの見積もりで上限を超えるなら、ここで止める）
+        if args.engine == "gemini":
+            stop_reason = exceeds_budget(usage, estimate_batch_usage(batch), args)
+        if stop_reason:
+            pending_ids = [a["id"] for pending in batches[batch_index:] for a in pending["articles"]]
+            save_checkpoint(args.checkpoint, "budget_exhausted", usage, pending_ids)
+            print(f"\n⏸ {stop_reason} に達するため停止します（残り{len(pending_ids)}件）")
+            print(f"  チェックポイント: {args.checkpoint}")
+            print("  同じコマンドを再実行すると続きから再開します")
+            break
+
+        print(f"\n[{done_count + 1}-{done_count + len(batch_articles)}/{total_count}] {config['label']}バッチ処理中...")
+        done_count += len(batch_articles)
+
+        def add_result(res: Dict) -> None:
+            """1記事分の結果からパブリック版記事を作成し、途中経過ファイルに追記"""
             try:
-                original_article_index = res['id']
-                original_article = batch_articles[original_article_index]
+                original_article = batch_articles[res['id']]
 
                 title = res.get("title", original_article.get("title", "タイトル未設定"))
                 category = res.get("category", original_article.get("category", "マインドセット"))
-                content = res.get("content", "")
-
-                # パブリック版記事を作成
-                public_article = {
-                    "id": original_article["id"],
-                    "title": title[:50],
-                    "content": content,
-                    "category": category,
-                    "date": original_article["date"],
-                    "originalDate": original_article.get("originalDate", original_article["date"]),
-                    "createdAt": original_article["createdAt"],
-                    "tags": [category, "メンタル"]
-                }
-
-                public_articles.append(public_article)
+                if batch["kind"] == "meta":
+                    # 短い記事は要約せず元の本文をそのまま使用
+                    content = original_article.get("content", "")
+                else:
+                    content = res.get("content", "")
+
+                article = build_public_article(original_article, title, category, content)
+                public_articles.append(article)
+                partial.write(article)
 
                 # 文字数チェック
                 content_len = len(content)
@@ -241,14 +760,45 @@ def main():
                 else:
                     print(f"  ⚠ {title} ({content_len}文字)")
 
-            except (IndexError, KeyError) as e:
+            except (IndexError, KeyError, TypeError) as e:
                 print(f"  結果の処理中にエラー: {e} - スキップします")
-                continue
+
+        if args.engine == "local":
+            missing = []
+            for res in summarize_batch_locally(batch):
+                add_result(res)
+        else:
+            missing, batch_usage = call_gemini_batch(client, batch, add_result)
+            for key in usage:
+                usage[key] += batch_usage[key]
+            print(f"  使用量: 入力{batch_usage['input']:,} / 出力{batch_usage['output']:,}トークン"
+                  f"（累計 ${usage['cost']:.2f}）")
+
+            if missing and not args.no_fallback:
+                print(f"  Geminiで受け取れなかった{len(missing)}件をローカル要約で代替します")
+                for res in summarize_batch_locally(batch, missing):
+                    add_result(res)
+                missing = []
+
+        if missing:
+            print(f"  {len(missing)}件の処理に失敗しました。スキップします。")
 
         save_json(args.output, public_articles)
+        partial.clear()
         print(f"  進捗保存: {len(public_articles)}件を書き出しました")
 
-        time.sleep(SLEEP_SECONDS)  # API制限対応: 無料版RPM=5 → 15秒待機
+        if args.engine == "gemini":
+            time.sleep(config["sleep"])  # API制限対応（RPM）
+    else:
+        # 最後まで処理できた場合、以前の予算停止チェックポイントを完了扱いにする
+        if os.path.exists(args.checkpoint):
+            save_checkpoint(args.checkpoint, "completed", usage, [])
+
+    print(f"\n💰 この実行の使用量: 入力{usage['input']:,} / 出力{usage['output']:,}トークン"
+          f"（${usage['cost']:.2f}）")
+    if stop_reason:
+        print(f"⏸ 予算停止: {len(public_articles)}件が {args.output} に保存済みです")
+        return
 
     print(f"\n✅ 完了: {len(public_articles)}件の記事を {args.output} に保存しました")
 
@@ -7,53 +7,43 @@ import json
 import os
 import sys
 import base64
+from email.message import EmailMessage
 from typing import List, Dict, Any
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+
+import mail_parsing
 
 # Gmail MCP のトークンパスを使用
 TOKEN_PATH = os.path.expanduser("~/.local/lib/mcp-servers/gmail/token.json")
 OUTPUT_PATH = "data/raw_emails_2022.json"
 
+# 取得するフィールドを限定して転送量を減らす
+LIST_FIELDS = "messages/id,nextPageToken"
+GET_FIELDS = "id,snippet,raw"
+
 def get_gmail_service():
-    """Gmail APIサービスを初期化"""
+    """
+    Gmail APIサービスを初期化
+
+    google-api-python-client 同梱のディスカバリー文書を使い（static_discovery）、
+    起動のたびにネットワークから取得・キャッシュ確認をしない
+    """
     if not os.path.exists(TOKEN_PATH):
         print(f"エラー: トークンファイルが見つかりません: {TOKEN_PATH}")
         sys.exit(1)
 
+    # Google API ライブラリは読み込みが重いため、トークン確認後に読み込む
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build
+
     with open(TOKEN_PATH, 'r') as token:
         token_data = json.load(token)
         creds = Credentials.from_authorized_user_info(token_data)
 
-    return build('gmail', 'v1', credentials=creds)
-
-def parse_message_body(message: Dict[str, Any]) -> str:
-    """メール本文を抽出"""
-    def get_text_part(parts):
-        text = ""
-        for part in parts:
-            if part.get("mimeType") == "text/plain":
-                if "data" in part.get("body", {}):
-                    text += base64.urlsafe_b64decode(part["body"]["data"]).decode()
-            elif "parts" in part:
-                text += get_text_part(part["parts"])
-        return text
-
-    payload = message.get("payload", {})
-    if "parts" in payload:
-        return get_text_part(payload["parts"])
-    else:
-        body = payload.get("body", {})
-        if "data" in body:
-            return base64.urlsafe_b64decode(body["data"]).decode()
-        return ""
-
-def get_headers_dict(message: Dict[str, Any]) -> Dict[str, str]:
-    """ヘッダーを辞書形式で取得"""
-    headers = {}
-    for header in message.get("payload", {}).get("headers", []):
-        headers[header["name"]] = header["value"]
-    return headers
+    return build('gmail', 'v1', credentials=creds, static_discovery=True, cache_discovery=False)
+
+def parse_raw_message(message: Dict[str, Any]) -> EmailMessage:
+    """format='raw' で取得したメールを EmailMessage に変換"""
+    return mail_parsing.parse_bytes(base64.urlsafe_b64decode(message["raw"]))
 
 def fetch_all_messages(service, query: str, max_total: int = 1000) -> List[Dict[str, Any]]:
     """
@@ -79,7 +69,8 @@ def fetch_all_messages(service, query: str, max_total: int = 1000) -> List[Dict[
             params = {
                 'userId': 'me',
                 'q': query,
-                'maxResults': min(100, max_total - len(all_emails))
+                'maxResults': min(100, max_total - len(all_emails)),
+                'fields': LIST_FIELDS
             }
             if page_token:
                 params['pageToken'] = page_token
@@ -97,30 +88,19 @@ def fetch_all_messages(service, query: str, max_total: int = 1000) -> List[Dict[
             for i, msg_info in enumerate(messages, 1):
                 msg_id = msg_info['id']
 
-                # メール詳細取得
+                # メール詳細取得（RFC 822 の生データをローカルで1回だけ解析）
                 message = service.users().messages().get(
                     userId='me',
                     id=msg_id,
-                    format='full'
+                    format='raw',
+                    fields=GET_FIELDS
                 ).execute()
 
-                # ヘッダー情報抽出
-                headers = get_headers_dict(message)
-
-                # 本文抽出
-                body = parse_message_body(message)
-
-                # スニペット取得
-                snippet = message.get('snippet', '')
+                # ヘッダー・本文抽出
+                email_data = mail_parsing.build_email_record(parse_raw_message(message), msg_id)
 
-                # データ構造作成
-                email_data = {
-                    "id": msg_id,
-                    "subject": headers.get("Subject", "No Subject"),
-                    "date": headers.get("Date", "Unknown Date"),
-                    "body": body,
-                    "snippet": snippet
-                }
+                # スニペットは Gmail のものを使う
+                email_data["snippet"] = message.get('snippet', email_data["snippet"])
 
                 all_emails.append(email_data)
 
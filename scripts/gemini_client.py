@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Gemini API ストリーミングクライアント
+create_public_data.py / create_private_data.py で共通利用する
+
+- keep-alive の requests.Session で接続を使い回す（バッチごとのTLSハンドシェイクを省く）
+- streamGenerateContent（SSE）で受信しながらJSON配列を逐次解析し、完成した記事から順にコールバックへ渡す
+- タイムアウト・切断時は受信済みの記事を残し、未受信の記事だけを再リクエストする
+- 受信済みの記事は NDJSON の途中経過ファイルに1件ずつ追記し、次回実行時に出力へ取り込む
+"""
+
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+API_RETRY_COUNT = 3
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 300  # チャンク間の最大待ち時間（思考中は最初のチャンクまで時間がかかる）
+PARTIAL_SUFFIX = ".partial.jsonl"  # 途中経過ファイル（出力パス + この拡張子）
+
+
+def stream_url(api_url: str) -> str:
+    """generateContent のURLを streamGenerateContent（SSE）のURLに変換"""
+    return api_url.replace(":generateContent", ":streamGenerateContent") + "?alt=sse"
+
+
+class JsonArrayStreamParser:
+    """
+    分割されて届くJSON配列のテキストから、完成した要素を順に取り出すパーサー
+
+    例: feed('[{"id": 0}, {"i') → [{"id": 0}]、feed('d": 1}]') → [{"id": 1}]
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self.started = False  # 先頭の [ を読んだか
+        self.finished = False  # 末尾の ] を読んだか
+
+    def feed(self, text: str) -> List[Any]:
+        """テキストを追加し、新たに完成した要素のリストを返す"""
+        self._buffer += text
+        items: List[Any] = []
+        buffer = self._buffer
+        while not self.finished:
+            pos = self._skip(buffer, self._pos)
+            if pos >= len(buffer):
+                break
+            if not self.started:
+                start = buffer.find("[", pos)
+                if start < 0:
+                    self._pos = len(buffer)
+                    break
+                self.started = True
+                self._pos = start + 1
+                continue
+            if buffer[pos] == "]":
+                self.finished = True
+                self._pos = pos + 1
+                break
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # 要素の途中（続きのチャンクを待つ）
+            # 数値などはチャンクの境目で切れても解析できてしまう（"[12" + "3]" → 12）ため、
+            # 配列・オブジェクト以外は区切り（, ] 空白）が届くまで確定しない
+            if not isinstance(item, (dict, list)) and (end >= len(buffer) or buffer[end] not in " \t\r\n,]"):
+                break
+            items.append(item)
+            self._pos = end
+
+        # 解析済みの部分を捨ててバッファを小さく保つ
+        self._buffer = buffer[self._pos:]
+        self._pos = 0
+        return items
+
+    @property
+    def pending_text(self) -> str:
+        """未解析のまま残っているテキスト（空白・区切りを除く）"""
+        return self._buffer[self._skip(self._buffer, 0):]
+
+    @staticmethod
+    def _skip(buffer: str, pos: int) -> int:
+        """空白と要素区切りのカンマを読み飛ばす"""
+        length = len(buffer)
+        while pos < length and buffer[pos] in " \t\r\n,":
+            pos += 1
+        return pos
+
+
+class PartialWriter:
+    """受信した記事を1件ずつ NDJSON で追記する途中経過ファイル"""
+
+    def __init__(self, output_path: str):
+        self.path = output_path + PARTIAL_SUFFIX
+        self._file = None
+
+    def write(self, record: dict) -> None:
+        """1件追記して即座にディスクへ書き出す"""
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def clear(self) -> None:
+        """出力JSONへの保存が済んだら途中経過を削除"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def load_partial(output_path: str) -> List[dict]:
+    """前回の途中経過ファイルを読み込む（書きかけの最終行は無視）"""
+    path = output_path + PARTIAL_SUFFIX
+    if not os.path.exists(path):
+        return []
+    records: List[dict] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def recover_partial(output_path: str) -> int:
+    """
+    前回の途中経過ファイルの記事のうち出力JSONに未登録のものを追記して保存し、途中経過を削除
+
+    Returns:
+        取り込んだ件数
+    """
+    records = load_partial(output_path)
+    if not records:
+        PartialWriter(output_path).clear()
+        return 0
+
+    articles: List[dict] = []
+    if os.path.exists(output_path):
+        with open(output_path, "r", encoding="utf-8") as f:
+            articles = json.load(f)
+    known = {article.get("id") for article in articles}
+    added = [record for record in records if record.get("id") not in known]
+    if added:
+        articles.extend({record["id"]: record for record in added}.values())
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(articles, f, ensure_ascii=False, indent=2)
+    PartialWriter(output_path).clear()
+    return len(added)
+
+
+class GeminiClient:
+    """接続を使い回してストリーミングでJSON配列を受け取るクライアント"""
+
+    def __init__(self, api_key: str, retry_count: int = API_RETRY_COUNT):
+        import requests  # 起動を速くするため、APIを呼ぶ時のみ読み込む
+
+        self.api_key = api_key
+        self.retry_count = retry_count
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json", "x-goog-api-key": api_key})
+
+    def close(self) -> None:
+        """接続プールを閉じる"""
+        self.session.close()
+
+    def stream_json_array(
+        self,
+        api_url: str,
+        prompt: str,
+        on_item: Callable[[Any], None],
+    ) -> Tuple[bool, Dict[str, int]]:
+        """
+        1回のリクエストでJSON配列をストリーミング受信し、完成した要素ごとに on_item を呼ぶ
+
+        Returns:
+            (配列を最後まで受信できたか, トークン使用量 {"input", "output"})
+        """
+        payload = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "response_mime_type": "application/json",
+            }
+        }
+        import requests
+
+        usage = {"input": 0, "output": 0}
+        parser = JsonArrayStreamParser()
+
+        try:
+            with self.session.post(
+                stream_url(api_url),
+                json=payload,
+                stream=True,
+                timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+            ) as response:
+                if response.status_code != 200:
+                    print(f"  APIエラー: Status {response.status_code}, Response: {response.text}")
+                    return False, usage
+
+                response.encoding = "utf-8"  # text/event-stream は charset 省略時に Latin-1 と解釈されるため明示
+                for chunk in _iter_sse_events(response.iter_lines(decode_unicode=True)):
+                    # usageMetadata は累計値のため最後のチャンクの値を使う
+                    metadata = chunk.get("usageMetadata")
+                    if metadata:
+                        usage["input"] = metadata.get("promptTokenCount", 0)
+                        usage["output"] = (metadata.get("candidatesTokenCount", 0)
+                                           + metadata.get("thoughtsTokenCount", 0))
+                    for item in parser.feed(_chunk_text(chunk)):
+                        on_item(item)
+
+        except requests.RequestException as e:
+            print(f"  リクエストエラー: {e}")
+            return False, usage
+        except json.JSONDecodeError as e:
+            print(f"  レスポンス解析エラー: {e}")
+            return False, usage
+
+        if not parser.finished:
+            print(f"  レスポンス解析エラー: JSON配列が途中で終わっています（未解析: {parser.pending_text[:200]!r}）")
+        return parser.finished, usage
+
+    def generate_items(
+        self,
+        api_url: str,
+        build_prompt: Callable[[List[int]], str],
+        ids: Iterable[int],
+        on_item: Callable[[Dict], None],
+    ) -> Tuple[List[int], Dict[str, int]]:
+        """
+        id付きの要素を生成し、受信した順に on_item へ渡す（失敗時は未受信のidだけを再リクエスト）
+
+        Args:
+            build_prompt: 未受信のidリストからプロンプトを作る関数
+            ids: 入力の各要素のid（出力の "id" と対応）
+
+        Returns:
+            (最後まで受信できなかったidのリスト, 全リクエスト合計のトークン使用量)
+        """
+        missing = list(ids)
+        usage = {"input": 0, "output": 0}
+
+        def accept(item: Any) -> None:
+            if isinstance(item, dict) and item.get("id") in missing:
+                missing.remove(item["id"])
+                on_item(item)
+
+        for attempt in range(self.retry_count):
+            _, request_usage = self.stream_json_array(api_url, build_prompt(missing), accept)
+            # 失敗したリトライ分も課金されるため、リクエストごとに加算
+            usage["input"] += request_usage["input"]
+            usage["output"] += request_usage["output"]
+            if not missing:
+                break
+            if attempt < self.retry_count - 1:
+                wait = 2 ** attempt
+                print(f"  未受信の{len(missing)}件を{wait}秒後にリトライします...")
+                time.sleep(wait)
+
+        return missing, usage
+
+
+def _iter_sse_events(lines: Iterable[str]) -> Iterable[Dict]:
+    """Server-Sent Events の data 行をJSONとして順に返す"""
+    data_lines: List[str] = []
+    for line in lines:
+        if line is None:
+            continue
+        if line.startswith("data:"):
+            data_lines.append(line[5:].strip())
+        elif not line.strip() and data_lines:
+            yield json.loads("\n".join(data_lines))
+            data_lines = []
+    if data_lines:
+        yield json.loads("\n".join(data_lines))
+
+
+def _chunk_text(chunk: Dict) -> str:
+    """ストリーミングの1チャンクから生成テキストを取り出す（思考の要約パートは除く）"""
+    try:
+        parts = chunk["candidates"][0]["content"]["parts"]
+    except (KeyError, IndexError):
+        return ""
+    return "".join(part.get("text", "") for part in parts if not part.get("thought"))
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+mbox / Maildir 一括取り込みスクリプト（Gmail API 不要）
+Google Takeout などでエクスポートしたメールから、fetch_gmail_messages.py と同じ形式の元メールJSONを作成
+
+- mbox ファイルは1通ずつ読み出すため、ファイルサイズに関係なくメモリ使用量は一定
+- 送信者・日付範囲で絞り込み、text/plain パートを charset に従ってデコード
+- メールのデコードはプロセスプールで並列化
+- ID は Takeout の区切り行（From <10進数のGmailメッセージID>@xxx）を16進数にした Gmail API と同じ値
+  （区切り行にIDがない・Maildir の場合は id を空にし、Message-ID ヘッダーを messageId に入れる）
+
+使い方:
+    python3 scripts/import_mbox.py ~/Takeout/Mail/All\\ mail\\ Including\\ Spam\\ and\\ Trash.mbox
+    python3 scripts/import_mbox.py ~/Maildir --after 2022/01/01 --before 2023/01/01 --output data/raw_emails_2022.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+
+import mail_parsing
+
+# --- 設定 ---
+DEFAULT_SENDER = "mail@goodluckfortune.co.jp"  # fetch_gmail_messages.py の検索クエリと同じ送信者
+OUTPUT_PATH = "data/raw_emails_import.json"
+CHUNK_SIZE = 64  # 1回にワーカーへ渡すメール数
+WINDOW_SIZE = 4096  # 同時に読み込んでおくメール数（メモリ使用量の上限）
+TAKEOUT_SEPARATOR = re.compile(rb"^From (\d+)@xxx\b")  # Takeout の mbox 区切り行（10進数のGmailメッセージID）
+
+
+# --- 関数定義 ---
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解釈"""
+    parser = argparse.ArgumentParser(description="mbox / Maildir 一括取り込み")
+    parser.add_argument("source", help="mbox ファイル、または Maildir ディレクトリ")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="出力JSONのパス")
+    parser.add_argument("--sender", default=DEFAULT_SENDER, help="送信者アドレス（空文字で絞り込みなし）")
+    parser.add_argument("--after", default=None, help="この日付以降（YYYY/MM/DD または YYYY-MM-DD）")
+    parser.add_argument("--before", default=None, help="この日付より前（YYYY/MM/DD または YYYY-MM-DD）")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="並列プロセス数")
+    return parser.parse_args()
+
+
+def parse_date_arg(value: Optional[str]) -> Optional[datetime]:
+    """Gmail 検索クエリと同じ日付指定を datetime（UTC）に変換"""
+    if not value:
+        return None
+    return datetime.strptime(value.replace("-", "/"), "%Y/%m/%d").replace(tzinfo=timezone.utc)
+
+
+def gmail_id_from_separator(line: bytes) -> Optional[str]:
+    """Takeout の mbox 区切り行から Gmail API と同じメッセージID（16進数）を取り出す"""
+    match = TAKEOUT_SEPARATOR.match(line)
+    return format(int(match.group(1)), "x") if match else None
+
+
+def iter_mbox(path: str) -> Iterator[Tuple[Optional[str], bytes]]:
+    """
+    mbox ファイルから1通ずつ (GmailメッセージID, 生のバイト列) を読み出す
+    （mboxrd の >From エスケープを戻す。区切り行にIDがない場合は None）
+    """
+    lines: List[bytes] = []
+    gmail_id: Optional[str] = None
+    previous_blank = True
+
+    def finish() -> Tuple[Optional[str], bytes]:
+        # 区切り行の直前の空行は mbox の書式なので本文に含めない
+        if lines and lines[-1] in (b"\n", b"\r\n"):
+            lines.pop()
+        return gmail_id, b"".join(lines)
+
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b"From ") and previous_blank:
+                if lines:
+                    yield finish()
+                lines = []
+                gmail_id = gmail_id_from_separator(line)
+            else:
+                if line.startswith(b">") and line.lstrip(b">").startswith(b"From "):
+                    line = line[1:]
+                lines.append(line)
+            previous_blank = line in (b"\n", b"\r\n")
+    if lines:
+        yield finish()
+
+
+def iter_maildir(path: str) -> Iterator[Tuple[Optional[str], bytes]]:
+    """Maildir の cur/ と new/ からメールを1通ずつ読み出す（GmailメッセージIDはないため None）"""
+    for folder in ("cur", "new"):
+        directory = os.path.join(path, folder)
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, name), "rb") as f:
+                yield None, f.read()
+
+
+def decode_message(item: Tuple[Optional[str], bytes], sender: str,
+                   after: Optional[datetime], before: Optional[datetime]) -> Optional[dict]:
+    """1通のメールを条件で絞り込み、元メールレコードに変換（対象外は None）"""
+    gmail_id, raw = item
+    message = mail_parsing.parse_bytes(raw)
+
+    if sender and mail_parsing.sender_address(message) != sender.lower():
+        return None
+
+    sent_at = mail_parsing.message_datetime(message)
+    if after or before:
+        if sent_at is None:
+            return None
+        if sent_at.tzinfo is None:
+            sent_at = sent_at.replace(tzinfo=timezone.utc)
+        if after and sent_at < after:
+            return None
+        if before and sent_at >= before:
+            return None
+
+    # Gmail API で取得した場合と同じ記事IDになるよう、区切り行のIDを使う
+    # ない場合は id を空にし、Message-ID ヘッダーから記事IDを作る（make_article_id の msgid: 名前空間）
+    record = mail_parsing.build_email_record(message, gmail_id or "")
+    if not gmail_id:
+        record["messageId"] = mail_parsing.message_id(message)
+    record["timestamp"] = sent_at.timestamp() if sent_at else 0.0
+    return record
+
+
+def import_messages(messages: Iterator[Tuple[Optional[str], bytes]], decode, workers: int) -> List[dict]:
+    """メールを WINDOW_SIZE 件ずつプロセスプールでデコード"""
+    records: List[dict] = []
+    scanned = 0
+
+    if workers <= 1:
+        for item in messages:
+            scanned += 1
+            record = decode(item)
+            if record:
+                records.append(record)
+        print(f"  走査: {scanned}件 / 対象: {len(records)}件")
+        return records
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            window = list(islice(messages, WINDOW_SIZE))
+            if not window:
+                break
+            scanned += len(window)
+            records.extend(r for r in executor.map(decode, window, chunksize=CHUNK_SIZE) if r)
+            print(f"  走査: {scanned}件 / 対象: {len(records)}件")
+    return records
+
+
+def main():
+    """メイン処理"""
+    args = parse_args()
+
+    if os.path.isdir(args.source):
+        messages = iter_maildir(args.source)
+    elif os.path.isfile(args.source):
+        messages = iter_mbox(args.source)
+    else:
+        print(f"エラー: {args.source} が見つかりません")
+        sys.exit(1)
+
+    decode = partial(
+        decode_message,
+        sender=args.sender,
+        after=parse_date_arg(args.after),
+        before=parse_date_arg(args.before),
+    )
+
+    print(f"取り込み開始: {args.source}（{args.workers}プロセス）")
+    started = time.perf_counter()
+    records = import_messages(messages, decode, args.workers)
+
+    # 同じメールの重複を除去し、新しい順に並べる（merge_emails.py と同じ順序）
+    unique = {}
+    for record in records:
+        key = record["id"] or record.get("messageId") or f"{record['date']}|{record['subject']}"
+        unique.setdefault(key, record)
+    emails = sorted(unique.values(), key=lambda r: r["timestamp"], reverse=True)
+    for email in emails:
+        del email["timestamp"]
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(emails, f, ensure_ascii=False, indent=2)
+
+    print(f"\n取り込み完了: {len(emails)}件（{time.perf_counter() - started:.2f}秒）")
+    print(f"保存完了: {args.output}")
+
+    if emails:
+        print("\n統計情報:")
+        print(f"  - 最新のメール日付: {emails[0]['date']}")
+        print(f"  - 最古のメール日付: {emails[-1]['date']}")
+        print(f"  - 平均本文文字数: {sum(len(e['body']) for e in emails) // len(emails)}")
+
+
+if __name__ == "__main__":
+    main()
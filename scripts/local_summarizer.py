@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+ローカル抽出型要約（TextRank 方式・NumPy/SciPy のみ）
+Gemini が使えない場合のフォールバック、送信前の本文圧縮、ベンチマークに使う
+
+- 日本語の句点（。！？）と改行で文に分割
+- 文ごとの文字n-gramベクトルのコサイン類似度でグラフを作り、PageRank で重要度を算出
+- 重要度の高い文から700文字以内に収まるように選び、元の順序で並べる
+
+使い方:
+    python3 scripts/local_summarizer.py --input data/input.json --output data/local_short.json
+    python3 scripts/local_summarizer.py --input data/input.json --benchmark --workers 4
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+from scipy import sparse
+
+import text_features
+from clean_articles import clean_greeting_lines
+
+# --- 設定 ---
+INPUT_PATH = "data/input.json"
+MAX_SUMMARY_CHARS = 700  # 要約の最大文字数
+PASSTHROUGH_MAX_CHARS = 500  # これ未満の本文は要約せずそのまま使用
+NGRAM_RANGE = (2, 3)
+DAMPING = 0.85  # PageRank のダンピング係数
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+CHUNK_SIZE = 32  # プロセスプールに渡す1回あたりの記事数
+
+_SENTENCE_RE = re.compile(r"[^。！？!?\n]*(?:[。！？!?]+[」』）)]*|\n|$)")
+
+
+# --- 関数定義 ---
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解釈"""
+    parser = argparse.ArgumentParser(description="ローカル抽出型要約")
+    parser.add_argument("--input", default=INPUT_PATH, help="入力記事JSON")
+    parser.add_argument("--output", default=None, help="要約版JSONの出力先（省略時は書き出さない）")
+    parser.add_argument("--max-chars", type=int, default=MAX_SUMMARY_CHARS, help="要約の最大文字数")
+    parser.add_argument("--workers", type=int, default=1, help="並列プロセス数（1で単一プロセス）")
+    parser.add_argument("--benchmark", action="store_true", help="処理時間と文字数の統計を表示")
+    return parser.parse_args()
+
+
+def split_sentences(text: str) -> List[str]:
+    """句点・感嘆符・疑問符・改行で文に分割（空文は除く）"""
+    return [s.strip() for s in _SENTENCE_RE.findall(text) if s.strip()]
+
+
+def sentence_vectors(sentences: List[str]) -> sparse.csr_matrix:
+    """文ごとのL2正規化済み文字n-gram出現頻度ベクトル（文書内の語彙で作成）"""
+    vocabulary: dict = {}
+    indptr = [0]
+    indices: List[int] = []
+    values: List[float] = []
+    for sentence in sentences:
+        for term, count in text_features.char_ngrams(text_features.normalize_text(sentence), NGRAM_RANGE).items():
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(float(count))
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix((values, indices, indptr), shape=(len(sentences), max(len(vocabulary), 1)))
+    return text_features.l2_normalize_rows(matrix)
+
+
+def textrank_scores(sentences: List[str]) -> np.ndarray:
+    """文の類似度グラフに PageRank を適用した重要度スコア"""
+    count = len(sentences)
+    vectors = sentence_vectors(sentences)
+    similarity = (vectors @ vectors.T).toarray()
+    np.fill_diagonal(similarity, 0.0)
+
+    # 行方向に正規化して遷移行列にする（孤立した文は一様に遷移）
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    transition = np.where(row_sums > 0, similarity / np.where(row_sums > 0, row_sums, 1.0), 1.0 / count)
+
+    scores = np.full(count, 1.0 / count)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1.0 - DAMPING) / count + DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            return updated
+        scores = updated
+    return scores
+
+
+def summarize(text: str, max_chars: int = MAX_SUMMARY_CHARS) -> str:
+    """本文を max_chars 文字以内に抽出要約（短い本文はそのまま返す）"""
+    cleaned = clean_greeting_lines(text)
+    if len(cleaned) < PASSTHROUGH_MAX_CHARS and len(text) <= max_chars:
+        return text
+    if len(cleaned) <= max_chars:
+        return cleaned
+
+    sentences = split_sentences(cleaned)
+    if len(sentences) <= 1:
+        return cleaned[:max_chars]
+
+    scores = textrank_scores(sentences)
+    selected: List[int] = []
+    length = 0
+    for index in np.argsort(-scores, kind="stable"):
+        sentence_length = len(sentences[index]) + 1  # 改行分
+        if length + sentence_length > max_chars:
+            continue
+        selected.append(int(index))
+        length += sentence_length
+
+    if not selected:
+        return sentences[0][:max_chars]
+
+    # ブログのように1文ずつ改行して元の順序で並べる
+    return "\n".join(sentences[i] for i in sorted(selected))
+
+
+def summarize_many(texts: List[str], max_chars: int = MAX_SUMMARY_CHARS, workers: int = 1) -> List[str]:
+    """複数の本文を要約（workers > 1 ならプロセスプールで並列化）"""
+    if workers <= 1 or len(texts) < CHUNK_SIZE:
+        return [summarize(text, max_chars) for text in texts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(summarize, texts, [max_chars] * len(texts), chunksize=CHUNK_SIZE))
+
+
+def load_json(path: str) -> List[dict]:
+    """JSON配列ファイルを読み込む"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"{path} は配列形式ではありません")
+        return data
+
+
+def main():
+    """メイン処理"""
+    args = parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"エラー: {args.input} が見つかりません")
+        sys.exit(1)
+
+    articles = [a for a in load_json(args.input) if not a.get("hidden")]
+    texts = [a.get("content", "") for a in articles]
+
+    started = time.perf_counter()
+    summaries = summarize_many(texts, args.max_chars, args.workers)
+    elapsed = time.perf_counter() - started
+
+    if args.output:
+        public_articles = [{**article, "content": summary} for article, summary in zip(articles, summaries)]
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(public_articles, f, ensure_ascii=False, indent=2)
+        print(f"💾 保存完了: {args.output}（{len(public_articles)}件）")
+
+    if args.benchmark or not args.output:
+        lengths = [len(s) for s in summaries]
+        summarized = sum(1 for text, summary in zip(texts, summaries) if summary != text)
+        in_range = sum(1 for length in lengths if length <= args.max_chars)
+        print(f"\n📊 ベンチマーク（{args.workers}プロセス）:")
+        print(f"  記事数: {len(texts)}件（要約 {summarized}件 / そのまま {len(texts) - summarized}件）")
+        print(f"  処理時間: {elapsed:.2f}秒（{len(texts) / elapsed if elapsed else 0:.0f}件/秒）")
+        if lengths:
+            print(f"  平均文字数: {sum(lengths) / len(lengths):.0f}文字")
+            print(f"  {args.max_chars}文字以内: {in_range}/{len(lengths)}件 ({in_range / len(lengths) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
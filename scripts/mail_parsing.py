@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+メール（RFC 822）解析ユーティリティ
+import_mbox.py などで共通利用する。標準ライブラリの email パッケージのみ使用
+"""
+
+import re
+from email import policy
+from email.message import EmailMessage
+from email.parser import BytesParser
+from email.utils import parseaddr, parsedate_to_datetime
+from html.parser import HTMLParser
+from datetime import datetime
+from typing import List, Optional
+
+SNIPPET_CHARS = 200  # Gmail API の snippet 相当の文字数
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_PARSER = BytesParser(policy=policy.default)
+
+# 改行として扱うHTML要素
+_BLOCK_TAGS = {"br", "p", "div", "tr", "li", "h1", "h2", "h3", "h4", "h5", "h6", "table", "hr"}
+# 中身を捨てるHTML要素
+_SKIP_TAGS = {"script", "style", "head", "title"}
+
+
+def parse_bytes(raw: bytes) -> EmailMessage:
+    """生のメールバイト列を EmailMessage に変換"""
+    return _PARSER.parsebytes(raw)
+
+
+def decode_text_body(message: EmailMessage) -> str:
+    """
+    text/plain パートを charset に従ってデコードし、出現順に連結（添付ファイルは除く）
+    text/plain がない場合は text/html のタグを除いたテキストを使う
+    """
+    plain: List[str] = []
+    html: List[str] = []
+    for part in message.walk():
+        if part.is_multipart() or part.get_content_disposition() == "attachment":
+            continue
+        content_type = part.get_content_type()
+        if content_type == "text/plain":
+            plain.append(_get_text(part))
+        elif content_type == "text/html" and not plain:
+            html.append(_get_text(part))
+    if plain:
+        return "".join(plain)
+    return "".join(html_to_text(text) for text in html)
+
+
+class _TextExtractor(HTMLParser):
+    """HTMLからテキストだけを取り出すパーサー"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.chunks: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self.chunks.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self.chunks.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            # HTMLのソース上の改行・連続空白は表示されないため1つの空白にまとめる
+            self.chunks.append(_WHITESPACE_RE.sub(" ", data))
+
+
+def html_to_text(html: str) -> str:
+    """HTMLのタグを除き、ブロック要素を改行にしたテキストに変換"""
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    lines = (line.strip() for line in "".join(extractor.chunks).split("\n"))
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(lines)).strip()
+
+
+def _get_text(part: EmailMessage) -> str:
+    """パートの本文を取り出す（不明な charset は UTF-8 として置換デコード）"""
+    try:
+        return part.get_content()
+    except (LookupError, UnicodeDecodeError):
+        payload = part.get_payload(decode=True) or b""
+        return payload.decode("utf-8", errors="replace")
+
+
+def make_snippet(body: str) -> str:
+    """本文の先頭を空白を詰めて短くした要約文（Gmail API の snippet 相当）"""
+    return _WHITESPACE_RE.sub(" ", body).strip()[:SNIPPET_CHARS]
+
+
+def sender_address(message: EmailMessage) -> str:
+    """From ヘッダーのメールアドレス部分（小文字）"""
+    return parseaddr(str(message.get("From", "")))[1].lower()
+
+
+def message_datetime(message: EmailMessage) -> Optional[datetime]:
+    """Date ヘッダーを datetime に変換（解析できない場合は None）"""
+    value = message.get("Date")
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def message_id(message: EmailMessage) -> str:
+    """Message-ID ヘッダー（山括弧を除く）"""
+    return str(message.get("Message-ID", "")).strip().strip("<>")
+
+
+def build_email_record(message: EmailMessage, record_id: str) -> dict:
+    """fetch_gmail_messages.py と同じ形式の元メールレコードを作成"""
+    body = decode_text_body(message)
+    return {
+        "id": record_id,
+        "subject": str(message.get("Subject", "No Subject")),
+        "date": str(message.get("Date", "Unknown Date")),
+        "body": body,
+        "snippet": make_snippet(body),
+    }
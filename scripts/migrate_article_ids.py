@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+記事IDの移行スクリプト（1回限り）
+実行ごとに変わっていた uuid4 のIDを、create_private_data.py の make_article_id と同じ
+再現可能なID（GmailメッセージID または 日付+本文のハッシュ から生成）に置き換える
+
+- プライベート版の記事を元メール（raw_emails.json）と本文で照合し、GmailメッセージIDを復元
+- 照合できない記事は 元の日付 + 本文 のハッシュからIDを生成
+- 旧ID → 新ID の対応表を書き出し（アプリのお気に入り移行にも使用）
+- --apply で指定したJSONファイルのIDを書き換える（パブリック版は同じIDを共有しているため同じ対応表で移行できる）
+- マスターデータ（public/articles.json・public/short.json）は書き換えない
+  publish_pipeline.py が対応表を読み込み時に適用し、公開用の出力（articles-app.json・索引・NDJSON）を新IDで作り直す
+
+使い方:
+    python3 scripts/migrate_article_ids.py
+    python3 scripts/migrate_article_ids.py --apply data/articles-private.json data/articles-public.json data/articles-with-flags.json
+    python3 scripts/publish_pipeline.py
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List
+
+from create_private_data import make_article_id
+
+# --- 設定 ---
+PRIVATE_PATH = "data/articles-private.json"
+RAW_EMAILS_PATHS = ["data/raw_emails.json", "data/raw_emails_2022.json"]
+MAP_PATH = "public/id-migration.json"  # アプリのお気に入り移行・publish_pipeline.py が読み込む
+PROTECTED_PATHS = {"public/articles.json", "public/short.json"}  # マスターデータ（書き換え禁止）
+
+
+# --- 関数定義 ---
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解釈"""
+    parser = argparse.ArgumentParser(description="記事IDを再現可能なIDに移行")
+    parser.add_argument("--private", default=PRIVATE_PATH, help="移行元のプライベート版記事JSON")
+    parser.add_argument("--raw", nargs="*", default=RAW_EMAILS_PATHS, help="GmailメッセージID照合用の元メールJSON")
+    parser.add_argument("--map", default=MAP_PATH, help="旧ID → 新ID 対応表の出力先")
+    parser.add_argument("--apply", nargs="*", default=[], help="IDを書き換えるJSONファイル（上書き）")
+    return parser.parse_args()
+
+
+def load_json(path: str) -> List[dict]:
+    """JSON配列ファイルを読み込む"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"{path} は配列形式ではありません")
+        return data
+
+
+def save_json(path: str, data) -> None:
+    """JSONを書き出し"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def build_id_map(private_articles: List[dict], raw_emails: List[dict]) -> Dict[str, str]:
+    """旧ID → 新ID の対応表を作成"""
+    emails_by_key = {(e.get("date", ""), e.get("body", "")): e for e in raw_emails}
+
+    id_map: Dict[str, str] = {}
+    matched = 0
+    for article in private_articles:
+        key = (article.get("originalDate", ""), article.get("content", ""))
+        email = emails_by_key.get(key)
+        if email:
+            matched += 1
+        else:
+            # 元メールが見つからない場合は本文ハッシュでIDを生成
+            email = {"date": key[0], "body": key[1]}
+        id_map[article["id"]] = make_article_id(email)
+
+    print(f"GmailメッセージIDで照合: {matched}件 / 本文ハッシュ: {len(private_articles) - matched}件")
+    return id_map
+
+
+def apply_id_map(path: str, id_map: Dict[str, str]) -> int:
+    """JSONファイル内の記事IDを書き換え、書き換えた件数を返す"""
+    articles = load_json(path)
+    changed = 0
+    for article in articles:
+        new_id = id_map.get(article.get("id"))
+        if new_id and new_id != article["id"]:
+            article["id"] = new_id
+            changed += 1
+    save_json(path, articles)
+    return changed
+
+
+def main():
+    """メイン処理"""
+    args = parse_args()
+
+    if not os.path.exists(args.private):
+        print(f"エラー: {args.private} が見つかりません")
+        sys.exit(1)
+
+    private_articles = load_json(args.private)
+    raw_emails: List[dict] = []
+    for path in args.raw:
+        if os.path.exists(path):
+            raw_emails.extend(load_json(path))
+        else:
+            print(f"  {path} が見つからないため照合に使いません")
+
+    id_map = build_id_map(private_articles, raw_emails)
+
+    # 新IDの重複チェック（同一メールが重複登録されていた場合）
+    duplicates = len(id_map) - len(set(id_map.values()))
+    if duplicates:
+        print(f"⚠ 新IDが重複する記事が{duplicates}件あります（同じメールの重複登録）")
+
+    save_json(args.map, id_map)
+    print(f"💾 対応表を保存しました: {args.map}（{len(id_map)}件）")
+
+    for path in args.apply:
+        if os.path.normpath(path) in PROTECTED_PATHS:
+            print(f"  {path} はマスターデータのため書き換えません（publish_pipeline.py が対応表で新IDに置き換えます）")
+            continue
+        if not os.path.exists(path):
+            print(f"  {path} が見つからないためスキップします")
+            continue
+        changed = apply_id_map(path, id_map)
+        print(f"  ✓ {path}: {changed}件のIDを書き換えました")
+
+    print("\n公開用の出力を新IDで作り直すため、続けて publish_pipeline.py を実行してください")
+
+
+if __name__ == "__main__":
+    main()
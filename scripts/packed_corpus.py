@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+記事コーパスのパック形式（mmap でランダムアクセス）
+JSON全体を読み込まずに、記事ID・通し番号で1件だけ取り出す
+
+ファイル構成（リトルエンディアン）:
+    ヘッダー      : マジック, バージョン, 件数, 各セクションの位置
+    インデックス  : 固定長レコード（IDハッシュ順）
+                    IDハッシュ uint64, 通し番号 uint32（非表示は0）, 日付 uint32（YYYYMMDD）,
+                    カテゴリー番号 uint16, フラグ uint16（bit0: hidden）, 本文位置 uint64, 本文長 uint32
+    通し番号表    : uint32 × 最大の通し番号（通し番号 n → インデックスの位置、欠番は 0xFFFFFFFF）
+    入力順表      : uint32 × 件数（日付昇順 → インデックスの位置）
+    カテゴリー表  : カテゴリー名のJSON配列（UTF-8）
+    本文          : 記事ごとのJSON（UTF-8）を連結
+
+publish_pipeline.py の出力を読み込み、アプリと同じ通し番号（number）をそのまま使う
+（クリーニング時のタイトル非表示も反映済みのため、番号を振り直さない）
+
+使い方:
+    python3 scripts/packed_corpus.py build
+    python3 scripts/packed_corpus.py build --input /tmp/articles-app.json --output /tmp/articles.pack
+    python3 scripts/packed_corpus.py get --number 842
+    python3 scripts/packed_corpus.py get --id 1b4e28ba-2fa1-5ed2-883f-0e4f4b0a1a2c
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, Iterator, List, Optional
+
+from publish_pipeline import read_sorted, write_json_array
+
+# --- 設定 ---
+INPUT_PATH = "public/articles-app.json"  # publish_pipeline.py の出力（読み込みのみ）
+PACK_PATH = "data/articles.pack"
+
+MAGIC = b"ARTPACK\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIIQQQQIQ")  # マジック, バージョン, レコード長, 件数, 最大の通し番号, 各セクション位置, カテゴリー表の長さ, 本文位置
+RECORD = struct.Struct("<QIIHHQI")  # IDハッシュ, 通し番号, 日付, カテゴリー番号, フラグ, 本文位置, 本文長
+UINT32 = struct.Struct("<I")
+FLAG_HIDDEN = 1
+NO_SLOT = 0xFFFFFFFF  # 通し番号表の欠番
+
+
+# --- 関数定義 ---
+
+def id_hash(article_id: str) -> int:
+    """記事IDの64ビットハッシュ"""
+    return int.from_bytes(hashlib.blake2b(article_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def date_to_int(date: str) -> int:
+    """YYYY-MM-DD を YYYYMMDD の整数に変換（解析できない場合は0）"""
+    digits = date[:10].replace("-", "")
+    return int(digits) if len(digits) == 8 and digits.isdigit() else 0
+
+
+def build_pack(articles: Iterator[dict], output_path: str) -> int:
+    """
+    日付昇順の記事からパックファイルを作成し、件数を返す
+    記事の通し番号（number）は入力のまま使う（非表示の記事は0）
+    """
+    blob = bytearray()
+    categories: Dict[str, int] = {}
+    entries: List[tuple] = []  # 入力順
+    for article in articles:
+        data = json.dumps(article, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        category = categories.setdefault(article.get("category", ""), len(categories))
+        entries.append((
+            id_hash(article["id"]),
+            0 if article.get("hidden") else article.get("number") or 0,
+            date_to_int(article.get("date", "")),
+            category,
+            FLAG_HIDDEN if article.get("hidden") else 0,
+            len(blob),
+            len(data),
+        ))
+        blob += data
+
+    # インデックスはIDハッシュ順（同じハッシュは入力順）
+    order = sorted(range(len(entries)), key=lambda i: (entries[i][0], i))
+    position = {entry_index: slot for slot, entry_index in enumerate(order)}
+    visible_count = max((entry[1] for entry in entries), default=0)
+    numbers = [NO_SLOT] * visible_count
+    for entry_index, entry in enumerate(entries):
+        if entry[1]:
+            numbers[entry[1] - 1] = position[entry_index]
+
+    category_table = json.dumps(list(categories), ensure_ascii=False).encode("utf-8")
+    index_offset = HEADER.size
+    numbers_offset = index_offset + RECORD.size * len(entries)
+    order_offset = numbers_offset + UINT32.size * visible_count
+    categories_offset = order_offset + UINT32.size * len(entries)
+    blob_offset = categories_offset + len(category_table)
+
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, len(entries), visible_count,
+                            index_offset, numbers_offset, order_offset,
+                            categories_offset, len(category_table), blob_offset))
+        for entry_index in order:
+            f.write(RECORD.pack(*entries[entry_index]))
+        f.write(struct.pack(f"<{visible_count}I", *numbers))
+        f.write(struct.pack(f"<{len(entries)}I", *(position[i] for i in range(len(entries)))))
+        f.write(category_table)
+        f.write(blob)
+    os.replace(temp_path, output_path)
+    return len(entries)
+
+
+class PackedCorpus:
+    """
+    パックファイルの読み取り（mmap のため必要な部分だけがメモリに載る）
+
+    with PackedCorpus("data/articles.pack") as corpus:
+        article = corpus.get_by_number(842)
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, record_size, self._count, self._visible_count,
+         self._index_offset, self._numbers_offset, self._order_offset,
+         categories_offset, categories_length, self._blob_offset) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{path} は対応していないパックファイルです")
+        self.categories: List[str] = json.loads(
+            self._map[categories_offset:categories_offset + categories_length].decode("utf-8"))
+
+    def close(self) -> None:
+        """ファイルを閉じる"""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "PackedCorpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def visible_count(self) -> int:
+        """通し番号の最大値"""
+        return self._visible_count
+
+    def _record(self, slot: int) -> tuple:
+        return RECORD.unpack_from(self._map, self._index_offset + RECORD.size * slot)
+
+    def _load(self, record: tuple) -> dict:
+        start = self._blob_offset + record[5]
+        return json.loads(self._map[start:start + record[6]].decode("utf-8"))
+
+    def get_by_id(self, article_id: str) -> Optional[dict]:
+        """記事IDで1件取得（IDハッシュの二分探索）"""
+        target = id_hash(article_id)
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._record(mid)[0] < target:
+                low = mid + 1
+            else:
+                high = mid
+        # ハッシュが衝突した場合に備えて本文のIDを確認
+        while low < self._count:
+            record = self._record(low)
+            if record[0] != target:
+                break
+            article = self._load(record)
+            if article.get("id") == article_id:
+                return article
+            low += 1
+        return None
+
+    def get_by_number(self, number: int) -> Optional[dict]:
+        """通し番号で1件取得"""
+        if not 1 <= number <= self._visible_count:
+            return None
+        slot = UINT32.unpack_from(self._map, self._numbers_offset + UINT32.size * (number - 1))[0]
+        if slot == NO_SLOT:
+            return None
+        return self._load(self._record(slot))
+
+    def iter(
+        self,
+        include_hidden: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        日付昇順に記事を返す
+        条件（日付は YYYY-MM-DD、両端を含む）はインデックスだけで判定し、該当する記事の本文のみ読み込む
+        """
+        start = date_to_int(start_date) if start_date else 0
+        end = date_to_int(end_date) if end_date else 99999999
+        category_index = self.categories.index(category) if category in self.categories else None
+        if category is not None and category_index is None:
+            return
+        for i in range(self._count):
+            slot = UINT32.unpack_from(self._map, self._order_offset + UINT32.size * i)[0]
+            record = self._record(slot)
+            if record[4] & FLAG_HIDDEN and not include_hidden:
+                continue
+            if not start <= record[2] <= end:
+                continue
+            if category_index is not None and record[3] != category_index:
+                continue
+            yield self._load(record)
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.iter()
+
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解釈"""
+    parser = argparse.ArgumentParser(description="記事コーパスのパック形式")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="記事JSONからパックファイルを作成")
+    build_parser.add_argument("--input", default=INPUT_PATH, help="通し番号付き記事JSON（publish_pipeline.py の出力）")
+    build_parser.add_argument("--output", default=PACK_PATH, help="出力先のパックファイル")
+
+    get_parser = subparsers.add_parser("get", help="記事を1件取り出して表示")
+    get_parser.add_argument("--pack", default=PACK_PATH, help="パックファイル")
+    group = get_parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--id", help="記事ID")
+    group.add_argument("--number", type=int, help="通し番号")
+
+    export_parser = subparsers.add_parser("export", help="パックファイルを記事JSONに戻す")
+    export_parser.add_argument("--pack", default=PACK_PATH, help="パックファイル")
+    export_parser.add_argument("--output", required=True, help="出力先の記事JSON")
+    export_parser.add_argument("--visible-only", action="store_true", help="非表示の記事を除く")
+    return parser.parse_args()
+
+
+def main():
+    """メイン処理"""
+    args = parse_args()
+
+    if args.command == "build":
+        if not os.path.exists(args.input):
+            print(f"エラー: {args.input} が見つかりません（先に publish_pipeline.py を実行してください）")
+            sys.exit(1)
+        started = time.perf_counter()
+        count = build_pack(read_sorted(args.input), args.output)
+        size = os.path.getsize(args.output)
+        print(f"💾 {args.output}: {count}件 / {size / 1024 / 1024:.1f}MB（{time.perf_counter() - started:.2f}秒）")
+        return
+
+    if not os.path.exists(args.pack):
+        print(f"エラー: {args.pack} が見つかりません（先に build を実行してください）")
+        sys.exit(1)
+
+    with PackedCorpus(args.pack) as corpus:
+        if args.command == "export":
+            count = write_json_array(corpus.iter(include_hidden=not args.visible_only), args.output)
+            print(f"💾 {args.output}: {count}件")
+            return
+
+        started = time.perf_counter()
+        article = corpus.get_by_id(args.id) if args.id else corpus.get_by_number(args.number)
+        elapsed_us = (time.perf_counter() - started) * 1_000_000
+        if article is None:
+            print("該当する記事がありません")
+            sys.exit(1)
+        print(json.dumps(article, ensure_ascii=False, indent=2))
+        print(f"\n（{elapsed_us:.0f}マイクロ秒）", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
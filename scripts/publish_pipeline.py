@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+公開用データ作成パイプライン（clean → hide → number → publish）
+clean_articles.py・add_hidden_flags.py・public/articles-app.json へのコピーを1回の走査で行う
+
+- 入力JSONは一度全件を読み込み、メモリ上で日付昇順に並べる（通し番号・除外ルールの前提）
+  そのためピークのメモリ使用量は入力全体の大きさになる（ストリーミングで省けるのは中間ファイルとステージごとのコピー）
+- 並べ替えた後の各ステージは記事を1件ずつ受け取って返すジェネレーターで、中間ファイルを作らない
+- 非表示の記事も hidden: true のまま出力し、表示中の記事には通し番号（number）を付ける
+- 出力は1件ずつ書き出し、最後に置き換える（途中で失敗しても既存の出力は壊れない）
+- 静的ページ生成（app/articles/[number]・app/categories/[category]）用に、表示中の記事の索引も書き出す
+- アプリの段階読み込み用に、表示中の記事を通し番号順のNDJSON（1行1記事）でも書き出す
+- 記事IDの対応表（migrate_article_ids.py の出力）があれば、読み込み時に旧IDを新IDに置き換える
+  （public/short.json は書き換えられないため、非表示の照合・出力はここで新IDに揃える）
+
+使い方:
+    python3 scripts/publish_pipeline.py
+    python3 scripts/publish_pipeline.py --input data/articles-public.json --flags data/articles-with-flags.json
+    python3 scripts/publish_pipeline.py --input data/articles-private.json --rules --output /tmp/articles-app.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List
+
+from add_hidden_flags import hide_by_ids, hide_by_rules, load_hidden_ids, number_visible
+from clean_articles import clean_stage
+
+# --- 設定 ---
+INPUT_PATH = "public/short.json"  # create_public_data.py の出力（読み込みのみ）
+OUTPUT_PATH = "public/articles-app.json"
+FLAGS_PATH = "data/articles-with-flags.json"  # add_hidden_flags.py の出力（非表示の記事ID）
+INDEX_PATH = "public/article-index.json"  # 静的ページ生成用の索引（lib/publishedArticles.ts が読み込む）
+NDJSON_PATH = "public/articles-app.ndjson"  # 段階読み込み用（lib/articleFeed.ts が読み込む）
+ID_MAP_PATH = "public/id-migration.json"  # migrate_article_ids.py の旧ID → 新ID 対応表
+
+
+# --- 関数定義 ---
+
+def parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解釈"""
+    parser = argparse.ArgumentParser(description="公開用データ作成パイプライン")
+    parser.add_argument("--input", default=INPUT_PATH, help="入力データ（要約済みの記事JSON）")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="出力データ（アプリ読み込み用JSON）")
+    parser.add_argument("--flags", default=FLAGS_PATH,
+                        help="非表示の記事IDを読み込むJSON（add_hidden_flags.py の出力。記事IDで照合）")
+    parser.add_argument("--index", default=INDEX_PATH, help="静的ページ生成用の索引の出力先")
+    parser.add_argument("--ndjson", default=NDJSON_PATH, help="段階読み込み用NDJSON（表示中の記事のみ）の出力先")
+    parser.add_argument("--id-map", default=ID_MAP_PATH,
+                        help="旧ID → 新ID 対応表（migrate_article_ids.py の出力。あれば読み込み時にIDを置き換える）")
+    parser.add_argument("--rules", action="store_true",
+                        help="--flags の代わりに add_hidden_flags.py の除外ルールを直接適用（入力が全記事の場合のみ）")
+    return parser.parse_args()
+
+
+def read_sorted(path: str) -> Iterator[dict]:
+    """入力JSONを全件読み込んでメモリ上で日付昇順（同日は入力順）に並べ、1件ずつ返す"""
+    with open(path, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    if not isinstance(articles, list):
+        raise ValueError(f"{path} は配列形式ではありません")
+    yield from sorted(articles, key=lambda a: a.get("date", ""))
+
+
+def remap_ids(articles: Iterable[dict], id_map: Dict[str, str], stats: Dict[str, int]) -> Iterator[dict]:
+    """旧IDの記事を新IDに置き換える（対応表にないIDはそのまま）"""
+    stats.setdefault("remapped", 0)
+    for article in articles:
+        new_id = id_map.get(article.get("id"))
+        if new_id and new_id != article["id"]:
+            article["id"] = new_id
+            stats["remapped"] += 1
+        yield article
+
+
+def write_json_array(articles: Iterable[dict], path: str) -> int:
+    """
+    記事を1件ずつJSON配列として書き出し、件数を返す
+    出力は json.dump(..., indent=2) と同じ書式
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+
+    count = 0
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for article in articles:
+            item = json.dumps(article, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+            f.write(("," if count else "") + "\n  " + item)
+            count += 1
+        f.write("\n]" if count else "]")
+    os.replace(temp_path, path)
+    return count
+
+
+@contextmanager
+def open_replacing(path: str):
+    """一時ファイルに書き込み、with を抜けた時に置き換える（例外時は既存ファイルを残す）"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    f = open(temp_path, "w", encoding="utf-8")
+    try:
+        yield f
+    except BaseException:
+        f.close()
+        os.remove(temp_path)
+        raise
+    f.close()
+    os.replace(temp_path, path)
+
+
+def write_article_index(entries: List[dict], path: str) -> None:
+    """表示中の記事の索引（通し番号・ID・カテゴリー）とカテゴリー一覧を書き出す"""
+    index = {
+        "categories": sorted({entry["category"] for entry in entries}),
+        "articles": entries,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_pipeline(args: argparse.Namespace, stats: Dict[str, Dict[str, int]]) -> Iterator[dict]:
+    """入力から出力直前までのステージを連結"""
+    articles: Iterator[dict] = read_sorted(args.input)
+
+    # 非表示の照合（記事ID）より前に新IDに揃える
+    if os.path.exists(args.id_map):
+        with open(args.id_map, "r", encoding="utf-8") as f:
+            articles = remap_ids(articles, json.load(f), stats["ids"])
+
+    if args.rules:
+        # 除外ルールの通し番号はタイトルによる非表示（clean）より前の番号のため、hide を先に適用
+        articles = hide_by_rules(articles, stats["hide"])
+        articles = clean_stage(articles, stats["clean"], verbose=False)
+    else:
+        articles = clean_stage(articles, stats["clean"], verbose=False)
+        if os.path.exists(args.flags):
+            articles = hide_by_ids(articles, load_hidden_ids(args.flags), stats["hide"])
+        else:
+            print(f"  {args.flags} が見つからないため、記事IDによる非表示はスキップします")
+
+    return number_visible(articles)
+
+
+def main():
+    """メイン処理"""
+    args = parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"エラー: {args.input} が見つかりません")
+        sys.exit(1)
+
+    print(f"📖 入力: {args.input}")
+    started = time.perf_counter()
+
+    stats: Dict[str, Dict[str, int]] = {"clean": {}, "hide": {}, "ids": {}}
+    index_entries: List[dict] = []
+
+    with open_replacing(args.ndjson) as feed:
+        def collect_visible(articles: Iterable[dict]) -> Iterator[dict]:
+            """表示中の記事を索引とNDJSONに書き出しながらそのまま流す（出力は日付昇順 = 通し番号順）"""
+            for article in articles:
+                if not article.get("hidden"):
+                    index_entries.append({
+                        "number": article["number"],
+                        "id": article["id"],
+                        "category": article.get("category", ""),
+                    })
+                    feed.write(json.dumps(article, ensure_ascii=False, separators=(",", ":")) + "\n")
+                yield article
+
+        total = write_json_array(collect_visible(build_pipeline(args, stats)), args.output)
+    write_article_index(index_entries, args.index)
+
+    print(f"\n{'='*50}")
+    print("📊 処理結果")
+    print(f"{'='*50}")
+    print(f"総記事数: {total}件")
+    print(f"表示: {len(index_entries)}件 / 非表示: {total - len(index_entries)}件")
+    if stats["ids"]:
+        print(f"記事IDの移行: {stats['ids'].get('remapped', 0)}件")
+    print(f"タイトルによる非表示: {stats['clean'].get('hidden', 0)}件")
+    print(f"本文クリーニング: {stats['clean'].get('cleaned', 0)}件")
+    for step, count in stats["hide"].items():
+        print(f"{step}: {count}件")
+    print(f"処理時間: {time.perf_counter() - started:.2f}秒")
+    print(f"\n💾 保存完了: {args.output}")
+    print(f"💾 索引: {args.index}")
+    print(f"💾 NDJSON: {args.ndjson}")
+
+
+if __name__ == "__main__":
+    main()
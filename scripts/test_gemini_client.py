@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+gemini_client.py のテスト
+
+使い方:
+    cd scripts && python3 -m unittest test_gemini_client
+"""
+
+import unittest
+
+from gemini_client import JsonArrayStreamParser
+
+
+class JsonArrayStreamParserTest(unittest.TestCase):
+    """分割されたJSON配列の逐次解析"""
+
+    def test_object_split_across_chunks(self):
+        parser = JsonArrayStreamParser()
+        self.assertEqual(parser.feed('[{"id": 0}, {"i'), [{"id": 0}])
+        self.assertEqual(parser.feed('d": 1}]'), [{"id": 1}])
+        self.assertTrue(parser.finished)
+
+    def test_number_split_inside_scalar(self):
+        parser = JsonArrayStreamParser()
+        self.assertEqual(parser.feed("[12"), [])
+        self.assertEqual(parser.feed("3, 4"), [123])
+        self.assertEqual(parser.feed("5]"), [45])
+        self.assertTrue(parser.finished)
+
+    def test_literal_waits_for_delimiter(self):
+        parser = JsonArrayStreamParser()
+        self.assertEqual(parser.feed('["a", true'), ["a"])
+        self.assertEqual(parser.feed("\n"), [True])
+        self.assertEqual(parser.feed("]"), [])
+        self.assertEqual(parser.pending_text, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
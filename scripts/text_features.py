@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+文字n-gram TF-IDF ベクトル化（NumPy/SciPy のみ）
+カテゴリー分類・抽出型要約・関連記事インデックスで共通利用する
+
+日本語は単語区切りがないため、形態素解析の代わりに文字n-gramを使う
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+DEFAULT_NGRAM_RANGE = (2, 3)
+DEFAULT_MIN_DF = 2
+DEFAULT_MAX_FEATURES = 50000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """全角半角を統一（NFKC）し、小文字化・空白を1つに圧縮"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE) -> Counter:
+    """正規化済みテキストから文字n-gramの出現回数を数える"""
+    counts: Counter = Counter()
+    min_n, max_n = ngram_range
+    length = len(text)
+    for n in range(min_n, max_n + 1):
+        counts.update(text[i:i + n] for i in range(length - n + 1))
+    return counts
+
+
+def fit_vocabulary(
+    texts: Iterable[str],
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE,
+    min_df: int = DEFAULT_MIN_DF,
+    max_features: int = DEFAULT_MAX_FEATURES,
+) -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    文書頻度から語彙とIDFを作成
+
+    Returns:
+        (n-gram -> 列番号 の辞書, IDF配列)
+    """
+    counts = [char_ngrams(normalize_text(text), ngram_range) for text in texts]
+    return _vocabulary_from_counts(counts, min_df, max_features)
+
+
+def _vocabulary_from_counts(
+    counts: List[Counter], min_df: int, max_features: int
+) -> Tuple[Dict[str, int], np.ndarray]:
+    """文書ごとのn-gram出現回数から語彙とIDFを作成"""
+    doc_freq: Counter = Counter()
+    for document in counts:
+        doc_freq.update(document.keys())
+
+    # 文書頻度の高い順に max_features 件まで採用（同順位はn-gram順で決定的に）
+    candidates = [(term, df) for term, df in doc_freq.items() if df >= min_df]
+    candidates.sort(key=lambda item: (-item[1], item[0]))
+    candidates = candidates[:max_features]
+
+    vocabulary = {term: index for index, (term, _) in enumerate(candidates)}
+    df = np.array([df for _, df in candidates], dtype=np.float64)
+    idf = np.log((1.0 + len(counts)) / (1.0 + df)) + 1.0
+    return vocabulary, idf
+
+
+def _counts_to_tfidf(counts: List[Counter], vocabulary: Dict[str, int], idf: np.ndarray) -> sparse.csr_matrix:
+    """文書ごとのn-gram出現回数をL2正規化済みTF-IDF疎行列に変換"""
+    indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+    index_chunks: List[np.ndarray] = []
+    count_chunks: List[np.ndarray] = []
+
+    for row, document in enumerate(counts):
+        pairs = [(vocabulary.get(term), count) for term, count in document.items()]
+        columns = [column for column, _ in pairs if column is not None]
+        index_chunks.append(np.array(columns, dtype=np.int32))
+        count_chunks.append(np.array([count for column, count in pairs if column is not None], dtype=np.float64))
+        indptr[row + 1] = indptr[row] + len(columns)
+
+    indices = np.concatenate(index_chunks) if index_chunks else np.zeros(0, dtype=np.int32)
+    values = np.concatenate(count_chunks) if count_chunks else np.zeros(0)
+    values = (1.0 + np.log(values)) * idf[indices]  # サブリニアTF × IDF
+
+    matrix = sparse.csr_matrix((values, indices, indptr), shape=(len(counts), len(vocabulary)))
+    return l2_normalize_rows(matrix)
+
+
+def transform(
+    texts: Iterable[str],
+    vocabulary: Dict[str, int],
+    idf: np.ndarray,
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE,
+) -> sparse.csr_matrix:
+    """テキストをL2正規化済みのTF-IDF疎行列（文書数 × 語彙数）に変換"""
+    counts = [char_ngrams(normalize_text(text), ngram_range) for text in texts]
+    return _counts_to_tfidf(counts, vocabulary, idf)
+
+
+def fit_transform(
+    texts: List[str],
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE,
+    min_df: int = DEFAULT_MIN_DF,
+    max_features: int = DEFAULT_MAX_FEATURES,
+) -> Tuple[sparse.csr_matrix, Dict[str, int], np.ndarray]:
+    """語彙作成と変換をまとめて実行（n-gramの数え上げは1回のみ）"""
+    counts = [char_ngrams(normalize_text(text), ngram_range) for text in texts]
+    vocabulary, idf = _vocabulary_from_counts(counts, min_df, max_features)
+    return _counts_to_tfidf(counts, vocabulary, idf), vocabulary, idf
+
+
+def l2_normalize_rows(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    """各行をL2ノルム1に正規化（ゼロ行はそのまま）"""
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).dot(matrix).tocsr()
@@ -2,9 +2,16 @@
  * Zustand状態管理のテスト
  */
 
-import { renderHook, act } from '@testing-library/react';
+import { renderHook, act, waitFor } from '@testing-library/react';
 import { useStore } from './useStore';
 import { Article } from '@/types';
+import {
+  ChunkStore,
+  createMemoryChunkStore,
+  setReadingStateStore,
+  writeReadingBit,
+  loadReadingNumbers
+} from '@/lib/readingState';
 
 // テスト用の記事データ
 const mockArticles: Article[] = [
@@ -78,6 +85,8 @@ describe('useStore', () => {
       expect(result.current.readHistory).toEqual([]);
       expect(result.current.currentArticle).toBeNull();
       expect(result.current.categoryFilter).toBeNull();
+      expect(result.current.feedComplete).toBe(false);
+      expect(result.current.readingStateRestored).toBe(false);
     });
   });
 
@@ -94,6 +103,33 @@ describe('useStore', () => {
     });
   });
 
+  describe('appendArticles', () => {
+    it('読み込み済みの記事の後ろに追加できる', () => {
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles.slice(0, 2));
+        result.current.appendArticles(mockArticles.slice(2));
+      });
+
+      expect(result.current.articles.map(a => a.id)).toEqual(['article-1', 'article-2', 'article-3']);
+    });
+
+    it('読み込み済みの記事IDと非表示の記事は追加しない', () => {
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles.slice(0, 2));
+        result.current.appendArticles([
+          mockArticles[1],
+          { ...mockArticles[2], hidden: true }
+        ]);
+      });
+
+      expect(result.current.articles.map(a => a.id)).toEqual(['article-1', 'article-2']);
+    });
+  });
+
   describe('getRandomArticle', () => {
     it('記事をランダムに取得できる', () => {
       const { result } = renderHook(() => useStore());
@@ -180,4 +216,210 @@ describe('useStore', () => {
       expect(articles.every(a => a.category === 'マインドセット')).toBe(true);
     });
   });
+
+  describe('migrateArticleIds', () => {
+    it('お気に入りの記事IDを新しいIDに移行できる', () => {
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.toggleFavorite('old-id');
+        result.current.migrateArticleIds({ 'old-id': 'article-1' });
+      });
+
+      expect(result.current.isFavorite('article-1')).toBe(true);
+      expect(result.current.isFavorite('old-id')).toBe(false);
+    });
+  });
+
+  describe('toggleRead', () => {
+    it('読了に設定・解除できる', () => {
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.toggleRead('article-1');
+      });
+
+      expect(result.current.isRead('article-1')).toBe(true);
+      expect(result.current.readHistory).toHaveLength(1);
+
+      act(() => {
+        result.current.toggleRead('article-1');
+      });
+
+      expect(result.current.isRead('article-1')).toBe(false);
+      expect(result.current.readHistory).toHaveLength(0);
+    });
+  });
+
+  describe('読了・お気に入りの保存（IndexedDB）', () => {
+    let store: ChunkStore;
+
+    beforeEach(() => {
+      store = createMemoryChunkStore();
+      setReadingStateStore(store);
+    });
+
+    afterEach(() => {
+      setReadingStateStore(null);
+    });
+
+    it('初回はlocalStorageのお気に入りを通し番号で移行する', async () => {
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles);
+        result.current.toggleFavorite('article-2');
+      });
+      await act(async () => {
+        await result.current.restoreReadingState();
+      });
+
+      expect(await loadReadingNumbers(store)).toEqual({ read: [], favorite: [2] });
+      expect(result.current.isFavorite('article-2')).toBe(true);
+      // 移行後はlocalStorageにお気に入りを保存しない
+      const persisted = useStore.persist.getOptions().partialize!(useStore.getState());
+      expect(persisted).not.toHaveProperty('favorites');
+    });
+
+    it('移行前はlocalStorageにもお気に入りを保存する', () => {
+      const persisted = useStore.persist.getOptions().partialize!(useStore.getState());
+
+      expect(persisted).toHaveProperty('favorites');
+    });
+
+    it('保存済みの状態を記事IDに戻して復元する', async () => {
+      await writeReadingBit(store, 'read', 1, true);
+      await writeReadingBit(store, 'favorite', 3, true);
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles);
+      });
+      await act(async () => {
+        await result.current.restoreReadingState();
+      });
+
+      expect(result.current.isRead('article-1')).toBe(true);
+      expect(result.current.isFavorite('article-3')).toBe(true);
+      expect(result.current.isFavorite('article-1')).toBe(false);
+      expect(result.current.readingStateRestored).toBe(true);
+    });
+
+    it('復元前の切り替えを保存済みの状態に反映する', async () => {
+      await writeReadingBit(store, 'favorite', 1, true);
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles);
+        result.current.toggleFavorite('article-2');
+      });
+      await act(async () => {
+        await result.current.restoreReadingState();
+      });
+
+      expect(result.current.favorites.map(f => f.articleId)).toEqual(['article-1', 'article-2']);
+      expect(await loadReadingNumbers(store)).toEqual({ read: [], favorite: [1, 2] });
+    });
+
+    it('復元中の切り替えも保存済みの状態に反映する', async () => {
+      await writeReadingBit(store, 'favorite', 1, true);
+      const update = store.update;
+      // 復元前の切り替えを保存している間に読了を切り替える
+      jest.spyOn(store, 'update').mockImplementationOnce(async (key, updater) => {
+        useStore.getState().toggleRead('article-3');
+        await update(key, updater);
+      });
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles);
+        result.current.toggleFavorite('article-2');
+      });
+      await act(async () => {
+        await result.current.restoreReadingState();
+      });
+
+      expect(result.current.isRead('article-3')).toBe(true);
+      expect(result.current.favorites.map(f => f.articleId)).toEqual(['article-1', 'article-2']);
+      expect(await loadReadingNumbers(store)).toEqual({ read: [3], favorite: [1, 2] });
+    });
+
+    it('初回の移行中の切り替えも保存する', async () => {
+      const putMany = store.putMany;
+      jest.spyOn(store, 'putMany').mockImplementationOnce(async entries => {
+        useStore.getState().toggleFavorite('article-1');
+        await putMany(entries);
+      });
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles);
+        result.current.toggleFavorite('article-2');
+      });
+      await act(async () => {
+        await result.current.restoreReadingState();
+      });
+
+      expect(result.current.isFavorite('article-1')).toBe(true);
+      expect(result.current.isFavorite('article-2')).toBe(true);
+      expect(await loadReadingNumbers(store)).toEqual({ read: [], favorite: [1, 2] });
+    });
+
+    it('復元後の切り替えは該当するチャンクのみ書き込む', async () => {
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles);
+      });
+      await act(async () => {
+        await result.current.restoreReadingState();
+      });
+      const update = jest.spyOn(store, 'update');
+
+      act(() => {
+        result.current.toggleRead('article-3');
+      });
+
+      await waitFor(async () => {
+        expect(await loadReadingNumbers(store)).toEqual({ read: [3], favorite: [] });
+      });
+      expect(update).toHaveBeenCalledTimes(1);
+      expect(update.mock.calls[0][0]).toBe('read:0');
+    });
+
+    it('エクスポートした状態をインポートで復元できる', async () => {
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles);
+        result.current.toggleRead('article-1');
+        result.current.toggleFavorite('article-3');
+      });
+      const exported = result.current.exportReadingState();
+
+      act(() => {
+        result.current.reset();
+        result.current.loadArticles(mockArticles);
+      });
+      await act(async () => {
+        await result.current.importReadingState(exported);
+      });
+
+      expect(result.current.isRead('article-1')).toBe(true);
+      expect(result.current.isFavorite('article-3')).toBe(true);
+      expect(await loadReadingNumbers(store)).toEqual({ read: [1], favorite: [3] });
+    });
+
+    it('形式が正しくないインポートは状態を変更しない', async () => {
+      const { result } = renderHook(() => useStore());
+
+      act(() => {
+        result.current.loadArticles(mockArticles);
+        result.current.toggleFavorite('article-1');
+      });
+
+      await expect(result.current.importReadingState('{}')).rejects.toThrow('Invalid reading state export');
+      expect(result.current.isFavorite('article-1')).toBe(true);
+    });
+  });
 });
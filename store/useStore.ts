@@ -5,18 +5,51 @@
 import { create } from 'zustand';
 import { persist } from 'zustand/middleware';
 import { Article, ReadHistory, Favorite, AppState } from '@/types';
-import { getRandomArticle, getArticlesByCategory } from '@/lib/articles';
+import { getRandomArticle, getArticlesByCategory, remapFavoriteIds } from '@/lib/articles';
+import {
+  ChunkStore,
+  ReadingKind,
+  ReadingNumbers,
+  getReadingStateStore,
+  getNumberIndex,
+  writeReadingBit,
+  loadReadingNumbers,
+  replaceReadingNumbers,
+  serializeReadingState,
+  parseReadingState
+} from '@/lib/readingState';
 
 interface StoreActions {
   /** 記事データを読み込み */
   loadArticles: (articles: Article[]) => void;
 
+  /** 記事データを追加（段階読み込み用・読み込み済みの記事IDは無視） */
+  appendArticles: (articles: Article[]) => void;
+
+  /** 記事データの全件読み込みの完了を設定 */
+  setFeedComplete: (complete: boolean) => void;
+
   /** お気に入りに追加/削除（トグル） */
   toggleFavorite: (articleId: string) => void;
 
   /** 記事がお気に入りかチェック */
   isFavorite: (articleId: string) => boolean;
 
+  /** 読了に設定/解除（トグル） */
+  toggleRead: (articleId: string) => void;
+
+  /** 記事が読了済みかチェック */
+  isRead: (articleId: string) => boolean;
+
+  /** IndexedDB から読了・お気に入りを復元（全記事の読み込み後に1回呼ぶ） */
+  restoreReadingState: () => Promise<void>;
+
+  /** 読了・お気に入りをエクスポート形式の文字列で取得 */
+  exportReadingState: () => string;
+
+  /** エクスポート形式の文字列から読了・お気に入りを置き換え */
+  importReadingState: (text: string) => Promise<void>;
+
   /** ランダムに記事を取得 */
   getRandomArticle: () => Article | null;
 
@@ -29,18 +62,114 @@ interface StoreActions {
   /** フィルター済み記事一覧を取得 */
   getFilteredArticles: () => Article[];
 
+  /** お気に入りの記事IDを旧ID → 新IDの対応表で移行 */
+  migrateArticleIds: (idMap: Record<string, string>) => void;
+
   /** ストアをリセット（テスト用） */
   reset: () => void;
 }
 
 type Store = AppState & StoreActions;
 
+// IndexedDB からの復元・移行が済んだか（済むまではお気に入りを localStorage にも残す）
+let readingStateSaved = false;
+
+// 復元前の切り替え（全記事の読み込み前は通し番号が確定しないため、復元時に保存する）
+type PendingReadingBit = { kind: ReadingKind; articleId: string; value: boolean };
+let pendingReadingBits: PendingReadingBit[] = [];
+
+// 復元前の切り替えを保持する上限（復元に失敗した場合も増え続けないよう、古いものから捨てる）
+const MAX_PENDING_READING_BITS = 1000;
+
+/**
+ * 1件の状態を IndexedDB に保存（通し番号が分からない記事・IndexedDB がない環境では何もしない）
+ */
+function persistReadingBit(articles: Article[], kind: ReadingKind, articleId: string, value: boolean): void {
+  const store = getReadingStateStore();
+  if (!store) {
+    return;
+  }
+  if (!readingStateSaved) {
+    pendingReadingBits.push({ kind, articleId, value });
+    if (pendingReadingBits.length > MAX_PENDING_READING_BITS) {
+      pendingReadingBits.shift();
+    }
+    return;
+  }
+
+  const number = getNumberIndex(articles).get(articleId);
+  if (number === undefined) {
+    return;
+  }
+  writeReadingBit(store, kind, number, value).catch(error => {
+    console.warn('Failed to save reading state:', error);
+  });
+}
+
+/**
+ * 復元前・復元中の切り替えを IndexedDB に保存
+ * 保存中の切り替えも続けて保存し、残りがなくなった時点で返す（呼び出し側は await せずに直接保存へ切り替える）
+ *
+ * @returns 保存した切り替え（通し番号）
+ */
+async function flushPendingReadingBits(
+  store: ChunkStore,
+  getArticles: () => Article[]
+): Promise<Array<{ kind: ReadingKind; number: number; value: boolean }>> {
+  const flushed: Array<{ kind: ReadingKind; number: number; value: boolean }> = [];
+  while (pendingReadingBits.length > 0) {
+    const pending = pendingReadingBits;
+    pendingReadingBits = [];
+    for (const { kind, articleId, value } of pending) {
+      const number = getNumberIndex(getArticles()).get(articleId);
+      if (number === undefined) continue;
+      await writeReadingBit(store, kind, number, value);
+      flushed.push({ kind, number, value });
+    }
+  }
+  return flushed;
+}
+
+/**
+ * 読了履歴・お気に入りを通し番号に変換（通し番号が分からない記事は除く）
+ */
+function toReadingNumbers(articles: Article[], readHistory: ReadHistory[], favorites: Favorite[]): ReadingNumbers {
+  const index = getNumberIndex(articles);
+  const numbersOf = (ids: string[]) => ids
+    .map(id => index.get(id))
+    .filter((number): number is number => number !== undefined)
+    .sort((a, b) => a - b);
+
+  return {
+    read: numbersOf(readHistory.filter(history => history.isRead).map(history => history.articleId)),
+    favorite: numbersOf(favorites.map(favorite => favorite.articleId))
+  };
+}
+
+/**
+ * 通し番号から読了履歴・お気に入りを作成（日時は保存しないため空文字）
+ */
+function fromReadingNumbers(articles: Article[], numbers: ReadingNumbers): Pick<AppState, 'readHistory' | 'favorites'> {
+  const idByNumber = new Map<number, string>();
+  getNumberIndex(articles).forEach((number, id) => idByNumber.set(number, id));
+  const idsOf = (list: number[]) => list
+    .map(number => idByNumber.get(number))
+    .filter((id): id is string => id !== undefined);
+
+  return {
+    readHistory: idsOf(numbers.read).map(articleId => ({ articleId, readAt: '', isRead: true })),
+    favorites: idsOf(numbers.favorite).map(articleId => ({ articleId, favoritedAt: '' }))
+  };
+}
+
 const initialState: AppState = {
   articles: [],
   readHistory: [],
   favorites: [],
   currentArticle: null,
-  categoryFilter: null
+  categoryFilter: null,
+  feedComplete: false,
+  readingStateRestored: false
 };
 
 export const useStore = create<Store>()(
@@ -54,11 +183,25 @@ export const useStore = create<Store>()(
         set({ articles: visibleArticles });
       },
 
+      appendArticles: (articles) => {
+        const { articles: current } = get();
+        const loadedIds = new Set(current.map(article => article.id));
+        const newArticles = articles.filter(article => !article.hidden && !loadedIds.has(article.id));
+        if (newArticles.length > 0) {
+          set({ articles: [...current, ...newArticles] });
+        }
+      },
+
+      setFeedComplete: (complete) => {
+        set({ feedComplete: complete });
+      },
+
       toggleFavorite: (articleId) => {
-        const { favorites } = get();
+        const { favorites, articles } = get();
 
         // 既にお気に入りかチェック
         const isFavorited = favorites.some(f => f.articleId === articleId);
+        persistReadingBit(articles, 'favorite', articleId, !isFavorited);
 
         if (isFavorited) {
           // お気に入りから削除
@@ -83,6 +226,103 @@ export const useStore = create<Store>()(
         return favorites.some(f => f.articleId === articleId);
       },
 
+      toggleRead: (articleId) => {
+        const { readHistory, articles } = get();
+        const isRead = readHistory.some(h => h.articleId === articleId && h.isRead);
+        persistReadingBit(articles, 'read', articleId, !isRead);
+
+        if (isRead) {
+          set({
+            readHistory: readHistory.filter(h => h.articleId !== articleId)
+          });
+        } else {
+          const newHistory: ReadHistory = {
+            articleId,
+            readAt: new Date().toISOString(),
+            isRead: true
+          };
+
+          set({
+            readHistory: [...readHistory.filter(h => h.articleId !== articleId), newHistory]
+          });
+        }
+      },
+
+      isRead: (articleId) => {
+        const { readHistory } = get();
+        return readHistory.some(h => h.articleId === articleId && h.isRead);
+      },
+
+      restoreReadingState: async () => {
+        const store = getReadingStateStore();
+        if (!store || readingStateSaved) {
+          // IndexedDB がない環境では localStorage のお気に入りをそのまま使う
+          set({ readingStateRestored: true });
+          return;
+        }
+
+        try {
+          const saved = await loadReadingNumbers(store);
+
+          if (!saved) {
+            // 初回：localStorage に保存されていたお気に入り（ここまでの切り替えを含む）を IndexedDB に移行
+            const { articles, readHistory, favorites } = get();
+            pendingReadingBits = [];
+            await replaceReadingNumbers(store, toReadingNumbers(articles, readHistory, favorites));
+          }
+
+          // 復元前・移行中の切り替えを保存（残りがなくなった時点で直接保存に切り替える）
+          const flushed = await flushPendingReadingBits(store, () => get().articles);
+          readingStateSaved = true;
+
+          if (!saved) {
+            // localStorage からお気に入りを削除（最新の状態で書き直す）
+            set(state => ({ favorites: state.favorites, readingStateRestored: true }));
+            return;
+          }
+
+          // 保存済みの状態に復元前・復元中の切り替えを反映
+          const numbers = { read: new Set(saved.read), favorite: new Set(saved.favorite) };
+          for (const { kind, number, value } of flushed) {
+            if (value) {
+              numbers[kind].add(number);
+            } else {
+              numbers[kind].delete(number);
+            }
+          }
+          set({
+            ...fromReadingNumbers(get().articles, {
+              read: Array.from(numbers.read).sort((a, b) => a - b),
+              favorite: Array.from(numbers.favorite).sort((a, b) => a - b)
+            }),
+            readingStateRestored: true
+          });
+        } catch (error) {
+          // 復元前の切り替えはお気に入りとして localStorage に残るため、保存待ちは破棄する
+          pendingReadingBits = [];
+          console.warn('Failed to restore reading state:', error);
+          // localStorage のお気に入りのまま表示を続ける
+          set({ readingStateRestored: true });
+        }
+      },
+
+      exportReadingState: () => {
+        const { articles, readHistory, favorites } = get();
+        return serializeReadingState(toReadingNumbers(articles, readHistory, favorites));
+      },
+
+      importReadingState: async (text) => {
+        // 形式が正しくない場合は例外（状態は変更しない）
+        const numbers = parseReadingState(text);
+        const store = getReadingStateStore();
+        if (store) {
+          await replaceReadingNumbers(store, numbers);
+          readingStateSaved = true;
+          pendingReadingBits = [];
+        }
+        set(fromReadingNumbers(get().articles, numbers));
+      },
+
       getRandomArticle: () => {
         const { articles } = get();
 
@@ -109,7 +349,14 @@ export const useStore = create<Store>()(
         return getArticlesByCategory(articles, categoryFilter);
       },
 
+      migrateArticleIds: (idMap) => {
+        const { favorites } = get();
+        set({ favorites: remapFavoriteIds(favorites, idMap) });
+      },
+
       reset: () => {
+        readingStateSaved = false;
+        pendingReadingBits = [];
         set(initialState);
       }
     }),
@@ -117,7 +364,8 @@ export const useStore = create<Store>()(
       name: 'chuusinjiku-storage', // LocalStorageのキー名
       partialize: (state) => ({
         // 永続化する項目を選択（currentArticle は除外）
-        favorites: state.favorites,
+        // 読了・お気に入りは IndexedDB に保存（移行前・IndexedDB が使えない環境のみお気に入りを localStorage に保存）
+        ...(readingStateSaved ? {} : { favorites: state.favorites }),
         categoryFilter: state.categoryFilter
       })
     }
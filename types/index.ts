@@ -6,7 +6,7 @@
  * 記事データの型
  */
 export interface Article {
-  /** 記事の一意識別子（UUID v4） */
+  /** 記事の一意識別子（UUID v5・GmailメッセージIDから生成し、再実行しても変わらない） */
   id: string;
 
   /** 記事タイトル（30文字以内） */
@@ -40,6 +40,12 @@ export interface Article {
   hidden?: boolean;
 }
 
+/**
+ * 一覧表示用の記事データの型（本文を含まない）
+ * サーバーコンポーネントからクライアントコンポーネントに渡すデータを減らすために使う
+ */
+export type ArticleSummary = Pick<Article, 'id' | 'number' | 'title' | 'category' | 'tags'>;
+
 /**
  * 読了履歴の型
  */
@@ -47,7 +53,7 @@ export interface ReadHistory {
   /** 読了した記事のID */
   articleId: string;
 
-  /** 読了日時（ISO 8601形式） */
+  /** 読了日時（ISO 8601形式・IndexedDB の通し番号ビットセットから復元した場合は空文字） */
   readAt: string;
 
   /** 読了済みフラグ */
@@ -61,7 +67,7 @@ export interface Favorite {
   /** お気に入り登録した記事のID */
   articleId: string;
 
-  /** お気に入り登録日時（ISO 8601形式） */
+  /** お気に入り登録日時（ISO 8601形式・IndexedDB の通し番号ビットセットから復元した場合は空文字） */
   favoritedAt: string;
 }
 
@@ -83,4 +89,10 @@ export interface AppState {
 
   /** カテゴリーフィルター（null = 全て表示） */
   categoryFilter: string | null;
+
+  /** 記事データを全件読み込んだか（段階読み込みの途中は false・保存しない） */
+  feedComplete: boolean;
+
+  /** IndexedDB からの読了・お気に入りの復元が済んだか（保存しない） */
+  readingStateRestored: boolean;
 }